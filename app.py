@@ -1,21 +1,41 @@
 import sys
+import traceback
 
-from settings.settings_file import SettingsManager
+from settings.settings_file import close_settings, get_settings
+from PyQt6.QtGui import QPixmapCache
 from PyQt6.QtWidgets import QApplication
 from ui.main_menu import MainMenu
+from ui.photo_editor.base_photo_editors.pixmap_loader import (
+    PREVIEW_CACHE_LIMIT_KB,
+)
 from utils.debugger import Debugger
+from utils.sk_logger import sk_log
+
+APP_STYLESHEET = "QLabel#photoPreview { border: 1px solid black; }"
+
+
+def log_unhandled_exception(exc_type, exc_value, exc_tb) -> None:
+    """Log uncaught exceptions, including those raised in Qt slots."""
+    sk_log.error(
+        "".join(traceback.format_exception(exc_type, exc_value, exc_tb))
+    )
+    sys.__excepthook__(exc_type, exc_value, exc_tb)
 
 
 def main() -> None:
+    sys.excepthook = log_unhandled_exception
     try:
         debugger = Debugger()
         debugger.debug_mode_check()
-        settings = SettingsManager()
-        settings.initialize_settings()
+        get_settings()
         app = QApplication(sys.argv)
+        app.setStyleSheet(APP_STYLESHEET)
+        QPixmapCache.setCacheLimit(PREVIEW_CACHE_LIMIT_KB)
         window = MainMenu()
         window.show()
-        sys.exit(app.exec())
+        exit_code = app.exec()
+        close_settings()
+        sys.exit(exit_code)
     except Exception as e:
         print(e)
         raise e
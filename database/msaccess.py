@@ -1,15 +1,20 @@
 import os
 import pyodbc
 
-from settings.settings_file import SettingsManager
+from collections import OrderedDict
+
+from settings.settings_file import get_settings
 from utils.entree import Entree
 from utils.sk_logger import sk_log
 
+PREPARED_CURSOR_LIMIT = 128
+FETCH_ARRAYSIZE = 1000
+
 
 class MSAccessDB:
     def __init__(self):
         self.meal_time = Entree()
-        settings = SettingsManager()
+        settings = get_settings()
         self.tew9_core_path = settings.get_value("tew9_core_path")
         self.tew9_game_database_name = settings.get_value(
             "tew9_game_database_name"
@@ -34,6 +39,7 @@ class MSAccessDB:
 
         self.dinner_time = self.meal_time.whats_for_dinner()
         self.connection = None
+        self._prepared: "OrderedDict[str, pyodbc.Cursor]" = OrderedDict()
 
     def connect(self):
         try:
@@ -69,6 +75,10 @@ class MSAccessDB:
         sk_log.debug(f"Updating data with query: {query}")
         self._execute_non_select_query(query, params)
 
+    def update_many(self, query, params_list):
+        sk_log.debug(f"Updating data in batch with query: {query}")
+        self._execute_many_non_select_query(query, params_list)
+
     def delete(self, query, params=None):
         sk_log.debug(f"Deleting data with query: {query}")
         self._execute_non_select_query(query, params)
@@ -77,6 +87,10 @@ class MSAccessDB:
         sk_log.debug(f"Selecting data with query: {query}")
         return self._execute_select_query(query, params)
 
+    def select_tuples(self, query, params=None):
+        sk_log.debug(f"Selecting rows with query: {query}")
+        return self._execute_select_query(query, params, as_tuples=True)
+
     def custom_query(self, query, params=None):
         sk_log.debug(f"Executing custom query: {query}")
         if query.strip().upper().startswith("SELECT"):
@@ -84,8 +98,12 @@ class MSAccessDB:
         else:
             self._execute_non_select_query(query, params)
 
-    def _execute_select_query(self, query, params=None):
-        """Executes a SELECT query and returns the results."""
+    def _execute_select_query(self, query, params=None, as_tuples=False):
+        """Executes a SELECT query and returns the results.
+
+        Rows are dicts keyed by column name, or the cursor's own tuple-like
+        rows when as_tuples is set.
+        """
         sk_log.debug(f"MS Access executing SELECT query: {query}")
         if not self.connection:
             raise ConnectionError(
@@ -93,23 +111,54 @@ class MSAccessDB:
                 "Call connect() first."
             )
 
-        cursor = self.connection.cursor()
+        cursor = self._prepared_cursor(query)
         try:
             if params:
                 cursor.execute(query, params)
             else:
                 cursor.execute(query)
 
-            result = cursor.fetchall()
             columns = [column[0] for column in cursor.description]
-            sk_log.debug(f"MS Access SELECT query result: {result}")
-            return [dict(zip(columns, row)) for row in result]
+            result = []
+            while rows := cursor.fetchmany():
+                if as_tuples:
+                    result.extend(rows)
+                else:
+                    result.extend(dict(zip(columns, row)) for row in rows)
+            sk_log.debug(f"MS Access SELECT query returned {len(result)} rows")
+            return result
         except pyodbc.Error as e:
+            self._discard_prepared_cursor(query)
             sk_log.error(f"Error executing MS Access SELECT query: {e}")
             raise
-        finally:
-            cursor.close()
-            sk_log.debug("MS Access connection closed.")
+
+    def _prepared_cursor(self, query):
+        """Returns the cursor kept for a SELECT, creating it on first use.
+
+        pyodbc skips re-preparing a statement when a cursor executes the
+        same SQL text again, so each distinct SELECT keeps its own cursor.
+        The least recently used cursor is closed past the limit.
+        """
+        cursor = self._prepared.get(query)
+        if cursor is not None:
+            self._prepared.move_to_end(query)
+            return cursor
+        cursor = self.connection.cursor()
+        cursor.arraysize = FETCH_ARRAYSIZE
+        self._prepared[query] = cursor
+        if len(self._prepared) > PREPARED_CURSOR_LIMIT:
+            _, stale_cursor = self._prepared.popitem(last=False)
+            stale_cursor.close()
+        return cursor
+
+    def _discard_prepared_cursor(self, query):
+        """Closes and forgets the cursor kept for a SELECT."""
+        cursor = self._prepared.pop(query, None)
+        if cursor is not None:
+            try:
+                cursor.close()
+            except pyodbc.Error:
+                pass
 
     def _execute_non_select_query(self, query, params=None):
         """Executes a non-SELECT query (e.g., CREATE, INSERT, UPDATE, DELETE)."""
@@ -135,8 +184,34 @@ class MSAccessDB:
             cursor.close()
             sk_log.debug("MS Access connection closed.")
 
+    def _execute_many_non_select_query(self, query, params_list):
+        """Executes a non-SELECT query for each parameter set and commits once."""
+        if not self.connection:
+            raise ConnectionError(
+                "MS Access database connection is not established. "
+                "Call connect() first."
+            )
+
+        cursor = self.connection.cursor()
+        try:
+            cursor.executemany(query, params_list)
+            self.connection.commit()
+            sk_log.debug("MS Access batch query executed successfully.")
+        except pyodbc.Error as e:
+            self.connection.rollback()
+            sk_log.error(f"Error executing MS Access batch query: {e}")
+            raise
+        finally:
+            cursor.close()
+
     def close(self):
         """Closes the database connection."""
+        while self._prepared:
+            _, cursor = self._prepared.popitem()
+            try:
+                cursor.close()
+            except pyodbc.Error:
+                pass
         if self.connection:
             self.connection.close()
             self.connection = None
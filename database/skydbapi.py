@@ -1,11 +1,11 @@
 import requests
-from settings.settings_file import SettingsManager
+from settings.settings_file import get_settings
 from utils.sk_logger import sk_log
 
 
 class SkyDBAPI:
     def __init__(self):
-        settings = SettingsManager()
+        settings = get_settings()
         self.api_url = settings.get_value("skydb_api_server")
         self.api_port = settings.get_value("skydb_api_port")
         self.api_ssl = settings.get_value("skydb_api_ssl")
@@ -34,6 +34,11 @@ class SkyDBAPI:
         sk_log.debug(f"Updating data with query: {query}")
         self._execute_non_select_query(query, params)
 
+    def update_many(self, query, params_list):
+        sk_log.debug(f"Updating data in batch with query: {query}")
+        for params in params_list:
+            self._execute_non_select_query(query, params)
+
     def delete(self, query, params=None):
         sk_log.debug(f"Deleting data with query: {query}")
         self._execute_non_select_query(query, params)
@@ -1,14 +1,166 @@
+import atexit
+import queue
 import sqlite3
+import threading
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from functools import lru_cache
+from itertools import chain, islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+CONNECTION_PRAGMAS: Dict[str, Any] = {
+    "synchronous": "NORMAL",
+    "cache_size": -65536,
+    "temp_store": "MEMORY",
+    "mmap_size": 268435456,
+}
+BULK_LOAD_PRAGMAS: Dict[str, Any] = {
+    "cache_size": -262144,
+    "temp_store": "MEMORY",
+    "synchronous": "OFF",
+}
+READ_POOL_SIZE = 4
+STATEMENT_CACHE_SIZE = 256
+
+
+class _ConnectionPool:
+    """Process-wide connections for one database file.
+
+    Writes share a single read-write connection so they stay serialized, as
+    SQLite requires. The writer is handed to several threads, so callers
+    hold write_lock while they use it. transaction_depth counts the open
+    transaction() blocks on the writer, so every SQLiteDatabase sharing it
+    knows to leave the commit to the outermost block. Reads check out
+    read-only connections, which WAL lets run alongside the writer.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        self._writer: Optional[sqlite3.Connection] = None
+        self._readers: "queue.LifoQueue[sqlite3.Connection]" = (
+            queue.LifoQueue(maxsize=READ_POOL_SIZE)
+        )
+        self._lock = threading.Lock()
+        self.write_lock = threading.RLock()
+        self.transaction_depth = 0
+
+    def _connect(self, read_only: bool) -> sqlite3.Connection:
+        if read_only:
+            conn = sqlite3.connect(
+                f"{self.db_path.as_uri()}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+                cached_statements=STATEMENT_CACHE_SIZE,
+            )
+        else:
+            conn = sqlite3.connect(
+                self.db_path,
+                check_same_thread=False,
+                cached_statements=STATEMENT_CACHE_SIZE,
+            )
+            conn.execute("PRAGMA journal_mode = WAL")
+        conn.row_factory = sqlite3.Row
+        for pragma, value in CONNECTION_PRAGMAS.items():
+            conn.execute(f"PRAGMA {pragma} = {value}")
+        return conn
+
+    def _acquire_writer(self) -> sqlite3.Connection:
+        with self._lock:
+            if self._writer is None:
+                self._writer = self._connect(read_only=False)
+            return self._writer
+
+    def acquire(self, read_only: bool = False) -> sqlite3.Connection:
+        """Check out a connection, opening one if none is free."""
+        writer = self._acquire_writer()
+        if not read_only:
+            return writer
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            return self._connect(read_only=True)
+        except sqlite3.Error:
+            return writer
+
+    def is_writer(self, conn: sqlite3.Connection) -> bool:
+        """Whether conn is the shared read-write connection."""
+        return conn is self._writer
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """Return a connection, closing surplus read-only connections."""
+        if conn is self._writer:
+            return
+        try:
+            self._readers.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+
+_pools: Dict[Path, _ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def _get_pool(db_path: Path) -> _ConnectionPool:
+    pool_key = db_path.resolve()
+    with _pools_lock:
+        pool = _pools.get(pool_key)
+        if pool is None:
+            pool = _ConnectionPool(pool_key)
+            _pools[pool_key] = pool
+        return pool
+
+
+def close_all_connections() -> None:
+    """Close every pooled SQLite connection, e.g. at shutdown."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(close_all_connections)
+
+
+@lru_cache(maxsize=64)
+def _insert_sql(table: str, columns: Tuple[str, ...]) -> str:
+    placeholders = ", ".join("?" * len(columns))
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
 
 
 class SQLiteDatabase:
-    def __init__(self, db_path: Optional[str] = None) -> None:
+    def __init__(
+        self, db_path: Optional[str] = None, read_only: bool = False
+    ) -> None:
         """Initialize SQLite database connection.
 
         Args:
             db_path: Path to the SQLite database file. If None, uses configured path.
+            read_only: Check out a pooled read-only connection instead of the
+                shared read-write one.
         """
         from database.sqlite_path import get_db_path
 
@@ -16,10 +168,12 @@ class SQLiteDatabase:
             configured_path = get_db_path()
             if configured_path is None:
                 raise ValueError("Database path not configured")
-            self.db_path = configured_path
+            self.db_path = Path(configured_path)
         else:
             self.db_path = Path(db_path)
 
+        self.read_only = read_only
+        self._pool = _get_pool(self.db_path)
         self.conn: Optional[sqlite3.Connection] = None
         self._logger = None
         self._init_connection()
@@ -47,15 +201,29 @@ class SQLiteDatabase:
         return self._logger
 
     def _init_connection(self) -> None:
-        """Initialize database connection."""
+        """Check out a connection from the pool."""
         try:
-            self.conn = sqlite3.connect(self.db_path)
-            self.conn.row_factory = sqlite3.Row
+            self.conn = self._pool.acquire(self.read_only)
             self.lazy_sk_log.debug(f"Connected to database: {self.db_path}")
         except sqlite3.Error as e:
             self.lazy_sk_log.error(f"Failed to connect to database: {e}")
             raise
 
+    def writer_lock(self) -> AbstractContextManager:
+        """Check out a connection and return the lock that guards it.
+
+        Pooled readers belong to this instance alone, so they need no lock.
+        The shared writer is serialized across threads with the pool's
+        write lock. Hold it across several calls that must not be split by
+        other threads' writes, such as a script that opens a transaction
+        and the statement that commits it.
+        """
+        if not self.conn:
+            self._init_connection()
+        if self._pool.is_writer(self.conn):
+            return self._pool.write_lock
+        return nullcontext()
+
     def _check_table_exists(self, table_name: str) -> bool:
         """Check if a table exists."""
         try:
@@ -96,11 +264,10 @@ class SQLiteDatabase:
             List of query results
         """
         try:
-            if not self.conn:
-                self._init_connection()
-            cursor = self.conn.cursor()
-            cursor.execute(query, params)
-            return cursor.fetchall()
+            with self.writer_lock():
+                cursor = self.conn.cursor()
+                cursor.execute(query, params)
+                return cursor.fetchall()
         except sqlite3.Error as e:
             self.lazy_sk_log.error(f"Query execution failed: {e}")
             self.lazy_sk_log.error(f"Query: {query}")
@@ -114,11 +281,10 @@ class SQLiteDatabase:
             params: Query parameters
         """
         try:
-            if not self.conn:
-                self._init_connection()
-            cursor = self.conn.cursor()
-            cursor.execute(query, params)
-            self.conn.commit()
+            with self.writer_lock():
+                cursor = self.conn.cursor()
+                cursor.execute(query, params)
+                self._commit()
         except sqlite3.Error as e:
             self.lazy_sk_log.error(f"Write operation failed: {e}")
             self.lazy_sk_log.error(f"Query: {query}")
@@ -132,16 +298,35 @@ class SQLiteDatabase:
             params_list: List of parameter tuples
         """
         try:
-            if not self.conn:
-                self._init_connection()
-            cursor = self.conn.cursor()
-            cursor.executemany(query, params_list)
-            self.conn.commit()
+            with self.writer_lock():
+                cursor = self.conn.cursor()
+                cursor.executemany(query, params_list)
+                self._commit()
         except sqlite3.Error as e:
             self.lazy_sk_log.error(f"Batch operation failed: {e}")
             self.lazy_sk_log.error(f"Query: {query}")
             raise
 
+    def execute_script(self, script: str) -> None:
+        """Execute several SQL statements in one call without committing.
+
+        A script that opens a transaction with BEGIN leaves it open on the
+        shared writer. The caller must hold writer_lock() from before the
+        script until its COMMIT or rollback, or other threads' writes will
+        commit the half-finished transaction.
+
+        Args:
+            script: Semicolon-separated SQL statements
+        """
+        try:
+            with self.writer_lock():
+                self.conn.executescript(script)
+        except sqlite3.Error as e:
+            self.rollback()
+            self.lazy_sk_log.error(f"Script execution failed: {e}")
+            self.lazy_sk_log.error(f"Script: {script}")
+            raise
+
     def create_table(self, table_name: str, columns: Dict[str, str]) -> None:
         """Create a new table.
 
@@ -158,6 +343,22 @@ class SQLiteDatabase:
             self.lazy_sk_log.error(f"Failed to create table {table_name}: {e}")
             raise
 
+    @staticmethod
+    def prepare_insert(table: str, columns: Tuple[str, ...]) -> str:
+        """Get the INSERT statement for a table and column list.
+
+        Statements are built once per table and column list and then
+        reused, so the connection's statement cache sees identical SQL.
+
+        Args:
+            table: Table name
+            columns: Column names, in the order values will be bound
+
+        Returns:
+            Parameterized INSERT statement
+        """
+        return _insert_sql(table, columns)
+
     def insert(self, table: str, data: Dict[str, Any]) -> None:
         """Insert a single row into a table.
 
@@ -165,15 +366,139 @@ class SQLiteDatabase:
             table: Table name
             data: Dictionary of column names and values
         """
-        columns = ", ".join(data.keys())
-        placeholders = ", ".join("?" * len(data))
-        query = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+        query = self.prepare_insert(table, tuple(data))
         try:
             self.execute_write(query, tuple(data.values()))
         except sqlite3.Error as e:
             self.lazy_sk_log.error(f"Insert operation failed: {e}")
             raise
 
+    def insert_many(
+        self,
+        table: str,
+        columns: Sequence[str],
+        rows: Iterable[Sequence[Any]],
+        chunk: int = 1000,
+        rows_per_statement: int = 1,
+    ) -> None:
+        """Insert many rows into a table with one prepared statement.
+
+        Args:
+            table: Table name
+            columns: Column names, in the order values appear in each row
+            rows: Iterable of row value sequences
+            chunk: Number of rows handed to executemany at a time
+            rows_per_statement: Rows packed into each multi-row VALUES
+                statement; leftover rows in a chunk go in one at a time
+        """
+        single_query = self.prepare_insert(table, tuple(columns))
+        head, values, placeholders = single_query.rpartition(" VALUES ")
+        multi_query = (
+            head + values + ", ".join([placeholders] * rows_per_statement)
+        )
+        with self.writer_lock():
+            try:
+                cursor = self.conn.cursor()
+                rows = iter(rows)
+                while batch := list(islice(rows, chunk)):
+                    packed = len(batch) - len(batch) % rows_per_statement
+                    if rows_per_statement > 1 and packed:
+                        cursor.executemany(
+                            multi_query,
+                            (
+                                tuple(
+                                    chain.from_iterable(
+                                        batch[i : i + rows_per_statement]
+                                    )
+                                )
+                                for i in range(0, packed, rows_per_statement)
+                            ),
+                        )
+                        batch = batch[packed:]
+                    if batch:
+                        cursor.executemany(single_query, batch)
+                self._commit()
+            except Exception as e:
+                self.rollback()
+                self.lazy_sk_log.error(f"Batch insert failed: {e}")
+                self.lazy_sk_log.error(f"Query: {single_query}")
+                raise
+
+    @contextmanager
+    def bulk_load(self) -> Iterator["SQLiteDatabase"]:
+        """Temporarily tune the connection for rebuildable bulk inserts.
+
+        Raises the page cache, keeps temp storage in memory and turns off
+        syncing for the duration of the block, then restores the previous
+        values. The block runs as one transaction(), so its rows are
+        committed when it ends and rolled back if it raises. Only use this
+        for tables that can be rebuilt from their source, since a power
+        loss mid-load may lose the written rows.
+        """
+        with self.writer_lock():
+            previous = {
+                pragma: self.execute_query(f"PRAGMA {pragma}")[0][0]
+                for pragma in BULK_LOAD_PRAGMAS
+            }
+            try:
+                for pragma, value in BULK_LOAD_PRAGMAS.items():
+                    self.conn.execute(f"PRAGMA {pragma} = {value}")
+                with self.transaction():
+                    yield self
+            finally:
+                for pragma, value in previous.items():
+                    self.conn.execute(f"PRAGMA {pragma} = {value}")
+                self.lazy_sk_log.debug("Bulk load pragmas restored")
+
+    @contextmanager
+    def transaction(self) -> Iterator["SQLiteDatabase"]:
+        """Group writes into one BEGIN IMMEDIATE ... COMMIT.
+
+        Writes made inside the block skip their own commit, so the whole
+        block costs one sync. Any exception rolls the block back. The
+        writer is shared, so writes and nested blocks from any instance on
+        this thread join the outer transaction, and other threads wait
+        until it ends.
+        """
+        with self.writer_lock():
+            if not self._pool.is_writer(self.conn):
+                raise ValueError("transaction() needs a read-write connection")
+            pool = self._pool
+            if pool.transaction_depth:
+                pool.transaction_depth += 1
+                try:
+                    yield self
+                finally:
+                    pool.transaction_depth -= 1
+                return
+            if self.conn.in_transaction:
+                # Earlier writes left an implicit transaction open; commit
+                # them, as their own next write would have.
+                self.conn.commit()
+            self.conn.execute("BEGIN IMMEDIATE")
+            pool.transaction_depth = 1
+            try:
+                yield self
+            except BaseException:
+                self.conn.rollback()
+                self.lazy_sk_log.debug("Database transaction rolled back")
+                raise
+            else:
+                self.conn.commit()
+            finally:
+                pool.transaction_depth = 0
+
+    def _in_transaction(self) -> bool:
+        """Whether a transaction() block is open on this connection."""
+        return self._pool.transaction_depth > 0 and self._pool.is_writer(
+            self.conn
+        )
+
+    def _commit(self) -> None:
+        """Commit, unless the write is part of an open transaction()."""
+        if not self._in_transaction():
+            self.conn.commit()
+
     def get_row_count(self, table: str) -> int:
         """Get the number of rows in a table.
 
@@ -191,22 +516,50 @@ class SQLiteDatabase:
             raise
 
     def close(self) -> None:
-        """Close the database connection."""
+        """Return the database connection to the pool."""
         if self.conn:
-            self.conn.close()
+            self._pool.release(self.conn)
             self.conn = None
-            self.lazy_sk_log.debug("Database connection closed")
+            self.lazy_sk_log.debug("Database connection released")
 
     def commit(self) -> None:
-        """Commit pending database transactions."""
+        """Commit pending database transactions.
+
+        Inside an open transaction() this does nothing; the block commits
+        when it ends.
+        """
         try:
-            if not self.conn:
-                self._init_connection()
-            self.conn.commit()
+            with self.writer_lock():
+                self._commit()
         except sqlite3.Error as e:
             self.lazy_sk_log.error(f"Commit failed: {e}")
             raise
 
+    def rollback(self) -> None:
+        """Roll back any pending database transaction.
+
+        Inside an open transaction() this does nothing; the block rolls
+        back when the error reaches it.
+        """
+        if not self.conn:
+            return
+        with self.writer_lock():
+            if self.conn.in_transaction and not self._in_transaction():
+                self.conn.rollback()
+                self.lazy_sk_log.debug("Database transaction rolled back")
+
+    @staticmethod
+    def as_dicts(rows: Iterable[sqlite3.Row]) -> List[Dict[str, Any]]:
+        """Convert query result rows to plain dictionaries.
+
+        Args:
+            rows: Rows returned by execute_query
+
+        Returns:
+            List of dictionaries keyed by column name
+        """
+        return list(map(dict, rows))
+
     def __enter__(self) -> "SQLiteDatabase":
         """Context manager entry."""
         return self
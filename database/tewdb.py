@@ -1,14 +1,115 @@
-from typing import Dict, List, Optional, Union
+import re
+import threading
+
+from collections import OrderedDict
+from functools import lru_cache
+from operator import itemgetter
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from database.msaccess import MSAccessDB
 from database.skydbapi import SkyDBAPI
-from settings.settings_file import SettingsManager
+from settings.settings_file import get_settings
 from utils.sk_logger import sk_log
 
+IN_LIST_CHUNK = 900
+RESULT_CACHE_SIZE = 64
+
+_table_columns: Dict[str, FrozenSet[str]] = {}
+_TABLE_NAME_RE = re.compile(
+    r"\b(?:FROM|JOIN|UPDATE|INTO|TABLE)\s+\[?(\w+)\]?", re.IGNORECASE
+)
+_table_versions: Dict[str, int] = {}
+_CacheKey = Tuple[str, Tuple]
+_result_cache: "OrderedDict[_CacheKey, Tuple[Tuple[int, ...], List]]" = (
+    OrderedDict()
+)
+_grouped_cache: Dict[Tuple[str, str], Tuple[Tuple[int, ...], Dict]] = {}
+_result_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=256)
+def _tables_in(query: str) -> Tuple[str, ...]:
+    """Get the lower-cased, sorted names of the tables a statement touches."""
+    return tuple(
+        sorted({name.lower() for name in _TABLE_NAME_RE.findall(query)})
+    )
+
+
+def _table_snapshot(tables: Tuple[str, ...]) -> Tuple[int, ...]:
+    return tuple(_table_versions.get(table, 0) for table in tables)
+
+
+def _invalidate_tables(query: str) -> None:
+    """Drop cached results for the tables a write statement touches.
+
+    Statements whose tables cannot be read from the SQL clear the whole
+    result cache.
+    """
+    tables = _tables_in(query)
+    with _result_cache_lock:
+        if not tables:
+            _result_cache.clear()
+            _grouped_cache.clear()
+            return
+        for table in tables:
+            _table_versions[table] = _table_versions.get(table, 0) + 1
+        touched = set(tables)
+        stale_keys = [
+            key
+            for key in _result_cache
+            if touched.intersection(_tables_in(key[0]))
+        ]
+        for key in stale_keys:
+            del _result_cache[key]
+
+
+def clear_result_cache() -> None:
+    """Forget every cached SELECT result and grouped index."""
+    with _result_cache_lock:
+        _result_cache.clear()
+        _grouped_cache.clear()
+
+
+def row_value(row: Dict[str, Any], column: str) -> Any:
+    """Read a column from a result row, ignoring the column name's case."""
+    if column in row:
+        return row[column]
+    lowered = column.lower()
+    for key, value in row.items():
+        if key.lower() == lowered:
+            return value
+    raise KeyError(column)
+
+
+def column_values(rows: List[Dict[str, Any]], column: str) -> List[Any]:
+    """Project one column out of result rows.
+
+    The row key is matched case-insensitively once, against the first row,
+    and the projection itself runs through operator.itemgetter.
+    """
+    if not rows:
+        return []
+    key = column
+    if key not in rows[0]:
+        lowered = column.lower()
+        key = next(
+            (name for name in rows[0] if name.lower() == lowered), column
+        )
+    return list(map(itemgetter(key), rows))
+
 
 class TEWDB:
     def __init__(self) -> None:
-        self.settings = SettingsManager()
+        self.settings = get_settings()
         self.db_mode = self.settings.get_value("database_mode")
         self.db_instance: Union[MSAccessDB, SkyDBAPI, None] = None
         self._initialize_db()
@@ -32,34 +133,197 @@ class TEWDB:
     def create(self, query: str, params: Optional[List] = None) -> None:
         """Execute a CREATE query."""
         sk_log.debug(f"TEWDB executing CREATE query via {self.db_mode}")
-        self.db_instance.create(query, params)
+        try:
+            self.db_instance.create(query, params)
+        finally:
+            _invalidate_tables(query)
 
     def insert(self, query: str, params: Optional[List] = None) -> None:
         """Execute an INSERT query."""
         sk_log.debug(f"TEWDB executing INSERT query via {self.db_mode}")
-        self.db_instance.insert(query, params)
+        try:
+            self.db_instance.insert(query, params)
+        finally:
+            _invalidate_tables(query)
 
     def update(self, query: str, params: Optional[List] = None) -> None:
         """Execute an UPDATE query."""
         sk_log.debug(f"TEWDB executing UPDATE query via {self.db_mode}")
-        self.db_instance.update(query, params)
+        try:
+            self.db_instance.update(query, params)
+        finally:
+            _invalidate_tables(query)
+
+    def update_many(self, query: str, params_list: List[tuple]) -> None:
+        """Execute an UPDATE query once per parameter set in one batch."""
+        sk_log.debug(f"TEWDB executing batch UPDATE query via {self.db_mode}")
+        try:
+            self.db_instance.update_many(query, params_list)
+        finally:
+            _invalidate_tables(query)
 
     def delete(self, query: str, params: Optional[List] = None) -> None:
         """Execute a DELETE query."""
         sk_log.debug(f"TEWDB executing DELETE query via {self.db_mode}")
-        self.db_instance.delete(query, params)
+        try:
+            self.db_instance.delete(query, params)
+        finally:
+            _invalidate_tables(query)
 
     def select(self, query: str, params: Optional[List] = None) -> List[Dict]:
         """Execute a SELECT query and return results."""
         sk_log.debug(f"TEWDB executing SELECT query via {self.db_mode}")
         return self.db_instance.select(query, params)
 
+    def select_tuples(
+        self, query: str, params: Optional[List] = None
+    ) -> List[Tuple]:
+        """Execute a SELECT query and return rows as tuples in column order.
+
+        MS Access hands back its cursor rows as they are, skipping the
+        per-row dict; other backends have their dict rows flattened.
+        """
+        sk_log.debug(f"TEWDB executing tuple SELECT query via {self.db_mode}")
+        if hasattr(self.db_instance, "select_tuples"):
+            return self.db_instance.select_tuples(query, params)
+        return [
+            tuple(row.values())
+            for row in self.db_instance.select(query, params)
+        ]
+
+    def select_cached(
+        self, query: str, params: Optional[List] = None
+    ) -> List[Dict]:
+        """Execute a SELECT query, reusing the result until its tables change.
+
+        Results are kept per query and parameters, tagged with the version
+        of every table the query reads. Writes made through TEWDB bump those
+        versions, so only results from the written tables are dropped.
+        Queries whose tables cannot be read from the SQL are not cached.
+        """
+        tables = _tables_in(query)
+        if not tables:
+            return self.select(query, params)
+        key = (query, tuple(params or ()))
+        with _result_cache_lock:
+            snapshot = _table_snapshot(tables)
+            cached = _result_cache.get(key)
+            if cached is not None and cached[0] == snapshot:
+                _result_cache.move_to_end(key)
+                return list(cached[1])
+        rows = self.select(query, params)
+        with _result_cache_lock:
+            _result_cache[key] = (snapshot, rows)
+            _result_cache.move_to_end(key)
+            while len(_result_cache) > RESULT_CACHE_SIZE:
+                _result_cache.popitem(last=False)
+        return list(rows)
+
+    def select_grouped(
+        self, query: str, key_column: str
+    ) -> Dict[Any, List[Dict]]:
+        """Run a SELECT once and index its rows by a column's value.
+
+        The index is kept until a write through TEWDB touches one of the
+        query's tables, so repeated foreign-key lookups become dict reads.
+
+        Returns:
+            Lists of rows keyed by their key column value.
+        """
+        tables = _tables_in(query)
+        key = (query, key_column)
+        with _result_cache_lock:
+            snapshot = _table_snapshot(tables)
+            cached = _grouped_cache.get(key)
+            if tables and cached is not None and cached[0] == snapshot:
+                return cached[1]
+        grouped: Dict[Any, List[Dict]] = {}
+        for row in self.select(query):
+            grouped.setdefault(row_value(row, key_column), []).append(row)
+        if tables:
+            with _result_cache_lock:
+                _grouped_cache[key] = (snapshot, grouped)
+        return grouped
+
+    def select_by_keys(
+        self,
+        table: str,
+        key_column: str,
+        keys: Iterable[Any],
+        columns: str = "*",
+    ) -> Dict[Any, Dict]:
+        """Fetch the rows matching many key values with batched IN lists.
+
+        Keys are deduplicated and sent IN_LIST_CHUNK at a time, so N lookups
+        cost one round trip per chunk instead of one per key.
+
+        Returns:
+            The matching rows keyed by their key column value.
+        """
+        keys = list(dict.fromkeys(keys))
+        rows_by_key: Dict[Any, Dict] = {}
+        for start in range(0, len(keys), IN_LIST_CHUNK):
+            chunk = keys[start : start + IN_LIST_CHUNK]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = self.select(
+                f"SELECT {columns} FROM {table} "
+                f"WHERE {key_column} IN ({placeholders})",
+                chunk,
+            )
+            for row in rows:
+                rows_by_key[row_value(row, key_column)] = row
+        return rows_by_key
+
     def custom_query(
         self, query: str, params: Optional[List] = None
     ) -> Optional[List[Dict]]:
         """Execute a custom query and return results if it's a SELECT query."""
         sk_log.debug(f"TEWDB executing custom query via {self.db_mode}")
-        return self.db_instance.custom_query(query, params)
+        try:
+            return self.db_instance.custom_query(query, params)
+        finally:
+            if not query.strip().upper().startswith("SELECT"):
+                _invalidate_tables(query)
+
+    def table_columns(self, table: str) -> FrozenSet[str]:
+        """Get the lower-cased column names of a game table.
+
+        The names are read from the first row of the table once per process.
+        An empty table yields an empty set and is looked up again next time.
+        """
+        columns = _table_columns.get(table)
+        if columns is None:
+            rows = self.select(f"SELECT TOP 1 * FROM {table}")
+            columns = frozenset(
+                key.lower() for key in (rows[0] if rows else ())
+            )
+            if columns:
+                _table_columns[table] = columns
+        return columns
+
+    def validate_columns(
+        self, table: str, columns: Iterable[str]
+    ) -> Tuple[str, ...]:
+        """Check column names against a game table before they reach SQL.
+
+        Returns:
+            The column names as a tuple, suitable as a cache key.
+
+        Raises:
+            ValueError: If a column is unknown, or if the table is empty and
+                a column is not a plain identifier.
+        """
+        columns = tuple(columns)
+        known = self.table_columns(table)
+        for column in columns:
+            if known:
+                is_valid = column.lower() in known
+            else:
+                is_valid = column.isidentifier()
+            if not is_valid:
+                sk_log.error(f"TEWDB rejected column {column!r} for {table}")
+                raise ValueError(f"Invalid column for {table}: {column}")
+        return columns
 
     def close(self) -> None:
         """Close the database connection if applicable."""
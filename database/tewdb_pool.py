@@ -0,0 +1,81 @@
+import atexit
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Sequence, TypeVar
+
+from database.tewdb import TEWDB, clear_result_cache
+from utils.sk_logger import sk_log
+
+TEWDB_POOL_SIZE = 4
+
+_idle: "queue.LifoQueue[TEWDB]" = queue.LifoQueue(maxsize=TEWDB_POOL_SIZE)
+_BULK_EXECUTOR = ThreadPoolExecutor(
+    max_workers=TEWDB_POOL_SIZE, thread_name_prefix="tewdb-bulk-fetch"
+)
+
+T = TypeVar("T")
+
+
+def acquire() -> TEWDB:
+    """Check out an open game database handle, opening one if none is idle.
+
+    Returns:
+        TEWDB: A connected game database handle.
+    """
+    try:
+        return _idle.get_nowait()
+    except queue.Empty:
+        return TEWDB()
+
+
+def release(tewdb: TEWDB) -> None:
+    """Return a game database handle, closing it if the pool is full.
+
+    Args:
+        tewdb (TEWDB): A handle previously returned by acquire().
+    """
+    try:
+        _idle.put_nowait(tewdb)
+        return
+    except queue.Full:
+        pass
+    tewdb.close()
+
+
+def bulk_fetch(calls: Sequence[Callable[[], T]]) -> List[T]:
+    """Run independent reads in parallel, at most one per pooled handle.
+
+    Each call should check out its own handle, for example by opening one
+    of the table *Functions context managers.
+
+    Args:
+        calls (Sequence[Callable[[], T]]): The reads to run.
+
+    Returns:
+        List[T]: The results, in the same order as calls.
+    """
+    if len(calls) < 2:
+        return [call() for call in calls]
+    futures = [_BULK_EXECUTOR.submit(call) for call in calls]
+    return [future.result() for future in futures]
+
+
+def close_all() -> None:
+    """Close every idle game database handle and drop cached results.
+
+    Call this after the database settings change so the next acquire()
+    connects with the new values.
+    """
+    clear_result_cache()
+    while True:
+        try:
+            tewdb = _idle.get_nowait()
+        except queue.Empty:
+            break
+        try:
+            tewdb.close()
+        except Exception as e:
+            sk_log.warning(f"TEWDB pool close error: {e}")
+
+
+atexit.register(close_all)
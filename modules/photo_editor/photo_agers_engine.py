@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import List, Tuple
 
 from database.sqlite import SQLiteDatabase
-from settings.settings_file import SettingsManager
+from settings.settings_file import get_settings
 from utils.sk_logger import sk_log
 
 
@@ -17,7 +17,7 @@ class PhotoAgersEngine:
             from .photo_worker_engine import PhotoWorkerEngine
 
             self.tewdb = TEWDB()
-            self.settings_manager = SettingsManager()
+            self.settings_manager = get_settings()
             self.photo_cache = PhotoCache()
             self.worker_photo_path = self.photo_cache.fetch_photo_root_path(
                 PictureDirectories.WORKER_FOLDER
@@ -148,11 +148,10 @@ class PhotoAgersEngine:
         try:
             from modules.tables.agers_table import AgersFunctions
 
-            agers_functions = AgersFunctions()
-            ager_record_list = agers_functions.fetch_all_agers_specific_cols(
-                ["UID", "Recordname", "Worker", "Trigger", "Picture"]
-            )
-            return ager_record_list
+            with AgersFunctions() as agers_functions:
+                return agers_functions.fetch_all_agers_specific_cols(
+                    ["UID", "Recordname", "Worker", "Trigger", "Picture"]
+                )
         except Exception as e:
             sk_log.error(
                 f"PhotoAgersEngine _fetch_ager_photo_records_from_db error: {e}"
@@ -176,19 +175,28 @@ class PhotoAgersEngine:
         """Fill the ager photo record cache."""
         try:
             with SQLiteDatabase() as sqlitedb:
-                for ager in ager_record_list:
-                    sqlitedb.insert(
-                        "game_ager_photo_cache",
-                        {
-                            "game_ager_uid": ager["UID"],
-                            "game_ager_recordname": ager["Recordname"],
-                            "game_ager_worker_uid": ager["Worker"],
-                            "game_ager_trigger_age": ager["Trigger"],
-                            "game_ager_photo_file": ager["Picture"],
-                            "game_ager_photo_status": "new",
-                        },
-                    )
-                    sqlitedb.commit()
+                sqlitedb.insert_many(
+                    "game_ager_photo_cache",
+                    (
+                        "game_ager_uid",
+                        "game_ager_recordname",
+                        "game_ager_worker_uid",
+                        "game_ager_trigger_age",
+                        "game_ager_photo_file",
+                        "game_ager_photo_status",
+                    ),
+                    (
+                        (
+                            ager["UID"],
+                            ager["Recordname"],
+                            ager["Worker"],
+                            ager["Trigger"],
+                            ager["Picture"],
+                            "new",
+                        )
+                        for ager in ager_record_list
+                    ),
+                )
         except Exception as e:
             sk_log.error(
                 f"PhotoAgersEngine _fill_ager_photo_record_cache error: {e}"
@@ -269,6 +277,7 @@ class PhotoAgersEngine:
                     {
                         "game_ager_uid": ager_uid,
                         "game_ager_recordname": combined_ager_record,
+                        "game_ager_filename": ager["game_ager_photo_file"],
                     }
                 )
             try:
@@ -369,6 +378,49 @@ class PhotoAgersEngine:
             )
             raise e
 
+    def get_or_rebuild_lists(
+        self,
+    ) -> Tuple[List[dict], List[dict], bool]:
+        """Fetch the ager photo record lists, rebuilding the cache once if
+        needed.
+
+        If the cache cannot be read it is refreshed and read again. If that
+        also fails, the local worker photos are scanned from the directory
+        and no game agers are returned.
+
+        Returns:
+            Tuple[List[dict], List[dict], bool]: The game agers, the local
+            workers, and whether the local workers came from the directory
+            scan alone.
+        """
+        try:
+            try:
+                game_agers, local_workers = (
+                    self.fetch_ager_photo_record_lists()
+                )
+                return game_agers, local_workers, False
+            except Exception as e:
+                sk_log.warning(f"Cache fetch error, attempting rebuild: {e}")
+            try:
+                self.refresh_ager_photo_record_cache()
+                game_agers, local_workers = (
+                    self.fetch_ager_photo_record_lists()
+                )
+                return game_agers, local_workers, False
+            except Exception as refresh_error:
+                sk_log.error(f"Cache rebuild failed: {refresh_error}")
+            try:
+                local_workers = (
+                    self.photo_worker_engine.fetch_worker_photos_from_dir()
+                )
+            except Exception as local_error:
+                sk_log.error(f"Local files fetch failed: {local_error}")
+                local_workers = []
+            return [], local_workers, True
+        except Exception as e:
+            sk_log.error(f"PhotoAgersEngine get_or_rebuild_lists error: {e}")
+            raise e
+
     def fetch_ager_photo_filename_from_cache(self, ager_name: str) -> str:
         """Fetch the ager photo filename from the cache.
 
@@ -409,12 +461,17 @@ class PhotoAgersEngine:
 
     def update_ager_photo_filename(
         self, ager_name: str, new_filename: str, append_gif: bool = False
-    ) -> None:
-        """Update the ager photo filename in the cache."""
+    ) -> str | None:
+        """Update the ager photo filename in the cache.
+
+        Returns:
+            str | None: The filename as stored, or None if the ager name
+            has no UID.
+        """
         try:
             uid_match = re.search(r"\[(\d+)\]", ager_name)
             if not uid_match:
-                return
+                return None
             ager_uid = int(uid_match.group(1))
 
             with SQLiteDatabase() as sqlitedb:
@@ -449,6 +506,7 @@ class PhotoAgersEngine:
                     f"Updated ager UID {ager_uid} with "
                     f"new photo: {updated_filename}"
                 )
+                return updated_filename
         except Exception as e:
             sk_log.error(
                 "PhotoAgersEngine update_ager_photo_filename error: " f"{e}"
@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import List, Tuple
 
 from database.sqlite import SQLiteDatabase
-from settings.settings_file import SettingsManager
+from settings.settings_file import get_settings
 from utils.sk_logger import sk_log
 
 
@@ -17,7 +17,7 @@ class PhotoAltersEngine:
             from .photo_worker_engine import PhotoWorkerEngine
 
             self.tewdb = TEWDB()
-            self.settings_manager = SettingsManager()
+            self.settings_manager = get_settings()
             self.photo_cache = PhotoCache()
             self.worker_photo_path = self.photo_cache.fetch_photo_root_path(
                 PictureDirectories.WORKER_FOLDER
@@ -148,11 +148,10 @@ class PhotoAltersEngine:
         try:
             from modules.tables.alter_table import AlterFunctions
 
-            alter_functions = AlterFunctions()
-            alter_record_list = alter_functions.fetch_all_alters_specific_cols(
-                ["UID", "WorkerUID", "Recordname", "Picture"]
-            )
-            return alter_record_list
+            with AlterFunctions() as alter_functions:
+                return alter_functions.fetch_all_alters_specific_cols(
+                    ["UID", "WorkerUID", "Recordname", "Picture"]
+                )
         except Exception as e:
             sk_log.error(
                 f"PhotoAltersEngine _fetch_alter_photo_records_from_db error: {e}"
@@ -176,18 +175,26 @@ class PhotoAltersEngine:
         """Build the game alter record cache."""
         try:
             with SQLiteDatabase() as sqlitedb:
-                for alter in alter_record_list:
-                    sqlitedb.insert(
-                        "game_alter_photo_cache",
-                        {
-                            "game_alter_alter_uid": alter["UID"],
-                            "game_alter_recordname": alter["Recordname"],
-                            "game_alter_worker_uid": alter["WorkerUID"],
-                            "game_alter_photo_file": alter["Picture"],
-                            "game_alter_photo_status": "new",
-                        },
-                    )
-                    sqlitedb.commit()
+                sqlitedb.insert_many(
+                    "game_alter_photo_cache",
+                    (
+                        "game_alter_alter_uid",
+                        "game_alter_recordname",
+                        "game_alter_worker_uid",
+                        "game_alter_photo_file",
+                        "game_alter_photo_status",
+                    ),
+                    (
+                        (
+                            alter["UID"],
+                            alter["Recordname"],
+                            alter["WorkerUID"],
+                            alter["Picture"],
+                            "new",
+                        )
+                        for alter in alter_record_list
+                    ),
+                )
         except Exception as e:
             sk_log.error(
                 f"PhotoAltersEngine _build_alter_record_photo_cache error: {e}"
@@ -1,14 +1,14 @@
 import os
 from typing import List, Tuple
 
-from settings.settings_file import SettingsManager
+from settings.settings_file import get_settings
 from utils.sk_logger import sk_log
 
 
 class PhotoCache:
     def __init__(self) -> None:
         try:
-            self.settings_manager = SettingsManager()
+            self.settings_manager = get_settings()
 
         except Exception as e:
             sk_log.error(f"PhotoCache __init__ error: {e}")
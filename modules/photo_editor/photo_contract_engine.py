@@ -1,10 +1,10 @@
 import re
 
-from datetime import datetime
-from typing import List, Tuple
+from functools import cached_property
+from typing import List, Optional, Tuple
 
 from database.sqlite import SQLiteDatabase
-from settings.settings_file import SettingsManager
+from settings.settings_file import get_settings
 from utils.sk_logger import sk_log
 
 
@@ -12,23 +12,42 @@ class PhotoContractEngine:
 
     def __init__(self) -> None:
         try:
-            from .picture_directories import PictureDirectories
-            from .photo_cache import PhotoCache
-            from database.tewdb import TEWDB
-            from .photo_worker_engine import PhotoWorkerEngine
-
-            self.tewdb = TEWDB()
-            self.settings_manager = SettingsManager()
-            self.photo_cache = PhotoCache()
-            self.worker_photo_path = self.photo_cache.fetch_photo_root_path(
-                PictureDirectories.WORKER_FOLDER
-            )
-            self.photo_worker_engine = PhotoWorkerEngine()
+            self.settings_manager = get_settings()
 
         except Exception as e:
             sk_log.error(f"PhotoContractEngine __init__ error: {e}")
             raise e
 
+    @cached_property
+    def tewdb(self):
+        """Game database handle, opened on first use."""
+        from database.tewdb import TEWDB
+
+        return TEWDB()
+
+    @cached_property
+    def photo_cache(self):
+        """Photo cache helper, created on first use."""
+        from .photo_cache import PhotoCache
+
+        return PhotoCache()
+
+    @cached_property
+    def worker_photo_path(self) -> str:
+        """Worker photo folder, resolved on first use."""
+        from .picture_directories import PictureDirectories
+
+        return self.photo_cache.fetch_photo_root_path(
+            PictureDirectories.WORKER_FOLDER
+        )
+
+    @cached_property
+    def photo_worker_engine(self):
+        """Worker photo engine, created on first use."""
+        from .photo_worker_engine import PhotoWorkerEngine
+
+        return PhotoWorkerEngine()
+
     def __enter__(self) -> "PhotoContractEngine":
         return self
 
@@ -38,6 +57,9 @@ class PhotoContractEngine:
     def contract_photo_cache_init(self, skip_check: bool = False) -> bool:
         """Initialize the contract photo cache.
 
+        Even with skip_check, the rebuild is skipped while tblContract still
+        matches the fingerprint recorded by the last full build.
+
         Args:
             skip_check: Whether to skip the cache check.
 
@@ -47,16 +69,21 @@ class PhotoContractEngine:
         try:
             cache_check = self._contract_photo_cache_check(skip_check)
             if not cache_check:
+                source_fingerprint = self._source_fingerprint()
+                if self._cache_is_current(source_fingerprint):
+                    sk_log.info(
+                        "Contract photo record cache is current, "
+                        "skipping rebuild"
+                    )
+                    return True
                 self._build_contract_photo_record_cache()
                 self._populate_contract_photo_record_cache()
                 with SQLiteDatabase() as sqlitedb:
                     sqlitedb.insert(
                         "contract_photo_cache_log",
                         {
-                            "timestamp": datetime.now().strftime(
-                                "%Y-%m-%d %H:%M:%S"
-                            ),
                             "status": "initialized",
+                            "source_fingerprint": source_fingerprint,
                         },
                     )
                     sqlitedb.commit()
@@ -117,16 +144,14 @@ class PhotoContractEngine:
                         "contract_photo_cache_log_id": (
                             "INTEGER PRIMARY KEY AUTOINCREMENT"
                         ),
-                        "timestamp": "TEXT",
+                        "timestamp": "TEXT DEFAULT CURRENT_TIMESTAMP",
                         "status": "TEXT",
+                        "source_fingerprint": "TEXT",
                     },
                 )
                 sqlitedb.insert(
                     "contract_photo_cache_log",
                     {
-                        "timestamp": datetime.now().strftime(
-                            "%Y-%m-%d %H:%M:%S"
-                        ),
                         "status": "created",
                     },
                 )
@@ -156,13 +181,10 @@ class PhotoContractEngine:
         try:
             from modules.tables.contract_table import ContractFunctions
 
-            contract_functions = ContractFunctions()
-            contract_record_list = (
-                contract_functions.fetch_all_contracts_specific_cols(
-                    ["UID", "FedUID", "WorkerUID", "Name", "Picture"]
+            with ContractFunctions() as functions:
+                return functions.fetch_all_contracts_specific_cols_as_tuples(
+                    ["UID", "FedUID", "Name", "WorkerUID", "Picture"]
                 )
-            )
-            return contract_record_list
         except Exception as e:
             sk_log.error(
                 f"PhotoContractEngine _fetch_contract_photo_records_from_db error: {e}"
@@ -185,20 +207,22 @@ class PhotoContractEngine:
     ) -> None:
         """Fill the contract photo record cache."""
         try:
-            with SQLiteDatabase() as sqlitedb:
-                for contract in contract_record_list:
-                    sqlitedb.insert(
-                        "game_contract_photo_cache",
-                        {
-                            "game_contract_uid": contract["UID"],
-                            "game_contract_fedid": contract["FedUID"],
-                            "game_contract_recordname": contract["Name"],
-                            "game_contract_worker_uid": contract["WorkerUID"],
-                            "game_contract_photo_file": contract["Picture"],
-                            "game_contract_photo_status": "new",
-                        },
-                    )
-                    sqlitedb.commit()
+            with SQLiteDatabase() as sqlitedb, sqlitedb.bulk_load():
+                sqlitedb.insert_many(
+                    "game_contract_photo_cache",
+                    (
+                        "game_contract_uid",
+                        "game_contract_fedid",
+                        "game_contract_recordname",
+                        "game_contract_worker_uid",
+                        "game_contract_photo_file",
+                        "game_contract_photo_status",
+                    ),
+                    (
+                        (*contract, "new")
+                        for contract in contract_record_list
+                    ),
+                )
         except Exception as e:
             sk_log.error(
                 f"PhotoContractEngine _fill_contract_photo_record_cache error: {e}"
@@ -260,6 +284,51 @@ class PhotoContractEngine:
             )
             return "Unknown"
 
+    @cached_property
+    def _tewdb_supports_qmark(self) -> bool:
+        """Whether the game database accepts ? parameter binding.
+
+        Probed once per engine so a driver that refuses binding costs one
+        failed query instead of one per contract.
+        """
+        try:
+            self.tewdb.select("SELECT 1 FROM tblFed WHERE UID = ?", (1,))
+            return True
+        except Exception as e:
+            sk_log.warning(
+                "FedInitials query failed with proper binding: "
+                f"{e}, using inline UIDs instead"
+            )
+            return False
+
+    def _fetch_fed_initials(self, fed_uid: int) -> str:
+        """Fetch the initials of a fed, or "UNK" if they cannot be found.
+
+        Args:
+            fed_uid (int): The UID of the fed.
+
+        Returns:
+            str: The fed initials.
+        """
+        try:
+            if self._tewdb_supports_qmark:
+                fed_initials = self.tewdb.select(
+                    "SELECT Initials FROM tblFed WHERE UID = ?", (fed_uid,)
+                )
+            else:
+                fed_initials = self.tewdb.select(
+                    f"SELECT Initials FROM tblFed WHERE UID = {int(fed_uid)}"
+                )
+        except Exception as e:
+            sk_log.error(f"FedInitials query failed: {e}, using placeholder")
+            return "UNK"
+        if not fed_initials:
+            sk_log.warning(
+                f"FedInitials not found for FedUID={fed_uid}, using placeholder"
+            )
+            return "UNK"
+        return fed_initials[0]["Initials"]
+
     def fetch_contract_photo_record_cache_lists(
         self,
     ) -> Tuple[List[dict], List[dict]]:
@@ -269,6 +338,8 @@ class PhotoContractEngine:
                 self._fetch_contract_photo_record_cache()
             )
             game_contract_record_list = []
+            append_contract_record = game_contract_record_list.append
+            fed_fragments = {}
             for contract in raw_contract_photo_record_list:
                 contract_uid = contract["game_contract_uid"]
                 contract_fedid = contract["game_contract_fedid"]
@@ -276,41 +347,18 @@ class PhotoContractEngine:
                 worker_uid = contract["game_contract_worker_uid"]
                 worker_name = self._fetch_worker_name_by_uid(worker_uid)
 
-                try:
-                    fed_initials = self.tewdb.select(
-                        "SELECT Initials FROM tblFed WHERE UID = ?",
-                        (contract_fedid,),
+                fed_fragment = fed_fragments.get(contract_fedid)
+                if fed_fragment is None:
+                    fed_fragment = (
+                        f"[{self._fetch_fed_initials(contract_fedid)}]"
                     )
-                except Exception as e:
-                    sk_log.warning(
-                        "FedInitials query failed with proper binding: "
-                        f"{e}, trying alternative approach"
-                    )
-                    try:
-                        query = (
-                            "SELECT Initials FROM tblFed WHERE UID = "
-                            f"{contract_fedid}"
-                        )
-                        fed_initials = self.tewdb.select(query)
-                    except Exception as e2:
-                        sk_log.error(
-                            "FedInitials fallback query also failed: "
-                            f"{e2}, using placeholder"
-                        )
-                        fed_initials = [{"Initials": "UNK"}]
-
-                if not fed_initials:
-                    sk_log.warning(
-                        "FedInitials not found for FedUID="
-                        f"{contract_fedid}, using placeholder"
-                    )
-                    fed_initials = [{"Initials": "UNK"}]
+                    fed_fragments[contract_fedid] = fed_fragment
 
                 combined_contract_record = (
-                    f"{worker_name}[{fed_initials[0]['Initials']}"
-                    f"][{contract_name}][{contract_uid}]"
+                    f"{worker_name}{fed_fragment}"
+                    f"[{contract_name}][{contract_uid}]"
                 )
-                game_contract_record_list.append(
+                append_contract_record(
                     {
                         "game_contract_uid": contract_uid,
                         "game_contract_name": combined_contract_record,
@@ -333,17 +381,14 @@ class PhotoContractEngine:
                     "Error fetching local workers from cache: "
                     f"{e}, trying direct directory scan"
                 )
-                from .photo_worker_engine import PhotoWorkerEngine
-
-                with PhotoWorkerEngine() as photo_worker_engine:
-                    worker_files = (
-                        photo_worker_engine.fetch_worker_photos_from_dir()
-                    )
-                    transformed_files = [
-                        {"local_contract_photo_file": file}
-                        for file in worker_files
-                    ]
-                    return (game_contract_record_list, transformed_files)
+                worker_files = (
+                    self.photo_worker_engine.fetch_worker_photos_from_dir()
+                )
+                transformed_files = [
+                    {"local_contract_photo_file": file}
+                    for file in worker_files
+                ]
+                return (game_contract_record_list, transformed_files)
         except Exception as e:
             sk_log.error(
                 "PhotoContractEngine fetch_contract_photo_record_cache_lists "
@@ -362,9 +407,87 @@ class PhotoContractEngine:
             )
             raise e
 
-    def refresh_contract_photo_record_cache(self) -> None:
-        """Refresh the contract photo record cache."""
+    def _source_fingerprint(self) -> Optional[str]:
+        """Fingerprint tblContract cheaply so unchanged sources can be skipped.
+
+        Besides the row count and highest UID, the summed lengths of the
+        Picture and Name columns act as a checksum, so most edits to
+        existing rows change the fingerprint too.
+
+        Returns:
+            Optional[str]: "row_count:max_uid:picture_len:name_len", or None
+            if it can't be read.
+        """
+        try:
+            result = self.tewdb.select(
+                "SELECT COUNT(*) AS row_count, MAX(UID) AS max_uid, "
+                "SUM(LEN(Picture)) AS picture_len, SUM(LEN(Name)) AS name_len "
+                "FROM tblContract"
+            )
+            if not result:
+                return None
+            row = result[0]
+            return (
+                f"{row['row_count']}:{row['max_uid']}:"
+                f"{row['picture_len']}:{row['name_len']}"
+            )
+        except Exception as e:
+            sk_log.warning(f"Could not fingerprint tblContract: {e}")
+            return None
+
+    def _cached_source_fingerprint(self) -> Optional[str]:
+        """Fetch the fingerprint recorded by the last full cache build."""
         try:
+            with SQLiteDatabase() as sqlitedb:
+                result = sqlitedb.execute_query(
+                    "SELECT source_fingerprint FROM contract_photo_cache_log "
+                    "WHERE source_fingerprint IS NOT NULL "
+                    "ORDER BY contract_photo_cache_log_id DESC LIMIT 1"
+                )
+                return result[0]["source_fingerprint"] if result else None
+        except Exception as e:
+            sk_log.debug(f"No cached tblContract fingerprint: {e}")
+            return None
+
+    def _cache_is_current(self, source_fingerprint: Optional[str]) -> bool:
+        """Whether the cache is filled and built from this tblContract.
+
+        Args:
+            source_fingerprint (Optional[str]): From _source_fingerprint().
+
+        Returns:
+            bool: True if a rebuild would produce the same cache.
+        """
+        return (
+            source_fingerprint is not None
+            and self._contract_photo_cache_check()
+            and source_fingerprint == self._cached_source_fingerprint()
+        )
+
+    def refresh_contract_photo_record_cache(self, force: bool = False) -> None:
+        """Refresh the contract photo record cache.
+
+        Unless forced, the rebuild is skipped when tblContract still
+        matches the fingerprint recorded by the last full build.
+
+        Args:
+            force (bool): Rebuild even if tblContract looks unchanged.
+        """
+        try:
+            source_fingerprint = self._source_fingerprint()
+            if not force and self._cache_is_current(source_fingerprint):
+                with SQLiteDatabase() as sqlitedb:
+                    sqlitedb.insert(
+                        "contract_photo_cache_log",
+                        {
+                            "status": "skipped",
+                            "source_fingerprint": source_fingerprint,
+                        },
+                    )
+                sk_log.info(
+                    "Contract photo record cache is current, skipping refresh"
+                )
+                return
             try:
                 self._reset_contract_photo_record_cache()
             except Exception as reset_error:
@@ -374,9 +497,6 @@ class PhotoContractEngine:
                     sqlitedb.insert(
                         "contract_photo_cache_log",
                         {
-                            "timestamp": datetime.now().strftime(
-                                "%Y-%m-%d %H:%M:%S"
-                            ),
                             "status": "partial_refresh",
                         },
                     )
@@ -390,10 +510,8 @@ class PhotoContractEngine:
                 sqlitedb.insert(
                     "contract_photo_cache_log",
                     {
-                        "timestamp": datetime.now().strftime(
-                            "%Y-%m-%d %H:%M:%S"
-                        ),
                         "status": "refreshed",
+                        "source_fingerprint": source_fingerprint,
                     },
                 )
                 sqlitedb.commit()
@@ -469,57 +587,112 @@ class PhotoContractEngine:
             new_filename (str): The new filename to use
             append_gif (bool): Whether to append .gif to the filename
         """
-        try:
-            uid_match = re.search(r"\[(\d+)\]$", contract_name)
-            if not uid_match:
-                sk_log.warning(
-                    f"No UID match found in contract name: {contract_name}"
-                )
-                raise ValueError("Invalid contract name format")
-            contract_uid = int(uid_match.group(1))
-            sk_log.debug(f"Extracted contract UID: {contract_uid}")
+        self.update_contract_photo_filenames(
+            [(contract_name, new_filename, append_gif)]
+        )
+
+    def update_contract_photo_filenames(
+        self, items: List[Tuple[str, str, bool]]
+    ) -> None:
+        """Update several contract photo filenames in one batch.
 
+        Each database receives a single batched UPDATE and a single commit,
+        so renaming N contracts costs two commits instead of 2N.
+
+        Args:
+            items (List[Tuple[str, str, bool]]): Tuples of
+                (contract_name, new_filename, append_gif) as accepted by
+                update_contract_photo_filename.
+        """
+        try:
+            if not items:
+                return
+            from utils.filer import Filer
+
+            updates = []
+            with Filer() as filer:
+                for contract_name, new_filename, append_gif in items:
+                    contract_uid = self._extract_contract_uid(contract_name)
+                    updated_filename = self._format_photo_filename(
+                        filer, new_filename, append_gif
+                    )
+                    updates.append((updated_filename, contract_uid))
             with SQLiteDatabase() as sqlitedb:
-                from utils.filer import Filer
-
-                updated_filename = new_filename
-                with Filer() as filer:
-                    image_extension = filer.extract_extension(new_filename)
-                    if append_gif and image_extension is None:
-                        updated_filename = f"{new_filename}.gif"
-                        image_extension = "gif"
-                    elif image_extension is None:
-                        image_extension = self.settings_manager.get_value(
-                            "default_image_extension"
-                        )
-                        if image_extension is None:
-                            raise Exception(
-                                "Default image extension is not set in settings."
-                            )
-                    if not (append_gif and image_extension == "gif"):
-                        updated_filename = filer.filepath_formatter(
-                            new_filename, image_extension
-                        )
-                sqlitedb.execute_write(
+                sqlitedb.execute_many(
                     "UPDATE game_contract_photo_cache SET game_contract_photo_file = ? "
                     "WHERE game_contract_uid = ?",
-                    (updated_filename, contract_uid),
+                    updates,
                 )
-                sqlitedb.commit()
-                self.tewdb.update(
+                self.tewdb.update_many(
                     "UPDATE tblContract SET Picture = ? WHERE UID = ?",
-                    (updated_filename, contract_uid),
-                )
-                sk_log.info(
-                    f"Updated contract UID {contract_uid} with "
-                    f"new photo: {updated_filename}"
+                    updates,
                 )
+                for updated_filename, contract_uid in updates:
+                    sk_log.info(
+                        f"Updated contract UID {contract_uid} with "
+                        f"new photo: {updated_filename}"
+                    )
         except Exception as e:
             sk_log.error(
-                f"PhotoContractEngine update_contract_photo_filename error: {e}"
+                f"PhotoContractEngine update_contract_photo_filenames error: {e}"
             )
             raise e
 
+    def _extract_contract_uid(self, contract_name: str) -> int:
+        """Extract the contract UID from a formatted contract name.
+
+        Args:
+            contract_name (str): The contract name in format
+                "WorkerName[FED][Name][UID]"
+
+        Returns:
+            int: The contract UID.
+
+        Raises:
+            ValueError: If the contract name does not end with a UID.
+        """
+        uid_match = re.search(r"\[(\d+)\]$", contract_name)
+        if not uid_match:
+            sk_log.warning(
+                f"No UID match found in contract name: {contract_name}"
+            )
+            raise ValueError("Invalid contract name format")
+        contract_uid = int(uid_match.group(1))
+        sk_log.debug(f"Extracted contract UID: {contract_uid}")
+        return contract_uid
+
+    def _format_photo_filename(
+        self, filer, new_filename: str, append_gif: bool = False
+    ) -> str:
+        """Resolve the stored filename for a new contract photo.
+
+        Args:
+            filer (Filer): An open Filer instance.
+            new_filename (str): The new filename to use
+            append_gif (bool): Whether to append .gif to the filename
+
+        Returns:
+            str: The filename with its image extension applied.
+        """
+        updated_filename = new_filename
+        image_extension = filer.extract_extension(new_filename)
+        if append_gif and image_extension is None:
+            updated_filename = f"{new_filename}.gif"
+            image_extension = "gif"
+        elif image_extension is None:
+            image_extension = self.settings_manager.get_value(
+                "default_image_extension"
+            )
+            if image_extension is None:
+                raise Exception(
+                    "Default image extension is not set in settings."
+                )
+        if not (append_gif and image_extension == "gif"):
+            updated_filename = filer.filepath_formatter(
+                new_filename, image_extension
+            )
+        return updated_filename
+
     def _fetch_local_workers_from_cache(self) -> List[dict]:
         """Fetch the local workers from the cache.
 
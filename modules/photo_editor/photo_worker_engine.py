@@ -1,29 +1,126 @@
+import os
+import re
+import sqlite3
+
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Tuple
+from functools import cached_property, lru_cache
+from itertools import chain
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
 
 from database.sqlite import SQLiteDatabase
-from settings.settings_file import SettingsManager
+from settings.settings_file import get_settings
+from utils.filer import Filer
 from utils.sk_logger import sk_log
 
+WORKER_PHOTO_EXTENSIONS = frozenset({"gif", "png"})
+PARALLEL_FETCH_MIN_ROWS = 100
+
+_FETCH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="worker-photo-cache"
+)
+
+_EXT_RE = re.compile(r"\.([A-Za-z0-9]+)$")
+_FILER = Filer()
+_UPDATE_CACHED_WORKER_PHOTO = (
+    "UPDATE game_worker_photo_cache SET game_worker_photo_file "
+    "= ? WHERE game_worker_name = ?"
+)
+_INSERT_WORKER_PHOTO_CACHE_LOG = (
+    "INSERT INTO worker_photo_cache_log (timestamp, status) VALUES (?, ?)"
+)
+_SELECT_GAME_WORKER_PHOTOS = "SELECT uid, Name, Picture FROM tblWorker"
+_UPDATE_GAME_WORKER_PHOTO = "UPDATE tblWorker SET Picture = ? WHERE Name = ?"
+
+
+def _log_timestamp() -> str:
+    """Format the current local time as a cache log timestamp.
+
+    Returns:
+        str: The time as 'YYYY-MM-DD HH:MM:SS'.
+    """
+    return datetime.now().isoformat(sep=" ", timespec="seconds")
+
+
+@lru_cache(maxsize=8)
+def _parse_max_age(max_age: Optional[str]) -> Optional[timedelta]:
+    """Turn the photo_cache_max_age setting into a timedelta.
+
+    Cached on the raw setting value, so a changed setting is parsed again.
+
+    Args:
+        max_age (Optional[str]): The setting, in hours.
+
+    Returns:
+        Optional[timedelta]: The maximum cache age, or None if unset.
+    """
+    return timedelta(hours=int(max_age)) if max_age is not None else None
+
+
+def _iter_worker_photos(root: str) -> Iterator[str]:
+    """Yield worker photo filenames from a folder as it is read.
+
+    Args:
+        root (str): The worker photo folder.
+
+    Yields:
+        str: Names of the .gif and .png files in the folder, matched
+        case-insensitively.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            extension = entry.name.rpartition(".")[2].lower()
+            if extension in WORKER_PHOTO_EXTENSIONS and entry.is_file(
+                follow_symlinks=False
+            ):
+                yield entry.name
+
+
+def _scan_worker_photos(root: str) -> List[str]:
+    """List worker photo filenames in a folder with a single directory read.
+
+    Args:
+        root (str): The worker photo folder.
+
+    Returns:
+        List[str]: Names of the .gif and .png files in the folder, matched
+        case-insensitively.
+    """
+    return list(_iter_worker_photos(root))
+
 
 class PhotoWorkerEngine:
     def __init__(self) -> None:
         try:
-            from .picture_directories import PictureDirectories
-            from .photo_cache import PhotoCache
-            from database.tewdb import TEWDB
-
-            self.tewdb = TEWDB()
-            self.settings_manager = SettingsManager()
-            self.photo_cache = PhotoCache()
-            self.worker_photo_path = self.photo_cache.fetch_photo_root_path(
-                PictureDirectories.WORKER_FOLDER
-            )
+            self.settings_manager = get_settings()
 
         except Exception as e:
             sk_log.error(f"PhotoWorkerEngine __init__ error: {e}")
             raise e
 
+    @cached_property
+    def tewdb(self):
+        """Game database handle, opened on first use."""
+        from database.tewdb import TEWDB
+
+        return TEWDB()
+
+    @cached_property
+    def photo_cache(self):
+        """Photo cache helper, created on first use."""
+        from .photo_cache import PhotoCache
+
+        return PhotoCache()
+
+    @cached_property
+    def worker_photo_path(self) -> str:
+        """Worker photo folder, resolved on first use."""
+        from .picture_directories import PictureDirectories
+
+        return self.photo_cache.fetch_photo_root_path(
+            PictureDirectories.WORKER_FOLDER
+        )
+
     def __enter__(self) -> "PhotoWorkerEngine":
         return self
 
@@ -32,14 +129,15 @@ class PhotoWorkerEngine:
 
     def fetch_worker_filename_from_cache(self, worker_name: str) -> str:
         try:
-            with SQLiteDatabase() as sqlitedb:
+            with SQLiteDatabase(read_only=True) as sqlitedb:
                 result = sqlitedb.execute_query(
-                    f"SELECT game_worker_photo_file FROM game_worker_photo_cache "
-                    f"WHERE game_worker_name = '{worker_name}'"
+                    "SELECT game_worker_photo_file "
+                    "FROM game_worker_photo_cache WHERE game_worker_name = ?",
+                    (worker_name,),
                 )
-                if result and len(result) > 0:
-                    return result[0]["game_worker_photo_file"]
-                return ""
+            if result and len(result) > 0:
+                return result[0]["game_worker_photo_file"]
+            return ""
         except Exception as e:
             sk_log.error(
                 f"PhotoWorkerEngine fetch_worker_filename_from_cache error: {e}"
@@ -49,20 +147,51 @@ class PhotoWorkerEngine:
     def fetch_worker_photo_cache_lists(self) -> Tuple[List[Tuple], List[Tuple]]:
         """Fetch the worker photo cache lists.
 
+        Large caches are read on two pooled read-only connections at once.
+
         Returns:
             Tuple[List[Tuple], List[Tuple]]: Tuple of lists of worker photos.
         """
         try:
-            return (
-                self._fetch_game_workers_from_cache(),
-                self._fetch_local_workers_from_cache(),
+            with SQLiteDatabase(read_only=True) as sqlitedb:
+                game_rows = sqlitedb.get_row_count("game_worker_photo_cache")
+            if game_rows < PARALLEL_FETCH_MIN_ROWS:
+                return (
+                    self._fetch_game_workers_from_cache(),
+                    self._fetch_local_workers_from_cache(),
+                )
+            game_future = _FETCH_EXECUTOR.submit(
+                self._fetch_game_workers_from_cache
             )
+            local_future = _FETCH_EXECUTOR.submit(
+                self._fetch_local_workers_from_cache
+            )
+            return game_future.result(), local_future.result()
         except Exception as e:
             sk_log.error(
                 f"PhotoWorkerEngine fetch_worker_photo_cache_lists error: {e}"
             )
             raise e
 
+    def fetch_local_worker_photo_files(self) -> Set[str]:
+        """Fetch the filenames held in the local worker photo cache.
+
+        Returns:
+            Set[str]: The cached local photo filenames.
+        """
+        try:
+            with SQLiteDatabase(read_only=True) as sqlitedb:
+                rows = sqlitedb.execute_query(
+                    "SELECT local_worker_photo_file "
+                    "FROM local_worker_photo_cache"
+                )
+            return {row["local_worker_photo_file"] for row in rows or ()}
+        except Exception as e:
+            sk_log.error(
+                f"PhotoWorkerEngine fetch_local_worker_photo_files error: {e}"
+            )
+            raise e
+
     def worker_photo_cache_init(self, skip_check: bool = False) -> bool:
         try:
             cache_check = self._worker_photo_cache_check(skip_check)
@@ -91,40 +220,34 @@ class PhotoWorkerEngine:
             Exception: If there is an error updating the worker photo filename.
         """
         try:
-            with SQLiteDatabase() as sqlitedb:
-                from utils.filer import Filer
-
-                updated_filename = new_filename
-                with Filer() as filer:
-                    image_extension = filer.extract_extension(new_filename)
-                    if append_gif and image_extension is None:
-                        updated_filename = f"{new_filename}.gif"
-                        image_extension = "gif"
-                    elif image_extension is None:
-                        image_extension = self.settings_manager.get_value(
-                            "default_image_extension"
-                        )
-                        if image_extension is None:
-                            raise Exception(
-                                "Default image extension is not set in settings."
-                            )
-                    if not (append_gif and image_extension == "gif"):
-                        updated_filename = filer.filepath_formatter(
-                            new_filename, image_extension
-                        )
-                sqlitedb.execute_write(
-                    "UPDATE game_worker_photo_cache SET game_worker_photo_file "
-                    "= ? WHERE game_worker_name = ?",
-                    (updated_filename, worker_name),
+            updated_filename = new_filename
+            ext_match = _EXT_RE.search(new_filename)
+            image_extension = ext_match.group(1).lower() if ext_match else None
+            if append_gif and image_extension is None:
+                updated_filename = f"{new_filename}.gif"
+                image_extension = "gif"
+            elif image_extension is None:
+                image_extension = self.settings_manager.get_value(
+                    "default_image_extension"
                 )
-                sqlitedb.commit()
-                self.tewdb.update(
-                    "UPDATE tblWorker SET Picture = ? WHERE Name = ?",
-                    (updated_filename, worker_name),
+                if image_extension is None:
+                    raise Exception(
+                        "Default image extension is not set in settings."
+                    )
+            if not (append_gif and image_extension == "gif"):
+                updated_filename = _FILER.filepath_formatter(
+                    new_filename, image_extension
                 )
-                sk_log.info(
-                    f"Updated worker {worker_name} with photo: {updated_filename}"
+            with SQLiteDatabase() as sqlitedb:
+                sqlitedb.execute_write(
+                    _UPDATE_CACHED_WORKER_PHOTO, (updated_filename, worker_name)
                 )
+            self.tewdb.update(
+                _UPDATE_GAME_WORKER_PHOTO, (updated_filename, worker_name)
+            )
+            sk_log.info(
+                f"Updated worker {worker_name} with photo: {updated_filename}"
+            )
         except Exception as e:
             sk_log.error(
                 f"PhotoWorkerEngine update_worker_photo_filename error: {e}"
@@ -132,28 +255,26 @@ class PhotoWorkerEngine:
             raise e
 
     def build_local_worker_photo_cache(
-        self, worker_photo_list: List[str]
+        self, worker_photo_list: Iterable[str]
     ) -> None:
         """Build the local worker photo cache.
 
         Args:
-            worker_photo_list (List[str]): List of worker photo filenames to build the
-            local worker photo cache from.
+            worker_photo_list (Iterable[str]): Worker photo filenames to build
+            the local worker photo cache from, consumed once.
 
         Raises:
             e: Exception if the local worker photo cache cannot be built.
         """
         try:
             with SQLiteDatabase() as sqlitedb:
-                for filename in worker_photo_list:
-                    sqlitedb.insert(
-                        "local_worker_photo_cache",
-                        {
-                            "local_worker_photo_file": filename,
-                            "local_worker_photo_status": "new",
-                        },
-                    )
-                sqlitedb.commit()
+                sqlitedb.insert_many(
+                    "local_worker_photo_cache",
+                    ("local_worker_photo_file", "local_worker_photo_status"),
+                    ((filename, "new") for filename in worker_photo_list),
+                    chunk=500,
+                    rows_per_statement=50,
+                )
         except Exception as e:
             sk_log.error(
                 f"PhotoWorkerEngine build_local_worker_photo_cache error: {e}"
@@ -174,60 +295,69 @@ class PhotoWorkerEngine:
         """
         try:
             with SQLiteDatabase() as sqlitedb:
-                for worker in worker_photo_list:
-                    sqlitedb.insert(
-                        "game_worker_photo_cache",
-                        {
-                            "game_worker_uid": worker["uid"],
-                            "game_worker_name": worker["Name"],
-                            "game_worker_photo_file": worker["Picture"],
-                            "game_worker_photo_status": "new",
-                        },
-                    )
-                sqlitedb.commit()
+                sqlitedb.insert_many(
+                    "game_worker_photo_cache",
+                    (
+                        "game_worker_uid",
+                        "game_worker_name",
+                        "game_worker_photo_file",
+                        "game_worker_photo_status",
+                    ),
+                    (
+                        (
+                            worker["uid"],
+                            worker["Name"],
+                            worker["Picture"],
+                            "new",
+                        )
+                        for worker in worker_photo_list
+                    ),
+                    chunk=500,
+                    rows_per_statement=50,
+                )
         except Exception as e:
             sk_log.error(
                 f"PhotoWorkerEngine build_game_worker_photo_cache error: {e}"
             )
             raise e
 
-    def _fetch_game_workers_from_cache(self) -> List[dict]:
+    def _fetch_game_workers_from_cache(self) -> List[sqlite3.Row]:
         """Fetch the game workers from the cache.
 
         Returns:
-            List[dict]: List of game workers with keys 'game_worker_uid',
+            List[sqlite3.Row]: List of game workers with keys 'game_worker_uid',
                 'game_worker_name', 'game_worker_photo_file', and
                 'game_worker_photo_status'
         """
         try:
-            with SQLiteDatabase() as sqlitedb:
+            with SQLiteDatabase(read_only=True) as sqlitedb:
                 worker_photo_list = sqlitedb.execute_query(
                     "SELECT * FROM game_worker_photo_cache"
                 )
                 if not worker_photo_list or len(worker_photo_list) == 0:
                     raise Exception("No game workers found in cache")
-                return [dict(row) for row in worker_photo_list]
+                return worker_photo_list
         except Exception as e:
             sk_log.error(
                 f"PhotoWorkerEngine fetch_game_workers_from_cache error: {e}"
             )
             raise e
 
-    def _fetch_local_workers_from_cache(self) -> List[dict]:
+    def _fetch_local_workers_from_cache(self) -> List[sqlite3.Row]:
         """Fetch the local workers from the cache.
 
         Returns:
-            List[dict]: List of local workers with keys 'local_worker_uid',
+            List[sqlite3.Row]: List of local workers with keys 'local_worker_uid',
                 'local_worker_photo_file', and 'local_worker_photo_status'
         """
         try:
-            with SQLiteDatabase() as sqlitedb:
+            with SQLiteDatabase(read_only=True) as sqlitedb:
                 worker_photo_list = sqlitedb.execute_query(
                     "SELECT * FROM local_worker_photo_cache"
                 )
                 if not worker_photo_list or len(worker_photo_list) == 0:
                     raise Exception("No local workers found in cache")
-                return [dict(row) for row in worker_photo_list]
+                return worker_photo_list
         except Exception as e:
             sk_log.error(
                 f"PhotoWorkerEngine fetch_local_workers_from_cache error: {e}"
@@ -243,21 +373,8 @@ class PhotoWorkerEngine:
         Raises:
             e: Exception if the worker photos cannot be fetched from the directory.
         """
-        from utils.filer import Filer
-        from .picture_directories import PictureDirectories
-        from .photo_cache import PhotoCache
-
         try:
-            with Filer() as filer:
-                photo_cache = PhotoCache()
-                worker_photo_paths = filer.fetch_files_from_directory(
-                    photo_cache.fetch_photo_root_path(
-                        PictureDirectories.WORKER_FOLDER
-                    ),
-                    include_patterns=["*.gif", "*.png"],
-                )
-                worker_photo_list = [path.name for path in worker_photo_paths]
-                return worker_photo_list
+            return _scan_worker_photos(self.worker_photo_path)
         except Exception as e:
             sk_log.error(
                 f"PhotoWorkerEngine fetch_worker_photos_from_dir error: {e}"
@@ -273,44 +390,39 @@ class PhotoWorkerEngine:
         Raises:
             e: Exception if the worker photo paths cannot be fetched from the database.
         """
-        from modules.tables.worker_table import WorkerFunctions
-
         try:
-            worker_functions = WorkerFunctions()
-            worker_photo_list = (
-                worker_functions.fetch_all_workers_specific_cols(
-                    ["uid", "Name", "Picture"]
-                )
-            )
-            return worker_photo_list
+            return self.tewdb.select(_SELECT_GAME_WORKER_PHOTOS)
         except Exception as e:
             sk_log.error(
                 f"PhotoWorkerEngine fetch_worker_photo_list error: {e}"
             )
             raise e
 
-    def _fetch_worker_photo_lists(self) -> Tuple[List[Tuple], List[Tuple]]:
+    def _fetch_worker_photo_lists(self) -> Tuple[Iterator[str], List[dict]]:
         """Fetch the worker photo lists.
 
+        The folder listing is returned as a lazy iterator, so it can be
+        streamed into the cache without building a list first.
+
         Returns:
-            Tuple[List[Tuple], List[Tuple]]: Tuple of lists of worker photos.
+            Tuple[Iterator[str], List[dict]]: Worker photo filenames from the
+            folder and worker photo records from the game database.
 
         Raises:
             e: Exception if the worker photo lists cannot be fetched.
         """
         try:
-            from .photo_cache import PhotoCache
-
-            with PhotoCache() as photo_cache:
-                worker_photo_list_from_dir = self.fetch_worker_photos_from_dir()
-                if not photo_cache.photo_list_check(worker_photo_list_from_dir):
-                    raise Exception("Worker photo list from dir is empty")
-                worker_photo_list_from_db = (
-                    self._fetch_worker_photo_paths_from_db()
-                )
-                if not photo_cache.photo_list_check(worker_photo_list_from_db):
-                    raise Exception("Worker photo list from db is empty")
-                return worker_photo_list_from_dir, worker_photo_list_from_db
+            worker_photos_from_dir = _iter_worker_photos(self.worker_photo_path)
+            first_photo = next(worker_photos_from_dir, None)
+            if first_photo is None:
+                raise Exception("Worker photo list from dir is empty")
+            worker_photo_list_from_db = self._fetch_worker_photo_paths_from_db()
+            if not self.photo_cache.photo_list_check(worker_photo_list_from_db):
+                raise Exception("Worker photo list from db is empty")
+            return (
+                chain((first_photo,), worker_photos_from_dir),
+                worker_photo_list_from_db,
+            )
         except Exception as e:
             sk_log.error(
                 f"PhotoWorkerEngine _fetch_worker_photo_lists error: {e}"
@@ -324,61 +436,55 @@ class PhotoWorkerEngine:
             e: Exception if the worker photo cache cannot be rebuilt.
         """
         try:
-            with SQLiteDatabase() as sqlitedb:
-                sqlitedb.execute_write(
-                    "DROP TABLE IF EXISTS local_worker_photo_cache"
-                )
-                sqlitedb.execute_write(
-                    "DROP TABLE IF EXISTS game_worker_photo_cache"
-                )
-                sqlitedb.execute_write(
-                    "DROP TABLE IF EXISTS worker_photo_cache_log"
-                )
-                sqlitedb.create_table(
-                    "worker_photo_cache_log",
-                    {
-                        "worker_photo_cache_log_id": (
-                            "INTEGER PRIMARY KEY AUTOINCREMENT"
-                        ),
-                        "timestamp": "TEXT",
-                        "status": "TEXT",
-                    },
-                )
-                sqlitedb.insert(
-                    "worker_photo_cache_log",
-                    {
-                        "timestamp": datetime.now().strftime(
-                            "%Y-%m-%d %H:%M:%S"
-                        ),
-                        "status": "created",
-                    },
-                )
-                sqlitedb.create_table(
-                    "local_worker_photo_cache",
-                    {
-                        "local_worker_uid": "INTEGER PRIMARY KEY AUTOINCREMENT",
-                        "local_worker_photo_file": "TEXT",
-                        "local_worker_photo_status": "TEXT",
-                    },
-                )
-                sqlitedb.create_table(
-                    "game_worker_photo_cache",
-                    {
-                        "game_worker_uid": "INTEGER PRIMARY KEY AUTOINCREMENT",
-                        "game_worker_name": "TEXT",
-                        "game_worker_photo_file": "TEXT",
-                        "game_worker_photo_status": "TEXT",
-                    },
-                )
-                sqlitedb.commit()
+            with SQLiteDatabase() as sqlitedb, sqlitedb.writer_lock():
+                try:
+                    sqlitedb.execute_script(
+                        """
+                        BEGIN;
+                        DROP INDEX IF EXISTS idx_lwpc_file;
+                        DROP INDEX IF EXISTS idx_gwpc_name;
+                        DROP TABLE IF EXISTS local_worker_photo_cache;
+                        DROP TABLE IF EXISTS game_worker_photo_cache;
+                        DROP TABLE IF EXISTS worker_photo_cache_log;
+                        CREATE TABLE worker_photo_cache_log (
+                            worker_photo_cache_log_id
+                                INTEGER PRIMARY KEY AUTOINCREMENT,
+                            timestamp TEXT,
+                            status TEXT
+                        );
+                        CREATE TABLE local_worker_photo_cache (
+                            local_worker_uid INTEGER PRIMARY KEY AUTOINCREMENT,
+                            local_worker_photo_file TEXT,
+                            local_worker_photo_status TEXT
+                        );
+                        CREATE TABLE game_worker_photo_cache (
+                            game_worker_uid INTEGER PRIMARY KEY AUTOINCREMENT,
+                            game_worker_name TEXT,
+                            game_worker_photo_file TEXT,
+                            game_worker_photo_status TEXT
+                        );
+                        """
+                    )
+                    sqlitedb.execute_write(
+                        _INSERT_WORKER_PHOTO_CACHE_LOG,
+                        (_log_timestamp(), "created"),
+                    )
+                except Exception:
+                    sqlitedb.rollback()
+                    raise
         except Exception as e:
             sk_log.error(
                 f"PhotoWorkerEngine rebuild_worker_photo_cache error: {e}"
             )
 
-    def _reset_worker_photo_cache(self) -> bool:
+    def _reset_worker_photo_cache(self, status: Optional[str] = None) -> bool:
         """Reset the worker photo cache.
 
+        Args:
+            status (Optional[str], optional): Cache log status to record in
+            the same transaction that indexes the rebuilt cache. Defaults to
+            None.
+
         Returns:
             bool: True if the worker photo cache was reset, False otherwise.
 
@@ -390,11 +496,53 @@ class PhotoWorkerEngine:
             worker_dir_list, worker_db_list = self._fetch_worker_photo_lists()
             self.build_local_worker_photo_cache(worker_dir_list)
             self._build_game_worker_photo_cache(worker_db_list)
+            self._index_worker_photo_cache(status)
         except Exception as e:
             sk_log.error(
                 f"PhotoWorkerEngine reset_worker_photo_cache error: {e}"
             )
 
+    def _index_worker_photo_cache(self, status: Optional[str] = None) -> None:
+        """Index the worker photo cache lookup columns.
+
+        Called once the cache tables are filled, so the inserts do not
+        have to maintain the indexes row by row.
+
+        Args:
+            status (Optional[str], optional): Cache log status to insert
+            before the indexes are committed. Defaults to None.
+
+        Raises:
+            e: Exception if the worker photo cache cannot be indexed.
+        """
+        try:
+            with SQLiteDatabase() as sqlitedb, sqlitedb.writer_lock():
+                try:
+                    sqlitedb.execute_script(
+                        """
+                        BEGIN;
+                        CREATE INDEX IF NOT EXISTS idx_gwpc_name
+                            ON game_worker_photo_cache(game_worker_name);
+                        CREATE INDEX IF NOT EXISTS idx_lwpc_file
+                            ON local_worker_photo_cache(local_worker_photo_file);
+                        """
+                    )
+                    if status is None:
+                        sqlitedb.commit()
+                    else:
+                        sqlitedb.execute_write(
+                            _INSERT_WORKER_PHOTO_CACHE_LOG,
+                            (_log_timestamp(), status),
+                        )
+                except Exception:
+                    sqlitedb.rollback()
+                    raise
+        except Exception as e:
+            sk_log.error(
+                f"PhotoWorkerEngine index_worker_photo_cache error: {e}"
+            )
+            raise e
+
     def _verify_worker_photo_cache_is_ready(self) -> bool:
         """Verify if the worker photo cache is ready.
 
@@ -406,7 +554,7 @@ class PhotoWorkerEngine:
         """
         try:
             sk_log.debug("PhotoWorkerEngine verify_worker_photo_cache_is_ready")
-            with SQLiteDatabase() as sqlitedb:
+            with SQLiteDatabase(read_only=True) as sqlitedb:
                 table_exists = sqlitedb._check_table_exists(
                     "worker_photo_cache_log"
                 )
@@ -424,23 +572,20 @@ class PhotoWorkerEngine:
                     sk_log.debug("logs_found is False")
                     return False
                 sk_log.debug("logs_found is True")
-                with SettingsManager() as settings_manager:
-                    max_age = int(
-                        settings_manager.get_value("photo_cache_max_age")
-                    )
-                    sk_log.debug(f"max_age: {max_age}")
-                    last_record = logs_found[0]
-                    last_timestamp = datetime.strptime(
-                        last_record[1], "%Y-%m-%d %H:%M:%S"
-                    )
-                    sk_log.debug(f"last_record: {last_record}")
-                    if last_timestamp < datetime.now() - timedelta(
-                        hours=max_age
-                    ):
-                        sk_log.debug("last_record is older than max_age")
-                        return False
-                    sk_log.debug("last_record is not older than max_age")
-                    return True
+            max_age = _parse_max_age(
+                self.settings_manager.get_value("photo_cache_max_age")
+            )
+            if max_age is None:
+                raise Exception("Photo cache max age is not set in settings.")
+            sk_log.debug(f"max_age: {max_age}")
+            last_record = logs_found[0]
+            last_timestamp = datetime.fromisoformat(last_record[1])
+            sk_log.debug(f"last_record: {last_record}")
+            if last_timestamp < datetime.now() - max_age:
+                sk_log.debug("last_record is older than max_age")
+                return False
+            sk_log.debug("last_record is not older than max_age")
+            return True
         except Exception as e:
             sk_log.debug(
                 "PhotoWorkerEngine verify_clear_worker_photo_cache_age "
@@ -458,18 +603,14 @@ class PhotoWorkerEngine:
             e: Exception if the local worker photo cache cannot be verified.
         """
         try:
-            with SQLiteDatabase() as sqlitedb:
-                table_exists = sqlitedb._check_table_exists(
-                    "local_worker_photo_cache"
-                )
-                if not table_exists:
-                    return False
-                at_least_one_record = sqlitedb._check_table_has_records(
-                    "local_worker_photo_cache"
-                )
-                if not at_least_one_record:
+            with SQLiteDatabase(read_only=True) as sqlitedb:
+                try:
+                    first_row = sqlitedb.conn.execute(
+                        "SELECT 1 FROM local_worker_photo_cache LIMIT 1"
+                    ).fetchone()
+                except sqlite3.OperationalError:
                     return False
-                return True
+                return first_row is not None
         except Exception as e:
             sk_log.debug(
                 f"PhotoWorkerEngine verify_local_worker_photo_cache_status error: {e}"
@@ -511,38 +652,16 @@ class PhotoWorkerEngine:
             if not local_files:
                 raise Exception("No local worker photo files found")
             try:
-                self._reset_worker_photo_cache()
+                self._reset_worker_photo_cache(status="refreshed")
             except Exception as reset_error:
                 sk_log.warning(f"Full cache reset failed: {reset_error}")
                 self._rebuild_worker_photo_cache()
                 self.build_local_worker_photo_cache(local_files)
-                with SQLiteDatabase() as sqlitedb:
-                    sqlitedb.insert(
-                        "worker_photo_cache_log",
-                        {
-                            "timestamp": datetime.now().strftime(
-                                "%Y-%m-%d %H:%M:%S"
-                            ),
-                            "status": "partial_refresh",
-                        },
-                    )
-                    sqlitedb.commit()
-
+                self._index_worker_photo_cache(status="partial_refresh")
                 sk_log.info(
                     "Worker photo cache partially refreshed (local files only)"
                 )
                 return
-            with SQLiteDatabase() as sqlitedb:
-                sqlitedb.insert(
-                    "worker_photo_cache_log",
-                    {
-                        "timestamp": datetime.now().strftime(
-                            "%Y-%m-%d %H:%M:%S"
-                        ),
-                        "status": "refreshed",
-                    },
-                )
-                sqlitedb.commit()
             sk_log.info("Worker photo cache refreshed successfully")
         except Exception as e:
             sk_log.error(
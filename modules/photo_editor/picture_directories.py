@@ -12,22 +12,24 @@ class PictureDirectories:
     TV_FOLDER: str = "TV"
     WORKER_FOLDER: str = "People"
 
+    _ALL_FOLDERS: tuple[str, ...] = (
+        BANNER_FOLDER,
+        BROADCASTER_FOLDER,
+        DEFAULTS_FOLDER,
+        EVENTS_FOLDER,
+        LOGO_BACKS_FOLDER,
+        LOGOS_FOLDER,
+        NARRATIVES_FOLDER,
+        STABLE_BACKS_FOLDER,
+        STABLES_FOLDER,
+        TITLES_FOLDER,
+        TV_FOLDER,
+        WORKER_FOLDER,
+    )
+
     @classmethod
-    def get_all_folders(cls) -> list[str]:
-        return [
-            cls.BANNER_FOLDER,
-            cls.BROADCASTER_FOLDER,
-            cls.DEFAULTS_FOLDER,
-            cls.EVENTS_FOLDER,
-            cls.LOGO_BACKS_FOLDER,
-            cls.LOGOS_FOLDER,
-            cls.NARRATIVES_FOLDER,
-            cls.STABLE_BACKS_FOLDER,
-            cls.STABLES_FOLDER,
-            cls.TITLES_FOLDER,
-            cls.TV_FOLDER,
-            cls.WORKER_FOLDER,
-        ]
+    def get_all_folders(cls) -> tuple[str, ...]:
+        return cls._ALL_FOLDERS
 
 
 __all__ = ["PictureDirectories"]
@@ -1,7 +1,22 @@
+from functools import lru_cache
 from typing import Any, List, Tuple
+from database import tewdb_pool
 from database.tewdb import TEWDB
 from utils.sk_logger import sk_log
 
+_SQL_ALL_AGERS = "SELECT * FROM tblAger"
+_SQL_AGER_BY_RECORDNAME = "SELECT * FROM tblAger WHERE Recordname = ?"
+_SQL_AGER_RECORDNAMES_BY_WORKER_UID = (
+    "SELECT Recordname FROM tblAger WHERE Worker = ?"
+)
+_SQL_AGER_UIDS_BY_WORKER_UID = "SELECT uid FROM tblAger WHERE Worker = ?"
+
+
+@lru_cache(maxsize=64)
+def _build_ager_select(columns: Tuple[str, ...], where: str = "") -> str:
+    """Build a tblAger SELECT for validated columns, once per column set."""
+    return f"SELECT {', '.join(columns)} FROM tblAger{where}"
+
 
 class AgersTable:
     def __init__(self):
@@ -15,35 +30,32 @@ class AgersTable:
 class AgersFunctions:
     def __init__(self):
         try:
-            self.tewdb = TEWDB()
+            self.tewdb = tewdb_pool.acquire()
         except Exception as e:
             sk_log.error(f"AgersFunctions __init__ error: {e}")
             raise e
 
-        def __enter__(self) -> "AgersFunctions":
-            """Context manager entry."""
-            return self
+    def __enter__(self) -> "AgersFunctions":
+        """Context manager entry."""
+        return self
 
-        def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-            """Context manager exit."""
-            if hasattr(self, "tewdb"):
-                self.tewdb.close()
-                sk_log.debug("AgersFunctions database connection closed")
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        if hasattr(self, "tewdb"):
+            tewdb_pool.release(self.tewdb)
+            del self.tewdb
+            sk_log.debug("AgersFunctions database connection released")
 
     def fetch_all_agers_in_table(self) -> List[Tuple]:
         try:
-            self.agers_table = self.tewdb.select("SELECT * FROM tblAger")
-            return self.agers_table
+            return self.tewdb.select(_SQL_ALL_AGERS)
         except Exception as e:
             sk_log.error(f"AgersFunctions fetch_all_agers_in_table error: {e}")
             raise e
 
     def fetch_ager_by_recordname(self, recordname: str) -> Tuple:
         try:
-            self.agers_table = self.tewdb.select(
-                "SELECT * FROM tblAger WHERE Recordname = ?", (recordname,)
-            )
-            return self.agers_table
+            return self.tewdb.select(_SQL_AGER_BY_RECORDNAME, (recordname,))
         except Exception as e:
             sk_log.error(f"AgersFunctions fetch_ager_by_recordname error: {e}")
             raise e
@@ -52,13 +64,13 @@ class AgersFunctions:
         self, column_name: str
     ) -> List[Tuple[int, Any]]:
         try:
-            self.agers_table = self.tewdb.select(
-                f"SELECT uid, {column_name} FROM tblAger"
+            columns = self.tewdb.validate_columns(
+                "tblAger", ("uid", column_name)
             )
-            return self.agers_table
+            return self.tewdb.select(_build_ager_select(columns))
         except Exception as e:
             sk_log.error(
-                "AgersFunctions fetch_ager_colvalue_by_colname error: {e}"
+                f"AgersFunctions fetch_ager_colvalue_by_colname error: {e}"
             )
             raise e
 
@@ -66,10 +78,9 @@ class AgersFunctions:
         self, worker_uid: int
     ) -> List[str]:
         try:
-            self.agers_table = self.tewdb.select(
-                "SELECT Recordname FROM tblAger WHERE Worker = ?", (worker_uid,)
+            return self.tewdb.select(
+                _SQL_AGER_RECORDNAMES_BY_WORKER_UID, (worker_uid,)
             )
-            return self.agers_table
         except Exception as e:
             sk_log.error(
                 f"AgersFunctions fetch_ager_recordname_list_by_worker_uid error: {e}"
@@ -78,42 +89,30 @@ class AgersFunctions:
 
     def fetch_all_agers_specific_cols(self, columns: List[str]) -> List[Tuple]:
         try:
-            self.agers_table = self.tewdb.select(
-                f"SELECT {', '.join(columns)} FROM tblAger"
-            )
-            return self.agers_table
+            columns = self.tewdb.validate_columns("tblAger", columns)
+            return self.tewdb.select(_build_ager_select(columns))
         except Exception as e:
             sk_log.error(
                 f"AgersFunctions fetch_all_agers_specific_cols error: {e}"
             )
             raise e
 
-    def fetch_ager_specific_cols(self, columns: List[str]) -> List[Tuple]:
-        try:
-            self.agers_table = self.tewdb.select(
-                f"SELECT {', '.join(columns)} FROM tblAger"
-            )
-            return self.agers_table
-        except Exception as e:
-            sk_log.error(f"AgersFunctions fetch_ager_specific_cols error: {e}")
-            raise e
+    fetch_ager_specific_cols = fetch_all_agers_specific_cols
 
     def fetch_ager_specific_cols_by_recordname(
         self, recordname: str, columns: List[str]
     ) -> List[Tuple]:
         try:
-            cols = columns.copy()
-            if "uid" not in cols:
-                cols.insert(0, "uid")
-            query = (
-                f"SELECT {', '.join(cols)} FROM tblAger WHERE Recordname = ?"
+            cols = ("uid", *columns) if "uid" not in columns else columns
+            query = _build_ager_select(
+                self.tewdb.validate_columns("tblAger", cols),
+                " WHERE Recordname = ?",
             )
             sk_log.debug(
-                f"Constructed query: {query} with params: [{recordname}]"
+                "Constructed query: %s with params: [%s]", query, recordname
             )
 
-            self.agers_table = self.tewdb.select(query, [recordname])
-            return self.agers_table
+            return self.tewdb.select(query, [recordname])
         except Exception as e:
             sk_log.error(
                 f"AgersFunctions fetch_ager_specific_cols_by_recordname error: {e}"
@@ -122,10 +121,9 @@ class AgersFunctions:
 
     def fetch_ager_uid_list_by_worker_uid(self, worker_uid: int) -> List[int]:
         try:
-            self.agers_table = self.tewdb.select(
-                "SELECT uid FROM tblAger WHERE Worker = ?", (worker_uid,)
+            return self.tewdb.select(
+                _SQL_AGER_UIDS_BY_WORKER_UID, (worker_uid,)
             )
-            return self.agers_table
         except Exception as e:
             sk_log.error(
                 f"AgersFunctions fetch_ager_uid_list_by_worker_uid error: {e}"
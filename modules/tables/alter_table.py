@@ -1,7 +1,19 @@
-from typing import Any, List, Tuple
-from database.tewdb import TEWDB
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Tuple
+from database import tewdb_pool
+from database.tewdb import TEWDB, column_values
 from utils.sk_logger import sk_log
 
+_SQL_ALL_ALTERS = "SELECT * FROM tblAlternate"
+_SQL_ALTER_BY_RECORDNAME = "SELECT * FROM tblAlternate WHERE Recordname = ?"
+_SQL_ALTER_KEYS = "SELECT uid, Recordname, WorkerUID FROM tblAlternate"
+
+
+@lru_cache(maxsize=64)
+def _build_alter_select(columns: Tuple[str, ...], where: str = "") -> str:
+    """Build a tblAlternate SELECT for validated columns, once per set."""
+    return f"SELECT {', '.join(columns)} FROM tblAlternate{where}"
+
 
 class AlterTable:
     def __init__(self) -> None:
@@ -15,7 +27,7 @@ class AlterTable:
 class AlterFunctions:
     def __init__(self) -> None:
         try:
-            self.tewdb = TEWDB()
+            self.tewdb = tewdb_pool.acquire()
         except Exception as e:
             sk_log.error(f"AlterFunctions __init__ error: {e}")
             raise e
@@ -27,12 +39,13 @@ class AlterFunctions:
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Context manager exit."""
         if hasattr(self, "tewdb"):
-            self.tewdb.close()
-            sk_log.debug("AlterFunctions database connection closed")
+            tewdb_pool.release(self.tewdb)
+            del self.tewdb
+            sk_log.debug("AlterFunctions database connection released")
 
     def fetch_all_alters_in_table(self) -> List[Tuple]:
         try:
-            self.alter_table = self.tewdb.select("SELECT * FROM tblAlternate")
+            self.alter_table = self.tewdb.select_cached(_SQL_ALL_ALTERS)
             return self.alter_table
         except Exception as e:
             sk_log.error(f"AlterFunctions fetch_all_alters_in_table error: {e}")
@@ -41,20 +54,34 @@ class AlterFunctions:
     def fetch_alter_by_recordname(self, recordname: str) -> Tuple:
         try:
             self.alter_table = self.tewdb.select(
-                "SELECT * FROM tblAlternate WHERE Recordname = ?", (recordname,)
+                _SQL_ALTER_BY_RECORDNAME, (recordname,)
             )
             return self.alter_table
         except Exception as e:
             sk_log.error(f"AlterFunctions fetch_alter_by_recordname error: {e}")
             raise e
 
+    def fetch_alters_by_recordnames(
+        self, recordnames: Iterable[str]
+    ) -> Dict[str, Dict]:
+        try:
+            return self.tewdb.select_by_keys(
+                "tblAlternate", "Recordname", recordnames
+            )
+        except Exception as e:
+            sk_log.error(
+                f"AlterFunctions fetch_alters_by_recordnames error: {e}"
+            )
+            raise e
+
     def fetch_alter_colvalue_by_colname(
         self, column_name: str
     ) -> List[Tuple[int, Any]]:
         try:
-            self.alter_table = self.tewdb.select(
-                f"SELECT uid, {column_name} FROM tblAlternate"
+            columns = self.tewdb.validate_columns(
+                "tblAlternate", ("uid", column_name)
             )
+            self.alter_table = self.tewdb.select(_build_alter_select(columns))
             return self.alter_table
         except Exception as e:
             sk_log.error(
@@ -67,11 +94,10 @@ class AlterFunctions:
         self, worker_uid: int
     ) -> List[str]:
         try:
-            self.alter_table = self.tewdb.select(
-                "SELECT Recordname FROM tblAlternate WHERE WorkerUID = ?",
-                (worker_uid,),
-            )
-            return self.alter_table
+            alters = self.tewdb.select_grouped(
+                _SQL_ALTER_KEYS, "WorkerUID"
+            ).get(worker_uid, ())
+            return column_values(alters, "Recordname")
         except Exception as e:
             sk_log.error(
                 f"AlterFunctions fetch_alter_recordname_list_by_worker_uid error: {e}"
@@ -80,9 +106,8 @@ class AlterFunctions:
 
     def fetch_all_alters_specific_cols(self, columns: List[str]) -> List[Tuple]:
         try:
-            self.alter_table = self.tewdb.select(
-                f"SELECT {', '.join(columns)} FROM tblAlternate"
-            )
+            columns = self.tewdb.validate_columns("tblAlternate", columns)
+            self.alter_table = self.tewdb.select(_build_alter_select(columns))
             return self.alter_table
         except Exception as e:
             sk_log.error(
@@ -92,9 +117,8 @@ class AlterFunctions:
 
     def fetch_alter_specific_cols(self, columns: List[str]) -> List[Tuple]:
         try:
-            self.alter_table = self.tewdb.select(
-                f"SELECT {', '.join(columns)} FROM tblAlternate"
-            )
+            columns = self.tewdb.validate_columns("tblAlternate", columns)
+            self.alter_table = self.tewdb.select(_build_alter_select(columns))
             return self.alter_table
         except Exception as e:
             sk_log.error(f"AlterFunctions fetch_alter_specific_cols error: {e}")
@@ -104,12 +128,13 @@ class AlterFunctions:
         self, recordname: str, columns: List[str]
     ) -> List[Tuple]:
         try:
-            cols = columns.copy()
-            if "uid" not in cols:
-                cols.insert(0, "uid")
-            query = f"SELECT {', '.join(cols)} FROM tblAlternate WHERE Recordname = ?"
+            cols = ("uid", *columns) if "uid" not in columns else columns
+            query = _build_alter_select(
+                self.tewdb.validate_columns("tblAlternate", cols),
+                " WHERE Recordname = ?",
+            )
             sk_log.debug(
-                f"Constructed query: {query} with params: [{recordname}]"
+                "Constructed query: %s with params: [%s]", query, recordname
             )
 
             self.alter_table = self.tewdb.select(query, [recordname])
@@ -122,11 +147,10 @@ class AlterFunctions:
 
     def fetch_alter_uid_list_by_worker_uid(self, worker_uid: int) -> List[int]:
         try:
-            self.alter_table = self.tewdb.select(
-                "SELECT uid FROM tblAlternate WHERE WorkerUID = ?",
-                (worker_uid,),
-            )
-            return self.alter_table
+            alters = self.tewdb.select_grouped(
+                _SQL_ALTER_KEYS, "WorkerUID"
+            ).get(worker_uid, ())
+            return column_values(alters, "uid")
         except Exception as e:
             sk_log.error(
                 f"AlterFunctions fetch_alter_uid_list_by_worker_uid error: {e}"
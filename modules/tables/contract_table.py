@@ -1,7 +1,23 @@
-from typing import Any, List, Tuple
-from database.tewdb import TEWDB
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Tuple
+from database import tewdb_pool
+from database.tewdb import TEWDB, column_values
 from utils.sk_logger import sk_log
 
+_CONTRACT_COLUMNS = frozenset(
+    {"UID", "FedUID", "WorkerUID", "Name", "Picture", "Nickname", "Shortname"}
+)
+_SQL_ALL_CONTRACTS = "SELECT * FROM tblContract"
+_SQL_CONTRACT_BY_UID = "SELECT * FROM tblContract WHERE uid = ?"
+_SQL_CONTRACT_KEYS = "SELECT uid, WorkerUID, FedUID FROM tblContract"
+
+
+@lru_cache(maxsize=64)
+def _build_contract_select(columns: Tuple[str, ...], where: str = "") -> str:
+    """Build a tblContract SELECT with bracketed names, once per column set."""
+    bracketed = ", ".join(f"[{col}]" for col in columns)
+    return f"SELECT {bracketed} FROM tblContract{where}"
+
 
 class ContractTable:
     def __init__(self) -> None:
@@ -15,7 +31,7 @@ class ContractTable:
 class ContractFunctions:
     def __init__(self) -> None:
         try:
-            self.tewdb = TEWDB()
+            self.tewdb = tewdb_pool.acquire()
         except Exception as e:
             sk_log.error(f"ContractFunctions __init__ error: {e}")
             raise e
@@ -27,12 +43,13 @@ class ContractFunctions:
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Context manager exit."""
         if hasattr(self, "tewdb"):
-            self.tewdb.close()
-            sk_log.debug("ContractFunctions database connection closed")
+            tewdb_pool.release(self.tewdb)
+            del self.tewdb
+            sk_log.debug("ContractFunctions database connection released")
 
     def fetch_all_contracts_in_table(self) -> List[Tuple]:
         try:
-            self.contract_table = self.tewdb.select("SELECT * FROM tblContract")
+            self.contract_table = self.tewdb.select_cached(_SQL_ALL_CONTRACTS)
             return self.contract_table
         except Exception as e:
             sk_log.error(
@@ -43,90 +60,72 @@ class ContractFunctions:
     def fetch_contract_by_uid(self, uid: int) -> Tuple:
         try:
             self.contract_table = self.tewdb.select(
-                "SELECT * FROM tblContract WHERE uid = ?", (uid,)
+                _SQL_CONTRACT_BY_UID, (uid,)
             )
             return self.contract_table
         except Exception as e:
             sk_log.error(f"ContractFunctions fetch_contract_by_uid error: {e}")
             raise e
 
+    def fetch_contracts_by_uids(self, uids: Iterable[int]) -> Dict[int, Dict]:
+        try:
+            return self.tewdb.select_by_keys("tblContract", "uid", uids)
+        except Exception as e:
+            sk_log.error(
+                f"ContractFunctions fetch_contracts_by_uids error: {e}"
+            )
+            raise e
+
     def fetch_all_contracts_specific_cols(
         self, columns: List[str]
     ) -> List[Tuple]:
         try:
-            valid_columns = [
-                "UID",
-                "FedUID",
-                "WorkerUID",
-                "Name",
-                "Picture",
-                "Nickname",
-                "Shortname",
-            ]
-            validated_columns = [col for col in columns if col in valid_columns]
-
+            validated_columns = tuple(
+                col for col in columns if col in _CONTRACT_COLUMNS
+            )
             if not validated_columns:
                 raise ValueError("No valid columns provided for the query")
-            try:
-                column_str = ", ".join(validated_columns)
-                query = f"SELECT {column_str} FROM tblContract"
-                sk_log.debug(f"Selecting columns (approach 1): {column_str}")
-                self.contract_table = self.tewdb.select(query)
-                return self.contract_table
-            except Exception as e1:
-                err_msg = f"Direct query failed, trying approach 2: {e1}"
-                sk_log.warning(err_msg)
-                try:
-                    cols_with_brackets = [
-                        f"[{col}]" for col in validated_columns
-                    ]
-                    column_str = ", ".join(cols_with_brackets)
-                    query = f"SELECT {column_str} FROM tblContract"
-                    sk_log.debug(
-                        f"Selecting columns (approach 2): {column_str}"
-                    )
-                    self.contract_table = self.tewdb.select(query)
-                    return self.contract_table
-                except Exception as e2:
-                    err_msg = (
-                        f"Qualified column names failed, trying fallback: {e2}"
-                    )
-                    sk_log.warning(err_msg)
-                    try:
-                        query = "SELECT * FROM tblContract"
-                        debug_msg = (
-                            "Selecting all columns and filtering (approach 3)"
-                        )
-                        sk_log.debug(debug_msg)
-                        results = self.tewdb.select(query)
-                        filtered_results = []
-                        for row in results:
-                            filtered_row = {
-                                col: row[col]
-                                for col in validated_columns
-                                if col in row
-                            }
-                            filtered_results.append(filtered_row)
-
-                        return filtered_results
-                    except Exception as e3:
-                        sk_log.error(f"All approaches failed: {e3}")
-                        raise e3
+            query = _build_contract_select(validated_columns)
+            sk_log.debug(
+                "Selecting columns: %s", ", ".join(validated_columns)
+            )
+            self.contract_table = self.tewdb.select(query)
+            return self.contract_table
         except Exception as e:
             sk_log.error(
                 f"ContractFunctions fetch_all_contracts_specific_cols error: {e}"
             )
             raise e
 
+    def fetch_all_contracts_specific_cols_as_tuples(
+        self, columns: List[str]
+    ) -> List[Tuple]:
+        try:
+            validated_columns = tuple(
+                col for col in columns if col in _CONTRACT_COLUMNS
+            )
+            if not validated_columns:
+                raise ValueError("No valid columns provided for the query")
+            return self.tewdb.select_tuples(
+                _build_contract_select(validated_columns)
+            )
+        except Exception as e:
+            sk_log.error(
+                "ContractFunctions fetch_all_contracts_specific_cols_as_tuples "
+                f"error: {e}"
+            )
+            raise e
+
     def fetch_contract_specific_cols(
         self, uid: int, columns: List[str]
     ) -> List[Tuple]:
         try:
-            cols = columns.copy()
-            if "uid" not in cols:
-                cols.insert(0, "uid")
-            query = f"SELECT {', '.join(cols)} FROM tblContract WHERE uid = ?"
-            sk_log.debug(f"Constructed query: {query} with params: [{uid}]")
+            cols = ("uid", *columns) if "uid" not in columns else columns
+            query = _build_contract_select(
+                self.tewdb.validate_columns("tblContract", cols),
+                " WHERE uid = ?",
+            )
+            sk_log.debug("Constructed query: %s with params: [%s]", query, uid)
 
             self.contract_table = self.tewdb.select(query, [uid])
             return self.contract_table
@@ -141,8 +140,11 @@ class ContractFunctions:
         self, column_name: str
     ) -> List[Tuple[int, Any]]:
         try:
+            columns = self.tewdb.validate_columns(
+                "tblContract", ("uid", column_name)
+            )
             self.contract_table = self.tewdb.select(
-                f"SELECT uid, {column_name} FROM tblContract"
+                _build_contract_select(columns)
             )
             return self.contract_table
         except Exception as e:
@@ -156,10 +158,10 @@ class ContractFunctions:
         self, worker_uid: int
     ) -> List[int]:
         try:
-            self.contract_table = self.tewdb.select(
-                "SELECT uid FROM tblContract WHERE WorkerUID = ?", (worker_uid,)
-            )
-            return [row[0] for row in self.contract_table]
+            contracts = self.tewdb.select_grouped(
+                _SQL_CONTRACT_KEYS, "WorkerUID"
+            ).get(worker_uid, ())
+            return column_values(contracts, "uid")
         except Exception as e:
             sk_log.error(
                 f"ContractFunctions fetch_all_contract_uids_by_worker_uid error: {e}"
@@ -170,11 +172,10 @@ class ContractFunctions:
         self, worker_uid: int
     ) -> List[int]:
         try:
-            self.contract_table = self.tewdb.select(
-                "SELECT FedUID FROM tblContract WHERE WorkerUID = ?",
-                (worker_uid,),
-            )
-            return [row[0] for row in self.contract_table]
+            contracts = self.tewdb.select_grouped(
+                _SQL_CONTRACT_KEYS, "WorkerUID"
+            ).get(worker_uid, ())
+            return column_values(contracts, "FedUID")
         except Exception as e:
             sk_log.error(
                 f"ContractFunctions fetch_all_contract_fedids_by_worker_uid error: {e}"
@@ -183,10 +184,10 @@ class ContractFunctions:
 
     def fetch_all_worker_uids_by_fed_uid(self, fed_uid: int) -> List[int]:
         try:
-            self.contract_table = self.tewdb.select(
-                "SELECT WorkerUID FROM tblContract WHERE FedUID = ?", (fed_uid,)
-            )
-            return [row[0] for row in self.contract_table]
+            contracts = self.tewdb.select_grouped(
+                _SQL_CONTRACT_KEYS, "FedUID"
+            ).get(fed_uid, ())
+            return column_values(contracts, "WorkerUID")
         except Exception as e:
             sk_log.error(
                 f"ContractFunctions fetch_all_worker_uids_by_fed_uid error: {e}"
@@ -1,7 +1,20 @@
-from typing import Any, List, Tuple
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Tuple
+from database import tewdb_pool
 from database.tewdb import TEWDB
 from utils.sk_logger import sk_log
 
+_SQL_ALL_FEDS = "SELECT * FROM tblFed"
+_SQL_FED_BY_UID = "SELECT * FROM tblFed WHERE uid = ?"
+_SQL_FEDNAME_BY_UID = "SELECT Name FROM tblFed WHERE uid = ?"
+_SQL_FEDINITIALS_BY_UID = "SELECT Initials FROM tblFed WHERE uid = ?"
+
+
+@lru_cache(maxsize=64)
+def _build_fed_select(columns: Tuple[str, ...], where: str = "") -> str:
+    """Build a tblFed SELECT for validated columns, once per column set."""
+    return f"SELECT {', '.join(columns)} FROM tblFed{where}"
+
 
 class FedTable:
     def __init__(self) -> None:
@@ -15,7 +28,7 @@ class FedTable:
 class FedFunctions:
     def __init__(self) -> None:
         try:
-            self.tewdb = TEWDB()
+            self.tewdb = tewdb_pool.acquire()
         except Exception as e:
             sk_log.error(f"FedFunctions __init__ error: {e}")
             raise e
@@ -27,12 +40,13 @@ class FedFunctions:
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Context manager exit."""
         if hasattr(self, "tewdb"):
-            self.tewdb.close()
-            sk_log.debug("FedFunctions database connection closed")
+            tewdb_pool.release(self.tewdb)
+            del self.tewdb
+            sk_log.debug("FedFunctions database connection released")
 
     def fetch_all_feds_in_table(self) -> List[Tuple]:
         try:
-            self.fed_table = self.tewdb.select("SELECT * FROM tblFed")
+            self.fed_table = self.tewdb.select_cached(_SQL_ALL_FEDS)
             return self.fed_table
         except Exception as e:
             sk_log.error(f"FedFunctions fetch_all_feds_in_table error: {e}")
@@ -40,19 +54,22 @@ class FedFunctions:
 
     def fetch_fed_by_uid(self, uid: int) -> Tuple:
         try:
-            self.fed_table = self.tewdb.select(
-                "SELECT * FROM tblFed WHERE uid = ?", (uid,)
-            )
+            self.fed_table = self.tewdb.select(_SQL_FED_BY_UID, (uid,))
             return self.fed_table
         except Exception as e:
             sk_log.error(f"FedFunctions fetch_fed_by_uid error: {e}")
             raise e
 
+    def fetch_feds_by_uids(self, uids: Iterable[int]) -> Dict[int, Dict]:
+        try:
+            return self.tewdb.select_by_keys("tblFed", "uid", uids)
+        except Exception as e:
+            sk_log.error(f"FedFunctions fetch_feds_by_uids error: {e}")
+            raise e
+
     def fetch_fedname_by_uid(self, uid: int) -> str:
         try:
-            self.fed_table = self.tewdb.select(
-                "SELECT Name FROM tblFed WHERE uid = ?", (uid,)
-            )
+            self.fed_table = self.tewdb.select(_SQL_FEDNAME_BY_UID, (uid,))
             return self.fed_table[0][0]
         except Exception as e:
             sk_log.error(f"FedFunctions fetch_fedname_by_uid error: {e}")
@@ -60,9 +77,7 @@ class FedFunctions:
 
     def fetch_fedinitials_by_uid(self, uid: int) -> str:
         try:
-            self.fed_table = self.tewdb.select(
-                "SELECT Initials FROM tblFed WHERE uid = ?", (uid,)
-            )
+            self.fed_table = self.tewdb.select(_SQL_FEDINITIALS_BY_UID, (uid,))
             return self.fed_table[0][0]
         except Exception as e:
             sk_log.error(f"FedFunctions fetch_fedinitials_by_uid error: {e}")
@@ -70,9 +85,8 @@ class FedFunctions:
 
     def fetch_all_feds_specific_cols(self, columns: List[str]) -> List[Tuple]:
         try:
-            self.fed_table = self.tewdb.select(
-                f"SELECT {', '.join(columns)} FROM tblFed"
-            )
+            columns = self.tewdb.validate_columns("tblFed", columns)
+            self.fed_table = self.tewdb.select(_build_fed_select(columns))
             return self.fed_table
         except Exception as e:
             sk_log.error(
@@ -84,11 +98,12 @@ class FedFunctions:
         self, uid: int, columns: List[str]
     ) -> List[Tuple]:
         try:
-            cols = columns.copy()
-            if "uid" not in cols:
-                cols.insert(0, "uid")
-            query = f"SELECT {', '.join(cols)} FROM tblFed WHERE uid = ?"
-            sk_log.debug(f"Constructed query: {query} with params: [{uid}]")
+            cols = ("uid", *columns) if "uid" not in columns else columns
+            query = _build_fed_select(
+                self.tewdb.validate_columns("tblFed", cols),
+                " WHERE uid = ?",
+            )
+            sk_log.debug("Constructed query: %s with params: [%s]", query, uid)
 
             self.fed_table = self.tewdb.select(query, [uid])
             return self.fed_table
@@ -102,9 +117,10 @@ class FedFunctions:
         self, column_name: str
     ) -> List[Tuple[int, Any]]:
         try:
-            self.fed_table = self.tewdb.select(
-                f"SELECT uid, {column_name} FROM tblFed"
+            columns = self.tewdb.validate_columns(
+                "tblFed", ("uid", column_name)
             )
+            self.fed_table = self.tewdb.select(_build_fed_select(columns))
             return self.fed_table
         except Exception as e:
             sk_log.error(
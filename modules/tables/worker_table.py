@@ -1,7 +1,18 @@
-from typing import Any, List, Tuple
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Tuple
+from database import tewdb_pool
 from database.tewdb import TEWDB
 from utils.sk_logger import sk_log
 
+_SQL_ALL_WORKERS = "SELECT * FROM tblWorker"
+_SQL_WORKER_BY_UID = "SELECT * FROM tblWorker WHERE uid = ?"
+
+
+@lru_cache(maxsize=64)
+def _build_worker_select(columns: Tuple[str, ...], where: str = "") -> str:
+    """Build a tblWorker SELECT for validated columns, once per column set."""
+    return f"SELECT {', '.join(columns)} FROM tblWorker{where}"
+
 
 class WorkerTable:
     def __init__(self) -> None:
@@ -15,7 +26,7 @@ class WorkerTable:
 class WorkerFunctions:
     def __init__(self) -> None:
         try:
-            self.tewdb = TEWDB()
+            self.tewdb = tewdb_pool.acquire()
         except Exception as e:
             sk_log.error(f"WorkerFunctions __init__ error: {e}")
             raise e
@@ -27,12 +38,13 @@ class WorkerFunctions:
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Context manager exit."""
         if hasattr(self, "tewdb"):
-            self.tewdb.close()
-            sk_log.debug("WorkerFunctions database connection closed")
+            tewdb_pool.release(self.tewdb)
+            del self.tewdb
+            sk_log.debug("WorkerFunctions database connection released")
 
     def fetch_all_workers_in_table(self) -> List[Tuple]:
         try:
-            self.worker_table = self.tewdb.select("SELECT * FROM tblWorker")
+            self.worker_table = self.tewdb.select_cached(_SQL_ALL_WORKERS)
             return self.worker_table
         except Exception as e:
             sk_log.error(
@@ -42,20 +54,26 @@ class WorkerFunctions:
 
     def fetch_worker_by_uid(self, uid: int) -> Tuple:
         try:
-            self.worker_table = self.tewdb.select(
-                "SELECT * FROM tblWorker WHERE uid = ?", (uid,)
-            )
+            self.worker_table = self.tewdb.select(_SQL_WORKER_BY_UID, (uid,))
             return self.worker_table
         except Exception as e:
             sk_log.error(f"WorkerFunctions fetch_worker_by_uid error: {e}")
             raise e
 
+    def fetch_workers_by_uids(self, uids: Iterable[int]) -> Dict[int, Dict]:
+        try:
+            return self.tewdb.select_by_keys("tblWorker", "uid", uids)
+        except Exception as e:
+            sk_log.error(f"WorkerFunctions fetch_workers_by_uids error: {e}")
+            raise e
+
     def fetch_all_workers_specific_cols(
         self, columns: List[str]
     ) -> List[Tuple]:
         try:
+            columns = self.tewdb.validate_columns("tblWorker", columns)
             self.worker_table = self.tewdb.select(
-                f"SELECT {', '.join(columns)} FROM tblWorker"
+                _build_worker_select(columns)
             )
             return self.worker_table
         except Exception as e:
@@ -68,11 +86,12 @@ class WorkerFunctions:
         self, uid: int, columns: List[str]
     ) -> List[Tuple]:
         try:
-            cols = columns.copy()
-            if "uid" not in cols:
-                cols.insert(0, "uid")
-            query = f"SELECT {', '.join(cols)} FROM tblWorker WHERE uid = ?"
-            sk_log.debug(f"Constructed query: {query} with params: [{uid}]")
+            cols = ("uid", *columns) if "uid" not in columns else columns
+            query = _build_worker_select(
+                self.tewdb.validate_columns("tblWorker", cols),
+                " WHERE uid = ?",
+            )
+            sk_log.debug("Constructed query: %s with params: [%s]", query, uid)
 
             self.worker_table = self.tewdb.select(query, [uid])
             return self.worker_table
@@ -86,8 +105,11 @@ class WorkerFunctions:
         self, column_name: str
     ) -> List[Tuple[int, Any]]:
         try:
+            columns = self.tewdb.validate_columns(
+                "tblWorker", ("uid", column_name)
+            )
             self.worker_table = self.tewdb.select(
-                f"SELECT uid, {column_name} FROM tblWorker"
+                _build_worker_select(columns)
             )
             return self.worker_table
         except Exception as e:
@@ -96,3 +118,44 @@ class WorkerFunctions:
                 f"error: {e}"
             )
             raise e
+
+
+def load_worker_bundle(worker_uid: int) -> Dict[str, Any]:
+    """Fetch a worker with its alters, contracts and feds in parallel.
+
+    Args:
+        worker_uid (int): The worker's uid.
+
+    Returns:
+        Dict[str, Any]: The worker rows plus alter recordnames, contract
+            uids and fed uids for that worker.
+    """
+    from modules.tables.alter_table import AlterFunctions
+    from modules.tables.contract_table import ContractFunctions
+
+    def worker() -> List[Dict]:
+        with WorkerFunctions() as functions:
+            return functions.fetch_worker_by_uid(worker_uid)
+
+    def alters() -> List[str]:
+        with AlterFunctions() as functions:
+            return functions.fetch_alter_recordname_list_by_worker_uid(
+                worker_uid
+            )
+
+    def contracts() -> List[int]:
+        with ContractFunctions() as functions:
+            return functions.fetch_all_contract_uids_by_worker_uid(worker_uid)
+
+    def feds() -> List[int]:
+        with ContractFunctions() as functions:
+            return functions.fetch_all_contract_fedids_by_worker_uid(
+                worker_uid
+            )
+
+    try:
+        results = tewdb_pool.bulk_fetch((worker, alters, contracts, feds))
+        return dict(zip(("worker", "alters", "contracts", "feds"), results))
+    except Exception as e:
+        sk_log.error(f"load_worker_bundle error: {e}")
+        raise e
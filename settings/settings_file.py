@@ -1,15 +1,60 @@
 import datetime
+import logging
+import os
 import socket
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, Optional, Tuple
 
 from database.sqlite_path import set_db_path
 from database.sqlite import SQLiteDatabase
 
+SYNCHRONOUS_MODES = frozenset({"NORMAL", "FULL"})
+SQLITE_MAX_VARIABLES = 999
+
+_SQL_GET_VALUE = "SELECT value FROM settings WHERE key = ?"
+_SQL_SET_VALUE = (
+    "INSERT INTO settings (key, value) VALUES (?, ?) "
+    "ON CONFLICT(key) DO UPDATE SET value = excluded.value"
+)
+
+_value_cache: Dict[str, Optional[str]] = {}
+
+
+_DEBUG_ENABLED = os.getenv("DEBUG", "false").lower() == "true"
+_HOSTNAME = socket.gethostname().split(".")[0].lower()
+
+
+@lru_cache(maxsize=1)
+def _build_fallback_logger(hostname: str) -> logging.Logger:
+    """Build the logger used when utils.sk_logger cannot be imported.
+
+    Cached so the handlers are attached, and the log directory created,
+    only once per process.
+    """
+    fallback_logger = logging.getLogger("sqlite_fallback")
+    formatter = logging.Formatter("%(levelname)s: %(message)s")
+    handler = logging.StreamHandler()
+    handler.setFormatter(formatter)
+    fallback_logger.addHandler(handler)
+    fallback_logger.setLevel(logging.DEBUG if _DEBUG_ENABLED else logging.INFO)
+    log_dir = "./.logs/"
+    Path(log_dir).mkdir(parents=True, exist_ok=True)
+    log_file_name = (
+        f"{hostname}-{datetime.datetime.now().strftime('%Y%m%d')}.log"
+    )
+    file_handler = logging.FileHandler(
+        os.path.join(log_dir, log_file_name), mode="a"
+    )
+    file_handler.setFormatter(formatter)
+    fallback_logger.addHandler(file_handler)
+    return fallback_logger
+
 
 class SettingsManager:
     def __init__(self) -> None:
-        self.hostname = socket.gethostname().split(".")[0].lower()
+        self.hostname = _HOSTNAME
         self.settings_path = Path(
             f"{self.hostname}.{fetch_settings_file_ext()}"
         )
@@ -17,6 +62,8 @@ class SettingsManager:
         self.db = None
         self._logger = None
         self._initialized = False
+        self._path_exists = False
+        self._shared = False
         self._ensure_initialized()
 
     @property
@@ -28,197 +75,246 @@ class SettingsManager:
 
                 self._logger = sk_log
             except ImportError:
-                import logging
-                import os
-
-                fallback_logger = logging.getLogger("sqlite_fallback")
-                if not fallback_logger.handlers:
-                    handler = logging.StreamHandler()
-                    handler.setFormatter(
-                        logging.Formatter("%(levelname)s: %(message)s")
-                    )
-                    fallback_logger.addHandler(handler)
-                    debug_enabled = (
-                        os.getenv("DEBUG", "false").lower() == "true"
-                    )
-                    fallback_logger.setLevel(
-                        logging.DEBUG if debug_enabled else logging.INFO
-                    )
-                    log_dir = "./.logs/"
-                    Path(log_dir).mkdir(parents=True, exist_ok=True)
-                    log_file_name = (
-                        f"{self.hostname}-"
-                        f"{datetime.datetime.now().strftime('%Y%m%d')}.log"
-                    )
-                    file_handler = logging.FileHandler(
-                        os.path.join(log_dir, log_file_name), mode="a"
-                    )
-                    file_handler.setFormatter(
-                        logging.Formatter("%(levelname)s: %(message)s")
-                    )
-                    fallback_logger.addHandler(file_handler)
-                    self._logger = fallback_logger
+                self._logger = _build_fallback_logger(self.hostname)
         return self._logger
 
     def _ensure_initialized(self) -> None:
         if not self._initialized:
             self.initialize_settings()
             self._initialized = True
+        elif self.db is None:
+            self.load_settings()
 
     def get_value(self, key: str) -> str:
+        """Get a value from the settings database.
+
+        Values are cached per process; set_value() keeps the cache current.
+        """
+        try:
+            return _value_cache[key]
+        except KeyError:
+            pass
         self._ensure_initialized()
-        """Get a value from the settings database."""
         self.lazy_sk_log.debug(f"Getting value for key: {key}")
-        return (
-            self.db.execute_query(
-                "SELECT value FROM settings WHERE key = ?", (key,)
-            )[0][0]
-            if self.db.execute_query(
-                "SELECT value FROM settings WHERE key = ?", (key,)
-            )
-            else None
-        )
+        rows = self.db.execute_query(_SQL_GET_VALUE, (key,))
+        value = rows[0][0] if rows else None
+        _value_cache[key] = value
+        return value
 
     def set_value(self, key: str, value: str) -> None:
-        self._ensure_initialized()
         """Set a value in the settings database."""
+        self._ensure_initialized()
         self.lazy_sk_log.debug(f"Setting value for key: {key}")
-        self.db.execute_write(
-            (
-                "INSERT INTO settings (key, value) VALUES (?, ?) ON "
-                "CONFLICT(key) DO UPDATE SET value = ?"
-            ),
-            (key, value, value),
-        )
+        try:
+            self.db.execute_write(_SQL_SET_VALUE, (key, value))
+        finally:
+            _value_cache.pop(key, None)
+        _value_cache[key] = value
+        if key == "sqlite_synchronous":
+            self._apply_pragmas()
+
+    def set_many(self, pairs: Iterable[Tuple[str, str]]) -> None:
+        """Set several values in the settings database in one transaction.
+
+        Args:
+            pairs (Iterable[Tuple[str, str]]): (key, value) pairs to store.
+        """
+        self._ensure_initialized()
+        pairs = list(pairs)
+        self.lazy_sk_log.debug(f"Setting {len(pairs)} values")
+        try:
+            with self.db.transaction():
+                self.db.execute_many(_SQL_SET_VALUE, pairs)
+        finally:
+            for key, _ in pairs:
+                _value_cache.pop(key, None)
+        _value_cache.update(pairs)
+        if any(key == "sqlite_synchronous" for key, _ in pairs):
+            self._apply_pragmas()
+
+    def _apply_pragmas(self) -> None:
+        """Apply the configured fsync level to the local database.
+
+        The pool already opens connections in WAL mode with
+        synchronous=NORMAL; the sqlite_synchronous setting can raise that
+        back to FULL.
+        """
+        rows = self.db.execute_query(_SQL_GET_VALUE, ("sqlite_synchronous",))
+        mode = str(rows[0][0]).upper() if rows else "NORMAL"
+        if mode not in SYNCHRONOUS_MODES:
+            self.lazy_sk_log.warning(
+                f"Ignoring unknown sqlite_synchronous value: {mode}"
+            )
+            mode = "NORMAL"
+        self.db.execute_write(f"PRAGMA synchronous = {mode}")
 
     def _update_table_schema(self) -> None:
-        """Update existing tables with new columns if they're missing."""
+        """Update existing tables with new columns if they're missing.
+
+        The schema version is stored in PRAGMA user_version, so once the
+        migrations have run this costs a single read.
+        """
+        from settings.settings_list import SETTINGS_SCHEMA_VERSION
+
+        user_version = self.db.execute_query("PRAGMA user_version")[0][0]
+        if user_version == SETTINGS_SCHEMA_VERSION:
+            return
         self.lazy_sk_log.debug("Checking for schema updates")
-        settings_cols = {
-            col[1]
-            for col in self.db.execute_query("PRAGMA table_info(settings)")
-        }
-        init_cols = {
-            col[1]
-            for col in self.db.execute_query(
-                "PRAGMA table_info(settings_initialization)"
-            )
-        }
-        if "last_modified" not in settings_cols:
-            self.lazy_sk_log.debug(
-                "Adding last_modified column to settings table"
-            )
-            self.db.execute_write(
-                "ALTER TABLE settings ADD COLUMN last_modified "
-                "TIMESTAMP DEFAULT CURRENT_TIMESTAMP"
-            )
-        if "version" not in init_cols:
-            self.lazy_sk_log.debug(
-                "Adding version column to settings_initialization table"
-            )
-            self.db.execute_write(
-                "ALTER TABLE settings_initialization ADD COLUMN version "
-                "TEXT DEFAULT '1.0'"
-            )
-        if "initialized_by" not in init_cols:
-            self.lazy_sk_log.debug(
-                "Adding initialized_by column to settings_initialization table"
-            )
+        with self.db.transaction():
+            settings_cols = {
+                col[1]
+                for col in self.db.execute_query("PRAGMA table_info(settings)")
+            }
+            init_cols = {
+                col[1]
+                for col in self.db.execute_query(
+                    "PRAGMA table_info(settings_initialization)"
+                )
+            }
+            if "last_modified" not in settings_cols:
+                self.lazy_sk_log.debug(
+                    "Adding last_modified column to settings table"
+                )
+                self.db.execute_write(
+                    "ALTER TABLE settings ADD COLUMN last_modified "
+                    "TIMESTAMP DEFAULT CURRENT_TIMESTAMP"
+                )
+            if "version" not in init_cols:
+                self.lazy_sk_log.debug(
+                    "Adding version column to settings_initialization table"
+                )
+                self.db.execute_write(
+                    "ALTER TABLE settings_initialization ADD COLUMN version "
+                    "TEXT DEFAULT '1.0'"
+                )
+            if "initialized_by" not in init_cols:
+                self.lazy_sk_log.debug(
+                    "Adding initialized_by column to "
+                    "settings_initialization table"
+                )
+                self.db.execute_write(
+                    "ALTER TABLE settings_initialization ADD COLUMN "
+                    "initialized_by TEXT"
+                )
             self.db.execute_write(
-                "ALTER TABLE settings_initialization ADD COLUMN "
-                "initialized_by TEXT"
+                f"PRAGMA user_version = {SETTINGS_SCHEMA_VERSION:d}"
             )
 
     def initialize_settings(self) -> None:
         """Create and initialize settings database if it doesn't exist."""
         self.lazy_sk_log.debug(f"Initializing settings at {self.settings_path}")
         self.db = SQLiteDatabase(str(self.settings_path))
-        existing_tables = {
-            row[0]
-            for row in self.db.execute_query(
-                "SELECT name FROM sqlite_master WHERE type='table'"
-            )
-        }
-        if "settings" not in existing_tables:
-            self.lazy_sk_log.debug("Creating settings table")
-            self.db.create_table(
-                "settings",
-                {
-                    "key": "TEXT PRIMARY KEY",
-                    "value": "TEXT",
-                    "last_modified": "TIMESTAMP DEFAULT CURRENT_TIMESTAMP",
-                },
-            )
-        current_settings = {
-            row[0]: row[1]
-            for row in self.db.execute_query("SELECT key, value FROM settings")
-        }
-        from settings.settings_list import DefaultSettings
-
-        defaults = DefaultSettings(self.hostname)
-        default_settings = defaults.get_defaults_list()
-        missing_settings = [
-            (key, value)
-            for key, value in default_settings
-            if key not in current_settings
-        ]
-        if missing_settings:
-            self.lazy_sk_log.debug(
-                f"Adding {len(missing_settings)} missing settings"
-            )
-            self.db.execute_many(
-                "INSERT INTO settings (key, value) VALUES (?, ?)",
-                missing_settings,
-            )
-        if "settings_initialization" not in existing_tables:
-            self.lazy_sk_log.debug("Creating settings_initialization table")
-            self.db.create_table(
-                "settings_initialization",
-                {
-                    "id": "INTEGER PRIMARY KEY",
-                    "initialization_date": "TIMESTAMP DEFAULT CURRENT_TIMESTAMP",
-                    "version": "TEXT DEFAULT '1.0'",
-                    "initialized_by": "TEXT",
-                },
-            )
-        self._update_table_schema()
-
-        init_count = self.db.get_row_count("settings_initialization")
-        if init_count == 0:
-            self.lazy_sk_log.debug("Inserting initialization record")
-            self.db.insert(
-                "settings_initialization",
-                {"initialization_date": datetime.datetime.now().isoformat()},
-            )
+        with self.db.transaction():
+            existing_tables = {
+                row[0]
+                for row in self.db.execute_query(
+                    "SELECT name FROM sqlite_master WHERE type='table'"
+                )
+            }
+            if "settings" not in existing_tables:
+                self.lazy_sk_log.debug("Creating settings table")
+                self.db.create_table(
+                    "settings",
+                    {
+                        "key": "TEXT PRIMARY KEY",
+                        "value": "TEXT",
+                        "last_modified": "TIMESTAMP DEFAULT CURRENT_TIMESTAMP",
+                    },
+                )
+            from settings.settings_list import DefaultSettings
+
+            defaults = DefaultSettings(self.hostname)
+            default_settings = defaults.get_defaults_list()
+            placeholders = ", ".join("?" * len(default_settings))
+            present = {
+                row[0]
+                for row in self.db.execute_query(
+                    f"SELECT key FROM settings WHERE key IN ({placeholders})",
+                    tuple(key for key, _ in default_settings),
+                )
+            }
+            missing_settings = [
+                (key, value)
+                for key, value in default_settings
+                if key not in present
+            ]
+            if missing_settings:
+                self.lazy_sk_log.debug(
+                    f"Adding {len(missing_settings)} missing settings"
+                )
+                self.db.insert_many(
+                    "settings",
+                    ("key", "value"),
+                    missing_settings,
+                    rows_per_statement=min(
+                        len(missing_settings), SQLITE_MAX_VARIABLES // 2
+                    ),
+                )
+            if "settings_initialization" not in existing_tables:
+                self.lazy_sk_log.debug(
+                    "Creating settings_initialization table"
+                )
+                self.db.create_table(
+                    "settings_initialization",
+                    {
+                        "id": "INTEGER PRIMARY KEY",
+                        "initialization_date": (
+                            "TIMESTAMP DEFAULT CURRENT_TIMESTAMP"
+                        ),
+                        "version": "TEXT DEFAULT '1.0'",
+                        "initialized_by": "TEXT",
+                    },
+                )
+            self._update_table_schema()
+
+            init_count = self.db.get_row_count("settings_initialization")
+            if init_count == 0:
+                self.lazy_sk_log.debug("Inserting initialization record")
+                self.db.insert(
+                    "settings_initialization",
+                    {
+                        "initialization_date": (
+                            datetime.datetime.now().isoformat()
+                        )
+                    },
+                )
+        self._apply_pragmas()
 
     def load_settings(self) -> SQLiteDatabase:
         """
         Load settings database.
         :return: Database connection to settings.
         """
+        if self.db is not None and self._path_exists:
+            return self.db
         self.lazy_sk_log.debug(f"Loading settings from {self.settings_path}")
         if not self.settings_path.exists():
             self.initialize_settings()
         elif self.db is None:
             self.db = SQLiteDatabase(str(self.settings_path))
+            self._apply_pragmas()
+        self._path_exists = True
         self.lazy_sk_log.debug("Settings loaded successfully")
         return self.db
 
     def get_initialization_date(self) -> Optional[str]:
         """Get settings initialization date."""
         self.lazy_sk_log.debug("Getting settings initialization date")
-        db = self.load_settings()
-        result = db.execute_query(
+        self._ensure_initialized()
+        result = self.db.execute_query(
             "SELECT initialization_date FROM settings_initialization LIMIT 1"
         )
-        self.lazy_sk_log.debug(f"Settings initialization date: {result[0][0]}")
-        return result[0][0] if result else None
+        initialization_date = result[0][0] if result else None
+        self.lazy_sk_log.debug(
+            f"Settings initialization date: {initialization_date}"
+        )
+        return initialization_date
 
     def update_initialization_date(self) -> None:
         """Update settings initialization date."""
         self.lazy_sk_log.debug("Updating settings initialization date")
-        db = self.load_settings()
-        db.execute_write(
+        self._ensure_initialized()
+        self.db.execute_write(
             """
             UPDATE settings_initialization 
             SET initialization_date = ?
@@ -231,10 +327,17 @@ class SettingsManager:
         self.lazy_sk_log.debug("Settings initialization date updated")
 
     def close(self) -> None:
-        """Close database connection."""
+        """Close database connection.
+
+        Does nothing on the shared instance from get_settings(); use
+        close_settings() for that.
+        """
+        if self._shared:
+            return
         if self.db:
             self.db.close()
             self.db = None
+        self._path_exists = False
 
     def __enter__(self) -> "SettingsManager":
         """Context manager entry."""
@@ -246,6 +349,36 @@ class SettingsManager:
         self.close()
 
 
+_instance: Optional[SettingsManager] = None
+_instance_lock = threading.Lock()
+
+
+def get_settings() -> SettingsManager:
+    """Return the process-wide SettingsManager, creating it on first use.
+
+    Returns:
+        SettingsManager: The shared, initialised settings manager.
+    """
+    global _instance
+    if _instance is None:
+        with _instance_lock:
+            if _instance is None:
+                manager = SettingsManager()
+                manager._shared = True
+                _instance = manager
+    return _instance
+
+
+def close_settings() -> None:
+    """Close the shared SettingsManager's database connection."""
+    global _instance
+    with _instance_lock:
+        manager, _instance = _instance, None
+    if manager is not None:
+        manager._shared = False
+        manager.close()
+
+
 def fetch_settings_file_ext() -> str:
     from settings.settings_list import SETTINGS_FILE_EXT
 
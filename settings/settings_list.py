@@ -1,12 +1,23 @@
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Union
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from utils.sk_logger import sk_log
 
 APP_VERSION = "0.0.1"
 SETTINGS_FILE_EXT = "sktew9ee"
+# Bump whenever SettingsManager._update_table_schema() gains a migration.
+SETTINGS_SCHEMA_VERSION = 1
 
 
 class SettingWidgetType(Enum):
@@ -17,7 +28,7 @@ class SettingWidgetType(Enum):
     NUMBER = "number"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Setting:
     key: str
     default_value: Any
@@ -26,14 +37,194 @@ class Setting:
     required: bool = True
     label: str = ""
     widget_type: SettingWidgetType = SettingWidgetType.TEXT
-    options: List[str] = None
+    options: Tuple[str, ...] = ()
     visible: bool = True
 
-    def __post_init__(self):
-        if not self.label:
-            self.label = self.key.replace("_", " ").title()
-        if self.options is None:
-            self.options = []
+
+def _is_int(value: Any, required: bool) -> bool:
+    """Whether int() will accept value, as convert_value() calls it."""
+    if value == "":
+        return True
+    try:
+        int(value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+# Value checks per value_type, called as validator(value, required).
+# Types without an entry accept any value.
+_VALIDATORS: Dict[str, Callable[[str, bool], bool]] = {
+    "bool": lambda value, required: str(value).lower() in ("true", "false"),
+    "int": _is_int,
+    "path": lambda value, required: value != "" or not required,
+}
+
+
+def _build_static_settings() -> Tuple[Setting, ...]:
+    """Build the settings that do not depend on the host."""
+    return (
+        Setting(
+            "debug_mode",
+            "false",
+            "Enable debug mode",
+            value_type="bool",
+            widget_type=SettingWidgetType.CHECKBOX,
+            label="Debug Mode",
+            visible=True,
+        ),
+        Setting(
+            "app_version",
+            APP_VERSION,
+            "Application version",
+            required=True,
+            widget_type=SettingWidgetType.TEXT,
+            visible=False,
+            label="Application Version",
+        ),
+        Setting(
+            "settings_file_ext",
+            ".sktew9ee",
+            "Settings file extension",
+            required=True,
+            widget_type=SettingWidgetType.TEXT,
+            visible=False,
+            label="Settings File Extension",
+        ),
+        Setting(
+            "database_mode",
+            "skydbapi",
+            "Database connection mode",
+            required=True,
+            widget_type=SettingWidgetType.RADIO,
+            options=("skydbapi", "direct"),
+            label="Select Database Mode",
+        ),
+        Setting(
+            "log_cli",
+            "true",
+            "Enable console logging",
+            value_type="bool",
+            widget_type=SettingWidgetType.CHECKBOX,
+            label="Console Logging",
+        ),
+        Setting(
+            "log_file",
+            "true",
+            "Enable file logging",
+            value_type="bool",
+            widget_type=SettingWidgetType.CHECKBOX,
+            label="File Logging",
+        ),
+        Setting(
+            "log_dir",
+            "./.logs/",
+            "Directory for log files",
+            value_type="path",
+            widget_type=SettingWidgetType.PATH,
+            label="Log Directory",
+        ),
+        Setting(
+            "skydb_api_ssl",
+            "false",
+            "Use SSL for API connection",
+            value_type="bool",
+            widget_type=SettingWidgetType.CHECKBOX,
+            label="Use SSL for SKyDBAPI connection",
+        ),
+        Setting(
+            "skydb_api_server",
+            "localhost",
+            "SkyDB API server address",
+            widget_type=SettingWidgetType.TEXT,
+            label="SKyDB API Server Address",
+        ),
+        Setting(
+            "skydb_api_port",
+            "9020",
+            "SkyDB API server port",
+            value_type="int",
+            widget_type=SettingWidgetType.NUMBER,
+            label="SKyDB API Server Port",
+        ),
+        Setting(
+            "tew9_core_path",
+            "C:\\TEW9\\",
+            "Path to TEW9 installation",
+            value_type="path",
+            widget_type=SettingWidgetType.PATH,
+            label="TEW9 Core Installation Path",
+        ),
+        Setting(
+            "tew9_game_database_name",
+            "Default",
+            "TEW9 Active Database Name",
+            value_type="str",
+            widget_type=SettingWidgetType.TEXT,
+            label="TEW9 Active Database Name",
+        ),
+        Setting(
+            "tew9_pictures_pack_name",
+            "Default",
+            "TEW9 Pictures Pack Name",
+            value_type="str",
+            widget_type=SettingWidgetType.TEXT,
+            label="TEW9 Picture Pack Name",
+        ),
+        Setting(
+            "tew9_full_db_path_override",
+            "",
+            "Override TEW9 full database path",
+            value_type="path",
+            widget_type=SettingWidgetType.PATH,
+            required=False,
+            label="TEW9 Full Database Path Override",
+        ),
+        Setting(
+            "tew9_full_pictures_path_override",
+            "",
+            "Override TEW9 full pictures path",
+            value_type="path",
+            widget_type=SettingWidgetType.PATH,
+            required=False,
+            label="TEW9 Full Pictures Path Override",
+        ),
+        Setting(
+            "default_image_extension",
+            ".gif",
+            "Default image extension",
+            value_type="str",
+            widget_type=SettingWidgetType.TEXT,
+            label="Default Image Extension",
+        ),
+        Setting(
+            "title_screen_image_path",
+            "./bin/title.png",
+            "Path to title screen image",
+            value_type="path",
+            widget_type=SettingWidgetType.PATH,
+            label="Title Screen Image",
+        ),
+        Setting(
+            "photo_cache_max_age",
+            "720",
+            "Maximum age of photo cache in hours",
+            value_type="int",
+            widget_type=SettingWidgetType.NUMBER,
+            label="Photo Cache Maximum Age",
+        ),
+        Setting(
+            "sqlite_synchronous",
+            "NORMAL",
+            "Local database fsync level",
+            widget_type=SettingWidgetType.RADIO,
+            options=("NORMAL", "FULL"),
+            label="Local Database Sync Mode",
+        ),
+    )
+
+
+_STATIC_SETTINGS = _build_static_settings()
 
 
 class DefaultSettings:
@@ -44,16 +235,7 @@ class DefaultSettings:
     def _initialize_settings(self) -> None:
         """Initialize all application settings."""
         try:
-            self._settings = [
-                Setting(
-                    "debug_mode",
-                    "false",
-                    "Enable debug mode",
-                    value_type="bool",
-                    widget_type=SettingWidgetType.CHECKBOX,
-                    label="Debug Mode",
-                    visible=True,
-                ),
+            self._settings = (
                 Setting(
                     "hostname",
                     self.hostname,
@@ -63,184 +245,62 @@ class DefaultSettings:
                     visible=False,
                     label="Computer Name",
                 ),
-                Setting(
-                    "app_version",
-                    APP_VERSION,
-                    "Application version",
-                    required=True,
-                    widget_type=SettingWidgetType.TEXT,
-                    visible=False,
-                    label="Application Version",
-                ),
-                Setting(
-                    "settings_file_ext",
-                    ".sktew9ee",
-                    "Settings file extension",
-                    required=True,
-                    widget_type=SettingWidgetType.TEXT,
-                    visible=False,
-                    label="Settings File Extension",
-                ),
-                Setting(
-                    "database_mode",
-                    "skydbapi",
-                    "Database connection mode",
-                    required=True,
-                    widget_type=SettingWidgetType.RADIO,
-                    options=["skydbapi", "direct"],
-                    label="Select Database Mode",
-                ),
-                Setting(
-                    "log_cli",
-                    "true",
-                    "Enable console logging",
-                    value_type="bool",
-                    widget_type=SettingWidgetType.CHECKBOX,
-                    label="Console Logging",
-                ),
-                Setting(
-                    "log_file",
-                    "true",
-                    "Enable file logging",
-                    value_type="bool",
-                    widget_type=SettingWidgetType.CHECKBOX,
-                    label="File Logging",
-                ),
-                Setting(
-                    "log_dir",
-                    "./.logs/",
-                    "Directory for log files",
-                    value_type="path",
-                    widget_type=SettingWidgetType.PATH,
-                    label="Log Directory",
-                ),
-                Setting(
-                    "skydb_api_ssl",
-                    "false",
-                    "Use SSL for API connection",
-                    value_type="bool",
-                    widget_type=SettingWidgetType.CHECKBOX,
-                    label="Use SSL for SKyDBAPI connection",
-                ),
-                Setting(
-                    "skydb_api_server",
-                    "localhost",
-                    "SkyDB API server address",
-                    widget_type=SettingWidgetType.TEXT,
-                    label="SKyDB API Server Address",
-                ),
-                Setting(
-                    "skydb_api_port",
-                    "9020",
-                    "SkyDB API server port",
-                    value_type="int",
-                    widget_type=SettingWidgetType.NUMBER,
-                    label="SKyDB API Server Port",
-                ),
-                Setting(
-                    "tew9_core_path",
-                    "C:\\TEW9\\",
-                    "Path to TEW9 installation",
-                    value_type="path",
-                    widget_type=SettingWidgetType.PATH,
-                    label="TEW9 Core Installation Path",
-                ),
-                Setting(
-                    "tew9_game_database_name",
-                    "Default",
-                    "TEW9 Active Database Name",
-                    value_type="str",
-                    widget_type=SettingWidgetType.TEXT,
-                    label="TEW9 Active Database Name",
-                ),
-                Setting(
-                    "tew9_pictures_pack_name",
-                    "Default",
-                    "TEW9 Pictures Pack Name",
-                    value_type="str",
-                    widget_type=SettingWidgetType.TEXT,
-                    label="TEW9 Picture Pack Name",
-                ),
-                Setting(
-                    "tew9_full_db_path_override",
-                    "",
-                    "Override TEW9 full database path",
-                    value_type="path",
-                    widget_type=SettingWidgetType.PATH,
-                    required=False,
-                    label="TEW9 Full Database Path Override",
-                ),
-                Setting(
-                    "tew9_full_pictures_path_override",
-                    "",
-                    "Override TEW9 full pictures path",
-                    value_type="path",
-                    widget_type=SettingWidgetType.PATH,
-                    required=False,
-                    label="TEW9 Full Pictures Path Override",
-                ),
-                Setting(
-                    "default_image_extension",
-                    ".gif",
-                    "Default image extension",
-                    value_type="str",
-                    widget_type=SettingWidgetType.TEXT,
-                    label="Default Image Extension",
-                ),
-                Setting(
-                    "title_screen_image_path",
-                    "./bin/title.png",
-                    "Path to title screen image",
-                    value_type="path",
-                    widget_type=SettingWidgetType.PATH,
-                    label="Title Screen Image",
-                ),
-                Setting(
-                    "photo_cache_max_age",
-                    "720",
-                    "Maximum age of photo cache in hours",
-                    value_type="int",
-                    widget_type=SettingWidgetType.NUMBER,
-                    label="Photo Cache Maximum Age",
-                ),
-            ]
+            ) + _STATIC_SETTINGS
+            self._by_key = {setting.key: setting for setting in self._settings}
+            self._defaults_list: Optional[Tuple[Tuple[str, str], ...]] = None
+            self._defaults_dict: Optional[Mapping[str, str]] = None
             sk_log.debug(f"Initialized {len(self._settings)} default settings")
         except Exception as e:
             sk_log.error(f"Failed to initialize settings: {e}")
             raise
 
     @property
-    def settings(self) -> List[Setting]:
+    def settings(self) -> Tuple[Setting, ...]:
         """Get list of all settings."""
         return self._settings
 
     def get_setting(self, key: str) -> Setting:
         """Get a setting by key."""
         try:
-            for setting in self._settings:
-                if setting.key == key:
-                    return setting
-            raise KeyError(f"Setting '{key}' not found")
-        except Exception as e:
-            sk_log.error(f"Failed to get setting '{key}': {e}")
-            raise
+            return self._by_key[key]
+        except KeyError:
+            sk_log.error(f"Failed to get setting '{key}': not found")
+            raise KeyError(f"Setting '{key}' not found") from None
+
+    def get_defaults_list(self) -> Tuple[Tuple[str, str], ...]:
+        """Get (key, value) tuples for database insertion.
 
-    def get_defaults_list(self) -> List[Tuple[str, str]]:
-        """Get list of (key, value) tuples for database insertion."""
+        Built on first call and then reused; treat the result as read-only.
+        """
         try:
-            defaults = [(s.key, str(s.default_value)) for s in self._settings]
-            sk_log.debug(f"Generated defaults list with {len(defaults)} items")
-            return defaults
+            if self._defaults_list is None:
+                self._defaults_list = tuple(
+                    (s.key, str(s.default_value)) for s in self._settings
+                )
+                sk_log.debug(
+                    "Generated defaults list with "
+                    f"{len(self._defaults_list)} items"
+                )
+            return self._defaults_list
         except Exception as e:
             sk_log.error(f"Failed to generate defaults list: {e}")
             raise
 
-    def get_defaults_dict(self) -> Dict[str, str]:
-        """Get dictionary of default settings."""
+    def get_defaults_dict(self) -> Mapping[str, str]:
+        """Get a read-only mapping of default settings.
+
+        Built on first call and then reused.
+        """
         try:
-            defaults = {s.key: str(s.default_value) for s in self._settings}
-            sk_log.debug(f"Generated defaults dict with {len(defaults)} items")
-            return defaults
+            if self._defaults_dict is None:
+                self._defaults_dict = MappingProxyType(
+                    dict(self.get_defaults_list())
+                )
+                sk_log.debug(
+                    "Generated defaults dict with "
+                    f"{len(self._defaults_dict)} items"
+                )
+            return self._defaults_dict
         except Exception as e:
             sk_log.error(f"Failed to generate defaults dict: {e}")
             raise
@@ -261,18 +321,10 @@ class DefaultSettings:
             if value is None:
                 return not setting.required
 
-            if setting.value_type == "bool":
-                is_valid = str(value).lower() in ("true", "false")
-            elif setting.value_type == "int":
-                is_valid = True if value == "" else bool(int(value))
-            elif setting.value_type == "path":
-                if value == "":
-                    is_valid = not setting.required
-                else:
-                    Path(value)
-                    is_valid = True
-            else:
-                is_valid = True
+            validator = _VALIDATORS.get(setting.value_type)
+            is_valid = (
+                validator(value, setting.required) if validator else True
+            )
 
             sk_log.debug(
                 f"Validated setting '{key}' with value '{value}': {is_valid}"
@@ -1,3 +1,6 @@
+import hashlib
+from pathlib import Path
+
 from PyQt6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -8,11 +11,13 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, QSize
 from PyQt6.QtGui import QPixmap
-from settings.settings_file import SettingsManager
+from settings.settings_file import get_settings
 from settings.settings_list import APP_VERSION
-from ui.photo_editor.photo_base_menu import PhotoEditorMenu
 from utils.sk_logger import sk_log
 
+TITLE_IMAGE_SIZE = 512
+TITLE_CACHE_DIR = Path("./.cache")
+
 
 class MainMenu(QMainWindow):
     def __init__(self) -> None:
@@ -29,12 +34,12 @@ class MainMenu(QMainWindow):
             mm_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
             mm_image_label = QLabel()
             mm_image_label.setFixedSize(512, 512)
-            settings = SettingsManager()
+            settings = get_settings()
             mm_image_path = settings.get_value("title_screen_image_path")
             if mm_image_path is None or mm_image_path == "[default]":
                 mm_image_path = "./bin/title.png"
                 settings.set_value("title_screen_image_path", mm_image_path)
-            mm_title_image = QPixmap(mm_image_path)
+            mm_title_image = self._load_title_pixmap(mm_image_path)
             if mm_title_image.isNull():
                 mm_title_image = QPixmap(400, 200)
                 mm_title_image.fill(Qt.GlobalColor.lightGray)
@@ -44,13 +49,7 @@ class MainMenu(QMainWindow):
                 )
                 mm_image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             else:
-                scaled_mm_title_image = mm_title_image.scaled(
-                    512,
-                    512,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
-                mm_image_label.setPixmap(scaled_mm_title_image)
+                mm_image_label.setPixmap(mm_title_image)
             mm_image_label.setScaledContents(True)
             mm_layout.addWidget(
                 mm_image_label, alignment=Qt.AlignmentFlag.AlignCenter
@@ -97,6 +96,52 @@ class MainMenu(QMainWindow):
             sk_log.error(f"MainMenu init error: {e}")
             raise e
 
+    def _load_title_pixmap(self, image_path: str) -> QPixmap:
+        """Load the title image scaled to fit the label.
+
+        The scaled copy is saved under TITLE_CACHE_DIR, keyed by the source
+        path and modification time, so the smooth rescale only runs again
+        after the image changes.
+
+        Args:
+            image_path (str): Path to the title image.
+
+        Returns:
+            QPixmap: The scaled image, or a null pixmap if it can't be read.
+        """
+        try:
+            source = Path(image_path)
+            try:
+                mtime = source.stat().st_mtime_ns
+            except OSError:
+                return QPixmap()
+            cache_key = hashlib.sha1(
+                f"{source.resolve()}:{mtime}".encode()
+            ).hexdigest()[:16]
+            cache_path = (
+                TITLE_CACHE_DIR / f"title-{TITLE_IMAGE_SIZE}-{cache_key}.png"
+            )
+            if cache_path.exists():
+                cached_image = QPixmap(str(cache_path))
+                if not cached_image.isNull():
+                    return cached_image
+            title_image = QPixmap(str(source))
+            if title_image.isNull():
+                return title_image
+            scaled_image = title_image.scaled(
+                TITLE_IMAGE_SIZE,
+                TITLE_IMAGE_SIZE,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+            TITLE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            if not scaled_image.save(str(cache_path), "PNG"):
+                sk_log.warning(f"MainMenu could not cache {cache_path}")
+            return scaled_image
+        except Exception as e:
+            sk_log.error(f"MainMenu _load_title_pixmap error: {e}")
+            raise e
+
     def _center_window(self) -> None:
         try:
             screen = QApplication.primaryScreen().geometry()
@@ -123,6 +168,8 @@ class MainMenu(QMainWindow):
 
     def open_photo_editor(self) -> None:
         try:
+            from ui.photo_editor.photo_base_menu import PhotoEditorMenu
+
             photo_editor_window = PhotoEditorMenu(self)
             self.mm_windows.append(photo_editor_window)
             photo_editor_window.setWindowModality(
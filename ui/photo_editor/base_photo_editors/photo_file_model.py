@@ -0,0 +1,96 @@
+from typing import Dict, Iterable, List, Optional
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+
+class PhotoFileModel(QAbstractListModel):
+    """A flat list of local photo filenames for a QListView.
+
+    The filenames are held in a plain Python list, so the view needs no
+    per-row item objects, and a name-to-row index makes lookups O(1).
+    """
+
+    def __init__(
+        self, files: Optional[Iterable[str]] = None, parent=None
+    ) -> None:
+        super().__init__(parent)
+        self._files: List[str] = list(files or [])
+        self._rows: Dict[str, int] = {}
+        self._index_rows()
+
+    def _index_rows(self) -> None:
+        self._rows = {name: row for row, name in enumerate(self._files)}
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._files)
+
+    def data(
+        self,
+        index: QModelIndex,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Optional[str]:
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self._files[index.row()]
+        return None
+
+    def reset(self, files: Iterable[str]) -> None:
+        """Replace every row with the given filenames.
+
+        Args:
+            files (Iterable[str]): The filenames, in display order.
+        """
+        self.beginResetModel()
+        self._files = list(files)
+        self._index_rows()
+        self.endResetModel()
+
+    def clear(self) -> None:
+        """Remove every row."""
+        self.reset([])
+
+    def row_of(self, name: str) -> Optional[int]:
+        """Look up the row holding a filename.
+
+        Args:
+            name (str): The filename to look up.
+
+        Returns:
+            Optional[int]: The row, or None if the name is not listed.
+        """
+        return self._rows.get(name)
+
+    def remove_files(self, names: Iterable[str]) -> None:
+        """Remove the rows holding the given filenames.
+
+        Args:
+            names (Iterable[str]): The filenames to remove.
+        """
+        self.remove_rows(
+            self._rows[name] for name in names if name in self._rows
+        )
+
+    def remove_rows(self, rows: Iterable[int]) -> None:
+        """Remove the given rows.
+
+        Contiguous rows are removed together, working from the bottom up
+        so earlier rows keep their positions.
+
+        Args:
+            rows (Iterable[int]): The rows to remove.
+        """
+        rows = sorted(set(rows), reverse=True)
+        if not rows:
+            return
+        last = first = rows[0]
+        for row in rows[1:] + [None]:
+            if row is not None and row == first - 1:
+                first = row
+                continue
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._files[first : last + 1]
+            self.endRemoveRows()
+            if row is not None:
+                last = first = row
+        self._index_rows()
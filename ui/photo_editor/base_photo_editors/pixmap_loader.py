@@ -0,0 +1,136 @@
+import os
+from typing import Callable, Dict, List, Optional
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, Qt, pyqtSignal
+from PyQt6.QtGui import QImage, QImageReader, QPixmap, QPixmapCache
+
+PREVIEW_W, PREVIEW_H = 300, 300
+# QPixmapCache limit in KB, set once at app start.
+PREVIEW_CACHE_LIMIT_KB = 64 * 1024
+
+PreviewCallback = Callable[[QPixmap, str], None]
+
+# GUI-thread state: the cache key each path was last decoded under, and
+# the callbacks waiting on decodes already queued.
+_preview_keys: Dict[str, str] = {}
+_in_flight: Dict[str, List[PreviewCallback]] = {}
+
+
+def preview_key(path: str) -> Optional[str]:
+    """Build the preview cache key for a photo.
+
+    The key includes the modification time, so an edited file is decoded
+    again. This stats the file, so it runs on the loader thread.
+
+    Args:
+        path (str): The photo path.
+
+    Returns:
+        Optional[str]: The key, or None if the file cannot be read.
+    """
+    try:
+        return f"{path}|{os.path.getmtime(path)}"
+    except OSError:
+        return None
+
+
+def cached_preview(path: str) -> Optional[QPixmap]:
+    """Return the preview last decoded for a path, if it is still cached.
+
+    No file is touched, so the lookup is cheap on the GUI thread. The
+    preview is trusted until clear_preview_cache(), which the editors call
+    when they rescan their folders.
+    """
+    key = _preview_keys.get(path)
+    return QPixmapCache.find(key) if key is not None else None
+
+
+def cache_preview(path: str, key: str, image: QImage) -> QPixmap:
+    """Convert a loaded preview to a QPixmap and remember it.
+
+    Args:
+        path (str): The photo path.
+        key (str): The key from preview_key(), or "" if there was none.
+        image (QImage): The scaled preview.
+
+    Returns:
+        QPixmap: The preview, ready to show.
+    """
+    pixmap = QPixmap.fromImage(image)
+    if key and not pixmap.isNull() and QPixmapCache.insert(key, pixmap):
+        _preview_keys[path] = key
+    return pixmap
+
+
+def clear_preview_cache() -> None:
+    """Drop every cached preview."""
+    _preview_keys.clear()
+    QPixmapCache.clear()
+
+
+def load_preview(
+    path: str, on_loaded: Optional[PreviewCallback] = None
+) -> None:
+    """Load a photo preview, decoding it on the global thread pool.
+
+    Previews seen before are served from the cache straight away. A path
+    that is already being decoded is not queued again; on_loaded waits for
+    the decode in flight instead.
+
+    Args:
+        path (str): The photo to load.
+        on_loaded (Optional[PreviewCallback]): Called on the GUI thread with
+            the scaled preview and the path it came from.
+    """
+    pixmap = cached_preview(path)
+    if pixmap is not None:
+        if on_loaded is not None:
+            on_loaded(pixmap, path)
+        return
+    waiting = _in_flight.get(path)
+    if waiting is not None:
+        if on_loaded is not None:
+            waiting.append(on_loaded)
+        return
+    _in_flight[path] = [on_loaded] if on_loaded is not None else []
+    loader = PixmapLoader(path)
+    loader.signals.loaded.connect(_preview_loaded)
+    QThreadPool.globalInstance().start(loader)
+
+
+def _preview_loaded(image: QImage, path: str, key: str) -> None:
+    pixmap = cache_preview(path, key, image)
+    for on_loaded in _in_flight.pop(path, ()):
+        on_loaded(pixmap, path)
+
+
+class PixmapLoaderSignals(QObject):
+    # Carries the decoded preview, its path and its cache key ("" if none).
+    loaded = pyqtSignal(QImage, str, str)
+
+
+class PixmapLoader(QRunnable):
+    """Decode and scale one photo preview on a QThreadPool worker.
+
+    QPixmap may only be used on the GUI thread, so the worker produces a
+    QImage and the receiving slot turns it into a QPixmap. The reader is
+    asked for the preview size up front, so formats that can decode at a
+    reduced size never build the full-resolution image.
+    """
+
+    def __init__(self, path: str) -> None:
+        super().__init__()
+        self.path = path
+        self.signals = PixmapLoaderSignals()
+
+    def run(self) -> None:
+        key = preview_key(self.path) or ""
+        reader = QImageReader(self.path)
+        reader.setAutoTransform(True)
+        size = reader.size()
+        if size.isValid():
+            size.scale(
+                PREVIEW_W, PREVIEW_H, Qt.AspectRatioMode.KeepAspectRatio
+            )
+            reader.setScaledSize(size)
+        self.signals.loaded.emit(reader.read(), self.path, key)
@@ -1,3 +1,6 @@
+from types import SimpleNamespace
+from typing import Callable, List, Optional, Union
+
 from PyQt6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -5,69 +8,200 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QPushButton,
     QLabel,
+    QListView,
     QListWidget,
     QLineEdit,
     QGridLayout,
+    QLayout,
     QApplication,
     QCheckBox,
     QSpacerItem,
     QSizePolicy,
 )
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import QPoint, Qt, QTimer
 
-from utils.sk_logger import sk_log
+from ui.photo_editor.base_photo_editors.pixmap_loader import (
+    PreviewCallback,
+    load_preview,
+)
 
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
 
-class WorkerPhotoBase(QMainWindow):
+_WINDOW_W, _WINDOW_H = 1300, 700
+_LIST_W, _LIST_H = 320, 590
+_LIST_BATCH_SIZE = 100
+_PHOTO_W, _PHOTO_H = 300, 300
+_TEXT_INPUT_W, _TEXT_INPUT_H = 250, 35
+_BUTTON_H = 40
+_QUARTER_BUTTON_W = 80
+_HALF_BUTTON_W = 145
+_THREE_QUARTER_BUTTON_W = 205
+_STANDARD_BUTTON_W = 290
+_RETURN_BUTTON_W = 610
 
-    _window_dimensions = QSize(1300, 700)
-    _list_widget_width = 320
-    _list_widget_height = 590
-    _photo_preview_width = 300
-    _photo_preview_height = 300
-    _text_input_width = 250
-    _text_input_height = 35
-    _quarter_button_size = QSize(80, 40)
-    _half_button_size = QSize(145, 40)
-    _three_quarter_button_size = QSize(205, 40)
-    _standard_button_size = QSize(290, 40)
-    _return_button_size = QSize(610, 40)
+
+class WorkerPhotoBase(QMainWindow):
+    _cached_center: Optional[QPoint] = None
 
     def __init__(
         self,
         editor_type: str,
         parent=None,
     ) -> None:
-        try:
-            if editor_type is None or editor_type == "":
-                raise ValueError("Editor type must be provided")
-            super().__init__(parent)
-            formatted_editor_type = " ".join(
-                word.capitalize() for word in editor_type.split()
-            )
-            self.setWindowTitle(f"{formatted_editor_type} Photo Editor")
-            self.left_side_name = f"Game {formatted_editor_type}"
-            self.right_side_name = f"Local {formatted_editor_type}"
-            self.setFixedSize(self._window_dimensions)
-            self.setWindowFlags(
-                Qt.WindowType.Dialog
-                | Qt.WindowType.CustomizeWindowHint
-                | Qt.WindowType.WindowStaysOnTopHint
-                | Qt.WindowType.WindowTitleHint
-            )
-            self._center_window()
-            self.setup_ui()
-        except Exception as e:
-            sk_log.error(f"WorkerPhotoBase __init__ error: {e}")
-            raise e
+        if editor_type is None or editor_type == "":
+            raise ValueError("Editor type must be provided")
+        super().__init__(parent)
+        formatted_editor_type = " ".join(
+            word.capitalize() for word in editor_type.split()
+        )
+        self.setWindowTitle(f"{formatted_editor_type} Photo Editor")
+        self.left_side_name = f"Game {formatted_editor_type}"
+        self.right_side_name = f"Local {formatted_editor_type}"
+        left, right = self.left_side_name, self.right_side_name
+        self._labels = SimpleNamespace(
+            left_photo=f"{left} Photo",
+            right_photo=f"{right} Photo",
+            unselect_left=f"Unselect {left}",
+            unselect_right=f"Unselect {right}",
+            left_name=f"{left} Name",
+            left_filename=f"{left} Filename",
+            right_filename=f"{right} Filename",
+            right_metadata=f"{right} Metadata",
+        )
+        self.setFixedSize(_WINDOW_W, _WINDOW_H)
+        self.setWindowFlags(
+            Qt.WindowType.Dialog
+            | Qt.WindowType.CustomizeWindowHint
+            | Qt.WindowType.WindowStaysOnTopHint
+            | Qt.WindowType.WindowTitleHint
+        )
+        self._center_window()
+        self.setup_ui()
 
     def _center_window(self) -> None:
-        screen = QApplication.primaryScreen().geometry()
-        center_x = (screen.width() - self.width()) // 2
-        center_y = (screen.height() - self.height()) // 2
-        self.move(center_x, center_y)
+        """Move the window to the centre of the primary screen.
+
+        The window size is fixed, so the position is worked out on first use
+        and shared by every editor after that.
+        """
+        if WorkerPhotoBase._cached_center is None:
+            screen = QApplication.primaryScreen().availableGeometry()
+            WorkerPhotoBase._cached_center = QPoint(
+                screen.x() + (screen.width() - _WINDOW_W) // 2,
+                screen.y() + (screen.height() - _WINDOW_H) // 2,
+            )
+        self.move(WorkerPhotoBase._cached_center)
+
+    @staticmethod
+    def _configure_list_view(list_view: QListView) -> QListView:
+        """Tune a roster list for long, single-line entries.
+
+        Every row is one line of text, so uniform item sizes let the view
+        skip measuring each row, and batched layout keeps the first screen
+        responsive while large lists are laid out.
+        """
+        list_view.setFixedSize(_LIST_W, _LIST_H)
+        list_view.setUniformItemSizes(True)
+        list_view.setLayoutMode(QListView.LayoutMode.Batched)
+        list_view.setBatchSize(_LIST_BATCH_SIZE)
+        return list_view
+
+    @classmethod
+    def _build_list_widget(cls) -> QListWidget:
+        """Build a tuned roster list."""
+        return cls._configure_list_view(QListWidget())
+
+    def _build_right_list(self) -> QListView:
+        """Build the local photo list.
+
+        Editors that hold the local photos in a model override this to
+        return a QListView bound to it.
+        """
+        return self._build_list_widget()
+
+    @staticmethod
+    def _add_list_items(list_widget: QListWidget, names: List[str]) -> None:
+        """Append rows to a roster list in a single batch.
+
+        Repaints and widget signals are held off until every row is in, so
+        the view lays out once instead of once per row. Callers pass names
+        already in display order; the list does not sort them.
+
+        Args:
+            list_widget (QListWidget): The list to add rows to.
+            names (List[str]): The row texts, in display order.
+        """
+        list_widget.setUpdatesEnabled(False)
+        list_widget.blockSignals(True)
+        try:
+            list_widget.addItems(names)
+        finally:
+            list_widget.blockSignals(False)
+            list_widget.setUpdatesEnabled(True)
+
+    def _debounce(self, interval_ms: int, slot: Callable[[], None]) -> QTimer:
+        """Build a single-shot timer that runs slot once bursts settle.
+
+        Restarting the timer on every signal in a burst means slot only
+        runs after interval_ms without a new signal.
+
+        Args:
+            interval_ms (int): The quiet period, in milliseconds.
+            slot (Callable[[], None]): The handler to run.
+
+        Returns:
+            QTimer: The timer; call start() from the noisy signal.
+        """
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(interval_ms)
+        timer.timeout.connect(slot)
+        return timer
+
+    @staticmethod
+    def _load_preview(
+        path: str, on_loaded: Optional[PreviewCallback] = None
+    ) -> None:
+        """Load a photo preview, decoding it on the global thread pool.
+
+        Previews seen before are served from the preview cache straight
+        away. Without on_loaded the preview is only cached, ready for a
+        later selection.
+
+        Args:
+            path (str): The photo to load.
+            on_loaded (Optional[PreviewCallback]): Called on the GUI thread
+                with the scaled preview and the path it came from.
+        """
+        load_preview(path, on_loaded)
+
+    @staticmethod
+    def _add_center_row(
+        center_layout: QVBoxLayout,
+        left: Union[QWidget, QLayout],
+        right: Union[QWidget, QLayout],
+    ) -> None:
+        """Add a row of two equal-width, centred cells to the centre panel.
+
+        Args:
+            center_layout (QVBoxLayout): The centre panel layout.
+            left (Union[QWidget, QLayout]): The left cell.
+            right (Union[QWidget, QLayout]): The right cell.
+        """
+        row_layout = QHBoxLayout()
+        row_layout.setContentsMargins(0, 0, 0, 0)
+        row_layout.setSpacing(20)
+        for cell in (left, right):
+            if isinstance(cell, QLayout):
+                cell.setAlignment(_ALIGN_CENTER)
+                row_layout.addLayout(cell, stretch=1)
+            else:
+                row_layout.addWidget(cell, stretch=1, alignment=_ALIGN_CENTER)
+        center_layout.addLayout(row_layout)
 
     def setup_ui(self) -> None:
+        # Hold off layout and repaint work until every widget is in place.
+        self.setUpdatesEnabled(False)
         try:
             # Main Window Widget
             main_widget = QWidget()
@@ -82,164 +216,89 @@ class WorkerPhotoBase(QMainWindow):
             grid_layout.setContentsMargins(0, 10, 0, 10)
 
             # Game Worker List Object
-            self.left_list = QListWidget()
-            self.left_list.setFixedSize(
-                self._list_widget_width, self._list_widget_height
-            )
+            self.left_list = self._build_list_widget()
             grid_layout.addWidget(self.left_list, 0, 0)
 
             # Local Worker List Object
-            self.right_list = QListWidget()
-            self.right_list.setFixedSize(
-                self._list_widget_width, self._list_widget_height
-            )
+            self.right_list = self._build_right_list()
             grid_layout.addWidget(self.right_list, 0, 2)
 
             # Widget for Photo Preview and Options (Center Widget)
             center_widget = QWidget()
-            center_layout = QGridLayout(center_widget)
+            center_layout = QVBoxLayout(center_widget)
             center_layout.setContentsMargins(0, 0, 0, 0)
-            center_layout.setHorizontalSpacing(20)
-            center_layout.setVerticalSpacing(10)
+            center_layout.setSpacing(10)
 
             # Row 0
 
             # Game Worker Photo Preview Object
-            self.left_photo = QLabel(f"{self.left_side_name} Photo")
-            self.left_photo.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.left_photo.setStyleSheet("border: 1px solid black;")
-            self.left_photo.setFixedSize(
-                self._photo_preview_width, self._photo_preview_height
-            )
-
-            # Game Worker Photo Container
-            row_0_left_widget = QWidget()
-            row_0_left_layout = QHBoxLayout(row_0_left_widget)
-            row_0_left_layout.setContentsMargins(0, 0, 0, 0)
-            row_0_left_layout.setSpacing(5)
-            row_0_left_layout.addWidget(self.left_photo)
+            self.left_photo = QLabel(self._labels.left_photo)
+            self.left_photo.setAlignment(_ALIGN_CENTER)
+            self.left_photo.setObjectName("photoPreview")
+            self.left_photo.setFixedSize(_PHOTO_W, _PHOTO_H)
 
             # Local Worker Photo Preview Object
-            self.right_photo = QLabel(f"{self.right_side_name} Photo")
-            self.right_photo.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.right_photo.setStyleSheet("border: 1px solid black;")
-            self.right_photo.setFixedSize(
-                self._photo_preview_width, self._photo_preview_height
-            )
+            self.right_photo = QLabel(self._labels.right_photo)
+            self.right_photo.setAlignment(_ALIGN_CENTER)
+            self.right_photo.setObjectName("photoPreview")
+            self.right_photo.setFixedSize(_PHOTO_W, _PHOTO_H)
 
-            # Local Worker Photo Container
-            row_0_right_widget = QWidget()
-            row_0_right_layout = QHBoxLayout(row_0_right_widget)
-            row_0_right_layout.setContentsMargins(0, 0, 0, 0)
-            row_0_right_layout.setSpacing(5)
-            row_0_right_layout.addWidget(self.right_photo)
-
-            # Photos Container (Left and Right Row 1 Center Widget)
-            center_layout.addWidget(
-                row_0_left_widget, 0, 0, alignment=Qt.AlignmentFlag.AlignCenter
-            )
-            center_layout.addWidget(
-                row_0_right_widget, 0, 1, alignment=Qt.AlignmentFlag.AlignCenter
+            self._add_center_row(
+                center_layout, self.left_photo, self.right_photo
             )
 
             # Row 1
 
             # Unselect1 Button Object
-            self.unselect_left_button = QPushButton(
-                f"Unselect {self.left_side_name}"
+            self.unselect_left_button = QPushButton(self._labels.unselect_left)
+            self.unselect_left_button.setFixedSize(
+                _STANDARD_BUTTON_W, _BUTTON_H
             )
-            self.unselect_left_button.setFixedSize(self._standard_button_size)
 
             # Unselect2 Button Object
             self.unselect_right_button = QPushButton(
-                f"Unselect {self.right_side_name}"
+                self._labels.unselect_right
             )
-            self.unselect_right_button.setFixedSize(self._standard_button_size)
-
-            # Left Unselect Button Container
-            row_1_left_widget = QWidget()
-            row_1_left_layout = QHBoxLayout(row_1_left_widget)
-            row_1_left_layout.setContentsMargins(0, 0, 0, 0)
-            row_1_left_layout.setSpacing(5)
-            row_1_left_layout.addWidget(self.unselect_left_button)
-
-            # Right Unselect Button Container
-            row_1_right_widget = QWidget()
-            row_1_right_layout = QHBoxLayout(row_1_right_widget)
-            row_1_right_layout.setContentsMargins(0, 0, 0, 0)
-            row_1_right_layout.setSpacing(5)
-            row_1_right_layout.addWidget(self.unselect_right_button)
-
-            # Unselect Container (Row 0 Center Widget)
-            center_layout.addWidget(
-                row_1_left_widget, 1, 0, alignment=Qt.AlignmentFlag.AlignCenter
+            self.unselect_right_button.setFixedSize(
+                _STANDARD_BUTTON_W, _BUTTON_H
             )
-            center_layout.addWidget(
-                row_1_right_widget, 1, 1, alignment=Qt.AlignmentFlag.AlignCenter
+
+            self._add_center_row(
+                center_layout,
+                self.unselect_left_button,
+                self.unselect_right_button,
             )
 
             # Row 2
 
             # Game Worker Name Label Object
-            self.left_name_label = QLabel(f"{self.left_side_name} Name")
-            self.left_name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            self.left_name_label = QLabel(self._labels.left_name)
+            self.left_name_label.setAlignment(_ALIGN_CENTER)
+            self.left_name_label.setContentsMargins(0, 10, 0, 10)
 
             # Local Worker Filename Object
-            self.right_filename = QLabel(f"{self.right_side_name} Filename")
-            self.right_filename.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-            # Game Worker Name Container
-            row_2_left_widget = QWidget()
-            row_2_left_layout = QHBoxLayout(row_2_left_widget)
-            row_2_left_layout.setContentsMargins(0, 10, 0, 10)
-            row_2_left_layout.setSpacing(5)
-            row_2_left_layout.addWidget(self.left_name_label)
-
-            # Local Worker Filename Container
-            row_2_right_widget = QWidget()
-            row_2_right_layout = QHBoxLayout(row_2_right_widget)
-            row_2_right_layout.setContentsMargins(0, 10, 0, 10)
-            row_2_right_layout.setSpacing(5)
-            row_2_right_layout.addWidget(self.right_filename)
-
-            # Name Container (Left and Right Row 2 in Center Widget)
-            center_layout.addWidget(
-                row_2_left_widget, 2, 0, alignment=Qt.AlignmentFlag.AlignCenter
-            )
-            center_layout.addWidget(
-                row_2_right_widget, 2, 1, alignment=Qt.AlignmentFlag.AlignCenter
+            self.right_filename = QLabel(self._labels.right_filename)
+            self.right_filename.setAlignment(_ALIGN_CENTER)
+            self.right_filename.setContentsMargins(0, 10, 0, 10)
+
+            self._add_center_row(
+                center_layout, self.left_name_label, self.right_filename
             )
 
             # Row 3
 
             # Game Worker Filename Object
-            self.left_filename = QLabel(f"{self.left_side_name} Filename")
-            self.left_filename.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            self.left_filename = QLabel(self._labels.left_filename)
+            self.left_filename.setAlignment(_ALIGN_CENTER)
+            self.left_filename.setContentsMargins(0, 0, 0, 10)
 
             # File Metadata Object
-            self.right_metadata = QLabel(f"{self.right_side_name} Metadata")
-            self.right_metadata.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-            # Game Worker Filename Container
-            row_3_left_widget = QWidget()
-            row_3_left_layout = QHBoxLayout(row_3_left_widget)
-            row_3_left_layout.setContentsMargins(0, 0, 0, 10)
-            row_3_left_layout.setSpacing(5)
-            row_3_left_layout.addWidget(self.left_filename)
-
-            # Local File Metadata Container
-            row_3_right_widget = QWidget()
-            row_3_right_layout = QHBoxLayout(row_3_right_widget)
-            row_3_right_layout.setContentsMargins(0, 0, 0, 10)
-            row_3_right_layout.setSpacing(5)
-            row_3_right_layout.addWidget(self.right_metadata)
-
-            # Filename/Metadata Container (Left and Right Row 3 Center Widget)
-            center_layout.addWidget(
-                row_3_left_widget, 3, 0, alignment=Qt.AlignmentFlag.AlignCenter
-            )
-            center_layout.addWidget(
-                row_3_right_widget, 3, 1, alignment=Qt.AlignmentFlag.AlignCenter
+            self.right_metadata = QLabel(self._labels.right_metadata)
+            self.right_metadata.setAlignment(_ALIGN_CENTER)
+            self.right_metadata.setContentsMargins(0, 0, 0, 10)
+
+            self._add_center_row(
+                center_layout, self.left_filename, self.right_metadata
             )
 
             # Row 4
@@ -247,11 +306,8 @@ class WorkerPhotoBase(QMainWindow):
             # Checkbox and Text Input for Custom Path Object
             self.checkbox = QCheckBox()
             self.text_input = QLineEdit()
-            self.text_input.setFixedSize(
-                self._text_input_width, self._text_input_height
-            )
-            row_4_left_widget = QWidget()
-            row_4_left_layout = QHBoxLayout(row_4_left_widget)
+            self.text_input.setFixedSize(_TEXT_INPUT_W, _TEXT_INPUT_H)
+            row_4_left_layout = QHBoxLayout()
             row_4_left_layout.setContentsMargins(0, 0, 0, 0)
             row_4_left_layout.setSpacing(5)
             row_4_left_layout.addWidget(self.checkbox)
@@ -263,140 +319,84 @@ class WorkerPhotoBase(QMainWindow):
 
             # Use This and Delete Button Objects
             self.use_this_button = QPushButton("Use This")
-            self.use_this_button.setFixedSize(self._half_button_size)
+            self.use_this_button.setFixedSize(_HALF_BUTTON_W, _BUTTON_H)
             self.delete_button = QPushButton("Delete")
-            self.delete_button.setFixedSize(self._half_button_size)
+            self.delete_button.setFixedSize(_HALF_BUTTON_W, _BUTTON_H)
 
-            # Use This and Delete Button Container
-            row_4_right_widget = QWidget()
-            row_4_right_layout = QHBoxLayout(row_4_right_widget)
+            row_4_right_layout = QHBoxLayout()
             row_4_right_layout.setContentsMargins(0, 0, 0, 0)
             row_4_right_layout.setSpacing(5)
             row_4_right_layout.addWidget(
-                self.use_this_button, alignment=Qt.AlignmentFlag.AlignCenter
+                self.use_this_button, alignment=_ALIGN_CENTER
             )
             row_4_right_layout.addWidget(
-                self.delete_button, alignment=Qt.AlignmentFlag.AlignCenter
+                self.delete_button, alignment=_ALIGN_CENTER
             )
 
-            # Checkbox/Text Input and Use/Delete Container (Row 4 Center Widget)
-            center_layout.addWidget(
-                row_4_left_widget, 4, 0, alignment=Qt.AlignmentFlag.AlignCenter
-            )
-            center_layout.addWidget(
-                row_4_right_widget, 4, 1, alignment=Qt.AlignmentFlag.AlignCenter
+            self._add_center_row(
+                center_layout, row_4_left_layout, row_4_right_layout
             )
 
             # Row 5
 
             # Clear Path and Apply Custom Button Objects
             self.clear_button = QPushButton("Clear Path")
-            self.clear_button.setFixedSize(self._quarter_button_size)
+            self.clear_button.setFixedSize(_QUARTER_BUTTON_W, _BUTTON_H)
             self.transfer_up_button = QPushButton("Apply Custom Path")
             self.transfer_up_button.setFixedSize(
-                self._three_quarter_button_size
+                _THREE_QUARTER_BUTTON_W, _BUTTON_H
             )
 
-            row_5_left_widget = QWidget()
-            row_5_left_layout = QHBoxLayout(row_5_left_widget)
+            row_5_left_layout = QHBoxLayout()
             row_5_left_layout.setContentsMargins(0, 0, 0, 0)
             row_5_left_layout.setSpacing(5)
             row_5_left_layout.addWidget(
-                self.clear_button, alignment=Qt.AlignmentFlag.AlignCenter
+                self.clear_button, alignment=_ALIGN_CENTER
             )
             row_5_left_layout.addWidget(
-                self.transfer_up_button, alignment=Qt.AlignmentFlag.AlignCenter
+                self.transfer_up_button, alignment=_ALIGN_CENTER
             )
 
             # Upload New Photo Button Object
             self.upload_button = QPushButton("Upload New Photo")
-            self.upload_button.setFixedSize(self._standard_button_size)
-
-            # Upload New Photo Container
-            row_5_right_widget = QWidget()
-            row_5_right_layout = QHBoxLayout(row_5_right_widget)
-            row_5_right_layout.setContentsMargins(0, 0, 0, 0)
-            row_5_right_layout.setSpacing(5)
-            row_5_right_layout.addWidget(
-                self.upload_button, alignment=Qt.AlignmentFlag.AlignCenter
-            )
+            self.upload_button.setFixedSize(_STANDARD_BUTTON_W, _BUTTON_H)
 
-            # Clear/Apply and Upload Container (Row 5 Center Widget)
-            center_layout.addWidget(
-                row_5_left_widget, 5, 0, alignment=Qt.AlignmentFlag.AlignCenter
-            )
-            center_layout.addWidget(
-                row_5_right_widget, 5, 1, alignment=Qt.AlignmentFlag.AlignCenter
+            self._add_center_row(
+                center_layout, row_5_left_layout, self.upload_button
             )
 
-            # Row 5.5 (new row for refresh buttons)
+            # Row 6
 
             # Refresh Game Workers Button
             self.refresh_left_button = QPushButton("Refresh Game Workers")
-            self.refresh_left_button.setFixedSize(self._standard_button_size)
+            self.refresh_left_button.setFixedSize(
+                _STANDARD_BUTTON_W, _BUTTON_H
+            )
 
             # Refresh Local Photos Button
             self.refresh_right_button = QPushButton("Refresh Local Photos")
-            self.refresh_right_button.setFixedSize(self._standard_button_size)
-
-            # Refresh Buttons Container - separate containers for left and right
-            row_5_5_left_widget = QWidget()
-            row_5_5_left_layout = QHBoxLayout(row_5_5_left_widget)
-            row_5_5_left_layout.setContentsMargins(0, 0, 0, 0)
-            row_5_5_left_layout.setSpacing(5)
-            row_5_5_left_layout.addWidget(
-                self.refresh_left_button, alignment=Qt.AlignmentFlag.AlignCenter
+            self.refresh_right_button.setFixedSize(
+                _STANDARD_BUTTON_W, _BUTTON_H
             )
 
-            row_5_5_right_widget = QWidget()
-            row_5_5_right_layout = QHBoxLayout(row_5_5_right_widget)
-            row_5_5_right_layout.setContentsMargins(0, 0, 0, 0)
-            row_5_5_right_layout.setSpacing(5)
-            row_5_5_right_layout.addWidget(
+            self._add_center_row(
+                center_layout,
+                self.refresh_left_button,
                 self.refresh_right_button,
-                alignment=Qt.AlignmentFlag.AlignCenter,
-            )
-
-            # Add refresh buttons to layout in separate columns
-            center_layout.addWidget(
-                row_5_5_left_widget,
-                6,
-                0,
-                alignment=Qt.AlignmentFlag.AlignCenter,
-            )
-            center_layout.addWidget(
-                row_5_5_right_widget,
-                6,
-                1,
-                alignment=Qt.AlignmentFlag.AlignCenter,
             )
 
-            # Row 6 (now row 7)
+            # Row 7
 
             # Return Button Object
             self.return_button = QPushButton("Return to Photo Editor Menu")
-            self.return_button.setFixedSize(self._return_button_size)
+            self.return_button.setFixedSize(_RETURN_BUTTON_W, _BUTTON_H)
             self.return_button.clicked.connect(self.close)
 
-            # Return Button Container
-            row_6_widget = QWidget()
-            row_6_layout = QHBoxLayout(row_6_widget)
-            row_6_layout.setContentsMargins(0, 0, 0, 0)
-            row_6_layout.setSpacing(5)
-            row_6_layout.addWidget(
-                self.return_button, alignment=Qt.AlignmentFlag.AlignCenter
-            )
-
-            # Return Container (Row 7 Center Widget)
             center_layout.addWidget(
-                row_6_widget, 7, 0, 1, 2, alignment=Qt.AlignmentFlag.AlignCenter
+                self.return_button, alignment=_ALIGN_CENTER
             )
 
             # Add Center Widget to Grid Layout
-            grid_layout.addWidget(
-                center_widget, 0, 1, alignment=Qt.AlignmentFlag.AlignCenter
-            )
-
-        except Exception as e:
-            sk_log.error(f"PhotoWorkerEditor setup_ui error: {e}")
-            raise e
+            grid_layout.addWidget(center_widget, 0, 1, alignment=_ALIGN_CENTER)
+        finally:
+            self.setUpdatesEnabled(True)
@@ -1,131 +1,178 @@
 import os
-from typing import List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple, Union
 
+from PyQt6.QtCore import QTimer
 from PyQt6.QtGui import QPixmap
-from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QMessageBox
+from PyQt6.QtWidgets import QListView, QMessageBox
 
+from ui.photo_editor.base_photo_editors.photo_file_model import PhotoFileModel
+from ui.photo_editor.base_photo_editors.pixmap_loader import clear_preview_cache
 from ui.photo_editor.base_photo_editors.worker_photo_base import WorkerPhotoBase
 from modules.photo_editor.photo_worker_engine import PhotoWorkerEngine
 from modules.photo_editor.photo_agers_engine import PhotoAgersEngine
 
 from utils.sk_logger import sk_log
 
+DELETE_WORKERS = 8
+_LOCAL_PHOTO_KEYS = ("local_contract_photo_file", "local_worker_photo_file")
+
+
+def _delete_photo(full_path: str) -> Optional[str]:
+    """Delete one photo file.
+
+    Args:
+        full_path (str): The file to delete.
+
+    Returns:
+        Optional[str]: None on success, otherwise why the delete failed.
+    """
+    try:
+        os.remove(full_path)
+        return None
+    except FileNotFoundError:
+        return "file not found"
+    except PermissionError:
+        return "permission denied"
+    except Exception as e:
+        return str(e)
+
 
 class PhotoAgersEditor(WorkerPhotoBase):
 
     MAX_LABEL_TEXT_LENGTH = 40
+    _TRUNC_HALF = MAX_LABEL_TEXT_LENGTH // 2
+    SELECTION_DEBOUNCE_MS = 50
+    TEXT_DEBOUNCE_MS = 100
+    PREFETCH_DISTANCE = 2
 
     def __init__(self, parent=None) -> None:
-        try:
-            super().__init__(editor_type="Ager", parent=parent)
-            with PhotoAgersEngine() as photo_agers_engine:
-                try:
-                    photo_agers_engine.ager_photo_cache_init(skip_check=True)
-                except Exception as cache_error:
-                    sk_log.warning(f"Cache initialization error: {cache_error}")
-            self.initial_ui_setup()
-        except Exception as e:
-            sk_log.error(f"PhotoAgersEditor __init__ error: {e}")
-            raise e
+        super().__init__(editor_type="Ager", parent=parent)
+        # One engine pair serves every callback until the window closes.
+        self._agers_engine = PhotoAgersEngine().__enter__()
+        self._worker_engine = PhotoWorkerEngine().__enter__()
+        self._root_path = self._agers_engine.worker_photo_path
+        # Paths of the previews each side is waiting on; late loads for
+        # any other path are dropped.
+        self._pending_left: Optional[str] = None
+        self._pending_right: Optional[str] = None
+        self._ager_filename_map = {}
+        self.initial_ui_setup()
+
+    def closeEvent(self, event) -> None:
+        """Release the editor's engines when the window closes."""
+        self._worker_engine.__exit__(None, None, None)
+        self._agers_engine.__exit__(None, None, None)
+        super().closeEvent(event)
+
+    def _build_right_list(self) -> QListView:
+        """Build the local photo list as a view over a PhotoFileModel.
+
+        Returns:
+            QListView: The local photo list.
+        """
+        self.right_model = PhotoFileModel(parent=self)
+        right_list = self._configure_list_view(QListView())
+        right_list.setModel(self.right_model)
+        return right_list
 
     def initial_ui_setup(self) -> None:
         """Initialize the UI setup.
 
+        The widgets are wired up straight away and the lists are filled
+        once the window has been shown.
+
         Raises:
             Exception: If there is an error initializing the UI setup.
         """
         try:
-            with PhotoAgersEngine() as photo_agers_engine:
-                try:
-                    game_agers, local_workers = (
-                        photo_agers_engine.fetch_ager_photo_record_lists()
-                    )
-                except Exception as e:
-                    sk_log.warning(
-                        f"Cache fetch error, attempting rebuild: {e}"
-                    )
-                    photo_agers_engine.refresh_ager_photo_record_cache()
-
-                    try:
-                        game_agers, local_workers = (
-                            photo_agers_engine.fetch_ager_photo_record_lists()
-                        )
-                    except Exception as refresh_error:
-                        sk_log.error(f"Cache rebuild failed: {refresh_error}")
-                        game_agers = []
-                        local_workers = []
-                        try:
-                            with PhotoWorkerEngine() as photo_worker_engine:
-                                local_files = (
-                                    photo_worker_engine.fetch_worker_photos_from_dir()
-                                )
-                                local_workers = [
-                                    {"local_contract_photo_file": f}
-                                    for f in local_files
-                                ]
-                        except Exception as local_error:
-                            sk_log.error(
-                                f"Local files fetch failed: {local_error}"
-                            )
-                self._populate_left_list(game_agers)
-                self._populate_right_list(local_workers)
-                self.left_list.setSelectionMode(
-                    self.left_list.SelectionMode.SingleSelection
-                )
-                self.right_list.setSelectionMode(
-                    self.right_list.SelectionMode.ExtendedSelection
-                )
-                self.left_photo.setText("")
-                self.right_photo.setText("")
-                self.unselect_left_button.setEnabled(False)
-                self.unselect_right_button.setEnabled(False)
-                self.left_name_label.setText("")
-                self.left_filename.setText("")
-                self.right_filename.setText("")
-                self.right_metadata.setText("")
-                self.checkbox.setChecked(False)
-                self.text_input.setText("")
-                self.text_input.setEnabled(False)
-                self.use_this_button.setEnabled(False)
-                self.delete_button.setEnabled(False)
-                self.clear_button.setEnabled(False)
-                self.transfer_up_button.setEnabled(False)
-                self.upload_button.setEnabled(True)
-                self.return_button.setEnabled(True)
-                self.left_list.itemSelectionChanged.connect(
-                    self._left_list_item_toggled
-                )
-                self.right_list.itemSelectionChanged.connect(
-                    self._right_list_item_toggled
-                )
-                self.checkbox.stateChanged.connect(self._checkbox_state_changed)
-                self.text_input.textChanged.connect(self._text_input_changed)
-                self.unselect_left_button.clicked.connect(
-                    self._unselect_left_button_clicked
-                )
-                self.unselect_right_button.clicked.connect(
-                    self._unselect_right_button_clicked
-                )
-                self.clear_button.clicked.connect(self._clear_button_clicked)
-                self.transfer_up_button.clicked.connect(
-                    self._transfer_up_button_clicked
-                )
-                self.delete_button.clicked.connect(self._delete_button_clicked)
-                self.refresh_left_button.clicked.connect(
-                    self._refresh_left_list
-                )
-                self.refresh_right_button.clicked.connect(
-                    self._refresh_right_list
-                )
-                self.use_this_button.clicked.connect(
-                    self._use_this_button_clicked
-                )
-                self._checkbox_state_changed()
+            self.left_list.setSelectionMode(
+                self.left_list.SelectionMode.SingleSelection
+            )
+            self.right_list.setSelectionMode(
+                self.right_list.SelectionMode.ExtendedSelection
+            )
+            self.left_photo.setText("")
+            self.right_photo.setText("")
+            self.unselect_left_button.setEnabled(False)
+            self.unselect_right_button.setEnabled(False)
+            self.left_name_label.setText("")
+            self.left_filename.setText("")
+            self.right_filename.setText("")
+            self.right_metadata.setText("")
+            self.checkbox.setChecked(False)
+            self.text_input.setText("")
+            self.text_input.setEnabled(False)
+            self.use_this_button.setEnabled(False)
+            self.delete_button.setEnabled(False)
+            self.clear_button.setEnabled(False)
+            self.transfer_up_button.setEnabled(False)
+            self.upload_button.setEnabled(True)
+            self.return_button.setEnabled(True)
+            self.left_list.itemSelectionChanged.connect(
+                self._left_list_item_toggled
+            )
+            self._right_selection_timer = self._debounce(
+                self.SELECTION_DEBOUNCE_MS, self._right_list_item_toggled
+            )
+            self.right_list.selectionModel().selectionChanged.connect(
+                lambda *_: self._right_selection_timer.start()
+            )
+            self.checkbox.stateChanged.connect(self._checkbox_state_changed)
+            self._text_input_timer = self._debounce(
+                self.TEXT_DEBOUNCE_MS, self._text_input_changed
+            )
+            self.text_input.textChanged.connect(
+                lambda _: self._text_input_timer.start()
+            )
+            self.unselect_left_button.clicked.connect(
+                self._unselect_left_button_clicked
+            )
+            self.unselect_right_button.clicked.connect(
+                self._unselect_right_button_clicked
+            )
+            self.clear_button.clicked.connect(self._clear_button_clicked)
+            self.transfer_up_button.clicked.connect(
+                self._transfer_up_button_clicked
+            )
+            self.delete_button.clicked.connect(self._delete_button_clicked)
+            self.refresh_left_button.clicked.connect(
+                self._refresh_left_list
+            )
+            self.refresh_right_button.clicked.connect(
+                self._refresh_right_list
+            )
+            self.use_this_button.clicked.connect(
+                self._use_this_button_clicked
+            )
+            self._checkbox_state_changed()
+            QTimer.singleShot(0, self._load_photo_lists)
         except Exception as e:
             sk_log.error(f"PhotoAgersEditor initial_ui_setup error: {e}")
             raise e
 
+    def _load_photo_lists(self) -> None:
+        """Build the ager photo cache and fill both lists from it.
+
+        Raises:
+            Exception: If there is an error loading the photo lists.
+        """
+        try:
+            try:
+                self._agers_engine.ager_photo_cache_init(skip_check=True)
+            except Exception as cache_error:
+                sk_log.warning(f"Cache initialization error: {cache_error}")
+            game_agers, local_workers, from_dir_only = (
+                self._agers_engine.get_or_rebuild_lists()
+            )
+            if from_dir_only:
+                sk_log.warning("Ager photo cache unavailable, no agers listed")
+            self._populate_left_list(game_agers)
+            self._populate_right_list(local_workers)
+        except Exception as e:
+            sk_log.error(f"PhotoAgersEditor _load_photo_lists error: {e}")
+            raise e
+
     def _populate_left_list(self, ager_list: List[dict]) -> None:
         """Populate the left list with the game agers.
 
@@ -136,235 +183,182 @@ class PhotoAgersEditor(WorkerPhotoBase):
             Exception: If there is an error populating the left list.
         """
         try:
+            self._ager_filename_map = {
+                ager["game_ager_recordname"]: ager.get("game_ager_filename")
+                for ager in ager_list
+            }
             if not ager_list:
                 self.left_list.addItem("No game agers available")
                 return
-            for ager in ager_list:
-                self.left_list.addItem(ager["game_ager_recordname"])
-            self.left_list.sortItems()
+            self._add_list_items(
+                self.left_list,
+                sorted(ager["game_ager_recordname"] for ager in ager_list),
+            )
         except Exception as e:
             sk_log.error(f"PhotoAgersEditor _populate_left_list error: {e}")
             raise e
 
-    def _populate_right_list(self, worker_list: List[dict]) -> None:
+    def _populate_right_list(
+        self, worker_list: Union[List[str], List[dict]]
+    ) -> None:
         """Populate the right list with the local workers.
 
         Args:
-            worker_list (List[dict]): The list of local workers.
+            worker_list (Union[List[str], List[dict]]): The local photo
+                filenames, or the cached local worker records.
 
         Raises:
             Exception: If there is an error populating the right list.
         """
         try:
             if not worker_list:
-                self.right_list.addItem("No local photos available")
+                self.right_model.reset(["No local photos available"])
                 return
-
-            for worker in worker_list:
-                if "local_contract_photo_file" in worker:
-                    file_path = worker["local_contract_photo_file"]
-                elif "local_worker_photo_file" in worker:
-                    file_path = worker["local_worker_photo_file"]
-                elif isinstance(worker, str):
-                    file_path = worker
-                else:
-                    sk_log.warning(f"Unexpected worker format: {worker}")
-                    file_path = str(worker)
-
-                self.right_list.addItem(file_path)
-            self.right_list.sortItems()
+            if isinstance(worker_list[0], str):
+                self.right_model.reset(sorted(worker_list))
+                return
+            # Every record in a list comes from the same source, so the
+            # filename key is worked out once from the first one.
+            first = worker_list[0]
+            key = next((k for k in _LOCAL_PHOTO_KEYS if k in first), None)
+            if key is None:
+                sk_log.warning(f"Unexpected worker format: {first}")
+                file_paths = [str(worker) for worker in worker_list]
+            else:
+                file_paths = [worker[key] for worker in worker_list]
+            file_paths.sort()
+            self.right_model.reset(file_paths)
         except Exception as e:
             sk_log.error(f"PhotoAgersEditor _populate_right_list error: {e}")
             raise e
 
     def _left_list_item_toggled(self) -> None:
-        """Handle the case when the left list item is toggled.
-
-        Raises:
-            Exception: If there is an error handling the case
-            when the left list item is toggled.
-        """
-        try:
-            selected_item = self.left_list.currentItem()
-            if selected_item:
-                ager_name = selected_item.text()
-                filename, fileonly = self._fetch_photo_from_cache_by_ager_name(
-                    ager_name
-                )
-                if filename:
-                    pixmap = QPixmap(filename)
-                    scaled_pixmap = pixmap.scaled(
-                        300,
-                        300,
-                        aspectRatioMode=Qt.AspectRatioMode.KeepAspectRatio,
-                        transformMode=Qt.TransformationMode.SmoothTransformation,
-                    )
-                    self.left_photo.setPixmap(scaled_pixmap)
-                    self.left_photo.setFixedSize(300, 300)
-                    self.left_name_label.setText(ager_name)
-                    self.left_filename.setText(fileonly)
-                    self.unselect_left_button.setEnabled(True)
-                else:
-                    self._left_side_reset()
+        """Handle the case when the left list item is toggled."""
+        selected_item = self.left_list.currentItem()
+        if selected_item:
+            ager_name = selected_item.text()
+            filename, fileonly = self._fetch_photo_from_cache_by_ager_name(
+                ager_name
+            )
+            if filename:
+                self._pending_left = filename
+                self._load_preview(filename, self._apply_left_preview)
+                self._prefetch_left_neighbours()
+                self.left_name_label.setText(ager_name)
+                self.left_filename.setText(fileonly)
+                self.unselect_left_button.setEnabled(True)
             else:
                 self._left_side_reset()
-        except Exception as e:
-            sk_log.error(f"PhotoAgersEditor _left_list_item_toggled error: {e}")
-            raise e
+        else:
+            self._left_side_reset()
 
-    def _left_side_reset(self) -> None:
-        """Reset the left side of the UI.
+    def _prefetch_left_neighbours(self) -> None:
+        """Load the previews of the agers either side of the selection.
 
-        Raises:
-            Exception: If there is an error resetting the left side of the UI.
+        Stepping up or down the list then finds them already cached.
         """
-        try:
-            self.left_photo.setText("")
-            self.left_name_label.setText("")
-            self.left_filename.setText("")
-            self.unselect_left_button.setEnabled(False)
-            self.unselect_left_button.setText("Unselect Ager")
-        except Exception as e:
-            sk_log.error(f"PhotoAgersEditor _left_side_reset error: {e}")
-            raise e
+        row = self.left_list.currentRow()
+        distance = self.PREFETCH_DISTANCE
+        for offset in range(-distance, distance + 1):
+            item = self.left_list.item(row + offset) if offset else None
+            if item is None:
+                continue
+            fl = self._ager_filename_map.get(item.text())
+            if fl:
+                self._load_preview(os.path.join(self._root_path, fl))
+
+    def _apply_left_preview(self, pixmap: QPixmap, path: str) -> None:
+        """Show a loaded preview if its ager is still selected."""
+        if path == self._pending_left:
+            self.left_photo.setPixmap(pixmap)
+
+    def _apply_right_preview(self, pixmap: QPixmap, path: str) -> None:
+        """Show a loaded preview if its photo is still selected."""
+        if path == self._pending_right:
+            self.right_photo.setPixmap(pixmap)
 
-    def _right_side_reset(self) -> None:
-        """Reset the right side of the UI.
+    def _left_side_reset(self) -> None:
+        """Reset the left side of the UI."""
+        self._pending_left = None
+        self.left_photo.setText("")
+        self.left_name_label.setText("")
+        self.left_filename.setText("")
+        self.unselect_left_button.setEnabled(False)
+        self.unselect_left_button.setText("Unselect Ager")
 
-        Raises:
-            Exception: If there is an error resetting the right side of the UI.
-        """
-        try:
-            self.right_photo.setText("")
-            self.right_filename.setText("")
-            self.unselect_right_button.setEnabled(False)
-            self.use_this_button.setEnabled(False)
-            self.delete_button.setEnabled(False)
-            self.unselect_right_button.setText("Unselect Photo")
-        except Exception as e:
-            sk_log.error(f"PhotoAgersEditor _right_side_reset error: {e}")
-            raise e
+    def _right_side_reset(self) -> None:
+        """Reset the right side of the UI."""
+        self._pending_right = None
+        self.right_photo.setText("")
+        self.right_filename.setText("")
+        self.right_metadata.setText("")
+        self.unselect_right_button.setEnabled(False)
+        self.use_this_button.setEnabled(False)
+        self.delete_button.setEnabled(False)
+        self.unselect_right_button.setText("Unselect Photo")
 
     def _right_list_item_toggled(self) -> None:
-        """Handle the case when the right list item is toggled.
-
-        Raises:
-            Exception: If there is an error handling the case
-            when the right list item is toggled.
-        """
-        try:
-            number_of_items_selected = self.right_list.selectedItems()
-            if len(number_of_items_selected) == 1:
-                self._one_item_right_list_item_selected()
-            elif len(number_of_items_selected) > 1:
-                self._multiple_right_list_items_selected(
-                    number_of_items_selected
-                )
-            else:
-                self._right_side_reset()
-        except Exception as e:
-            sk_log.error(
-                f"PhotoAgersEditor right_list_item_selected error: {e}"
-            )
-            raise e
+        """Handle the case when the right list item is toggled."""
+        number_of_items_selected = (
+            self.right_list.selectionModel().selectedRows()
+        )
+        if len(number_of_items_selected) == 1:
+            self._one_item_right_list_item_selected()
+        elif len(number_of_items_selected) > 1:
+            self._multiple_right_list_items_selected(number_of_items_selected)
+        else:
+            self._right_side_reset()
 
     def _one_item_right_list_item_selected(self) -> None:
-        """Handle the case when one item is selected in the right list.
-
-        Raises:
-            Exception: If there is an error handling the case when
-            one item is selected in the right list.
-        """
-        try:
-            selected_item = self.right_list.currentItem()
-            if selected_item:
-                filename, fileonly = self._fetch_photo_from_cache_by_filename(
-                    selected_item.text()
-                )
-                pixmap = QPixmap(filename)
-                scaled_pixmap = pixmap.scaled(
-                    300,
-                    300,
-                    aspectRatioMode=Qt.AspectRatioMode.KeepAspectRatio,
-                    transformMode=Qt.TransformationMode.SmoothTransformation,
-                )
-                self.right_photo.setPixmap(scaled_pixmap)
-                self.right_photo.setFixedSize(300, 300)
-                self.right_filename.setText(fileonly)
-                self.unselect_right_button.setEnabled(True)
-                self.unselect_right_button.setText(f"Unselect {fileonly}")
-                self.use_this_button.setEnabled(True)
-                self.delete_button.setEnabled(True)
-        except Exception as e:
-            sk_log.error(
-                f"PhotoAgersEditor _one_item_right_list_item_selected error: {e}"
+        """Handle the case when one item is selected in the right list."""
+        current_index = self.right_list.currentIndex()
+        if current_index.isValid():
+            filename, fileonly = self._fetch_photo_from_cache_by_filename(
+                current_index.data()
             )
-            raise e
+            self._pending_right = filename
+            self._load_preview(filename, self._apply_right_preview)
+            self.right_filename.setText(fileonly)
+            self.unselect_right_button.setEnabled(True)
+            self.unselect_right_button.setText(f"Unselect {fileonly}")
+            self.use_this_button.setEnabled(True)
+            self.delete_button.setEnabled(True)
 
     def _multiple_right_list_items_selected(
         self, number_of_items_selected: int
     ) -> None:
-        """Handle the case when multiple items are selected in the right list.
-
-        Raises:
-            Exception: If there is an error handling the case when
-            multiple items are selected in the right list.
-        """
-        try:
-            self.unselect_right_button.setText("Unselect All")
-            self.right_photo.setText(
-                f"Multiple Selected [{len(number_of_items_selected)}]"
-            )
-            self.right_filename.setText(
-                self._format_right_list_items_selected()
-            )
-            self.right_metadata.setText(
-                f"[{len(number_of_items_selected)} items selected]"
-            )
-            self.use_this_button.setEnabled(False)
-            self.delete_button.setEnabled(True)
-        except Exception as e:
-            sk_log.error(
-                f"PhotoAgersEditor _multiple_right_list_items_selected error: {e}"
-            )
-            raise e
+        """Handle the case when several right list items are selected."""
+        self._pending_right = None
+        self.unselect_right_button.setText("Unselect All")
+        self.right_photo.setText(
+            f"Multiple Selected [{len(number_of_items_selected)}]"
+        )
+        self.right_filename.setText(self._format_right_list_items_selected())
+        self.right_metadata.setText(
+            f"[{len(number_of_items_selected)} items selected]"
+        )
+        self.use_this_button.setEnabled(False)
+        self.delete_button.setEnabled(True)
 
     def _fetch_photo_from_cache_by_ager_name(
         self, ager_name: str
     ) -> Tuple[str, str]:
         """Fetch the photo from the cache by the ager name.
 
+        The filename comes from the map built when the left list was
+        filled, so no database or disk access happens per click.
+
         Args:
             ager_name (str): The name of the ager.
 
         Returns:
             Tuple[str, str]: The filename and the fileonly.
         """
-        try:
-            sk_log.debug(f"Fetching photo for ager name: {ager_name}")
-            with PhotoAgersEngine() as photo_agers_engine:
-                root_path = photo_agers_engine.worker_photo_path
-                sk_log.debug(f"Worker photo path: {root_path}")
-                fl = photo_agers_engine.fetch_ager_photo_filename_from_cache(
-                    ager_name
-                )
-                sk_log.debug(f"Retrieved filename: {fl}")
-                if fl:
-                    full_path = os.path.join(root_path, fl)
-                    sk_log.debug(f"Full image path: {full_path}")
-                    if os.path.exists(full_path):
-                        sk_log.debug(f"File exists at: {full_path}")
-                    else:
-                        sk_log.warning(f"File doesn't exist at: {full_path}")
-                    return full_path, fl
-                else:
-                    sk_log.debug(f"No filename found for ager: {ager_name}")
-                return None, None
-        except Exception as e:
-            sk_log.error(
-                f"PhotoAgersEditor _fetch_photo_from_cache_by_ager_name error: {e}"
-            )
-            raise e
+        fl = self._ager_filename_map.get(ager_name)
+        if not fl:
+            sk_log.debug("No filename found for ager: %s", ager_name)
+            return None, None
+        return os.path.join(self._root_path, fl), fl
 
     def _fetch_photo_from_cache_by_filename(
         self, filename: str
@@ -377,66 +371,31 @@ class PhotoAgersEditor(WorkerPhotoBase):
         Returns:
             Tuple[str, str]: The filename and the fileonly.
         """
-        try:
-            with PhotoAgersEngine() as photo_agers_engine:
-                root_path = photo_agers_engine.worker_photo_path
-                return os.path.join(root_path, filename), filename
-        except Exception as e:
-            sk_log.error(
-                f"PhotoAgersEditor _fetch_photo_from_cache_by_filename error: {e}"
-            )
-            raise e
+        return os.path.join(self._root_path, filename), filename
 
     def _checkbox_state_changed(self) -> None:
-        """Handle the case when the checkbox state is changed.
-
-        Raises:
-            Exception: If there is an error handling the case when the
-            checkbox state is changed.
-        """
-        try:
-            is_checked = self.checkbox.isChecked()
-            self.text_input.setEnabled(is_checked)
-            if not is_checked:
-                self.text_input.setText("")
-                self.clear_button.setEnabled(False)
-                self.transfer_up_button.setEnabled(False)
-        except Exception as e:
-            sk_log.error(f"PhotoAgersEditor _checkbox_state_changed error: {e}")
-            raise e
+        """Handle the case when the checkbox state is changed."""
+        is_checked = self.checkbox.isChecked()
+        self.text_input.setEnabled(is_checked)
+        if not is_checked:
+            self.text_input.setText("")
+            self.clear_button.setEnabled(False)
+            self.transfer_up_button.setEnabled(False)
 
     def _text_input_changed(self) -> None:
-        """Handle the case when the text input is changed.
-
-        Raises:
-            Exception: If there is an error handling the case when the
-            text input is changed.
-        """
-        try:
-            if self.text_input.text():
-                self.clear_button.setEnabled(True)
-                self.transfer_up_button.setEnabled(True)
-            else:
-                self.clear_button.setEnabled(False)
-                self.transfer_up_button.setEnabled(False)
-        except Exception as e:
-            sk_log.error(f"PhotoAgersEditor _text_input_changed error: {e}")
-            raise e
-
-    def _clear_button_clicked(self) -> None:
-        """Handle the case when the clear button is clicked.
-
-        Raises:
-            Exception: If there is an error handling the case when the
-            clear button is clicked.
-        """
-        try:
-            self.text_input.setText("")
+        """Handle the case when the text input is changed."""
+        if self.text_input.text():
+            self.clear_button.setEnabled(True)
+            self.transfer_up_button.setEnabled(True)
+        else:
             self.clear_button.setEnabled(False)
             self.transfer_up_button.setEnabled(False)
-        except Exception as e:
-            sk_log.error(f"PhotoAgersEditor _clear_button_clicked error: {e}")
-            raise e
+
+    def _clear_button_clicked(self) -> None:
+        """Handle the case when the clear button is clicked."""
+        self.text_input.setText("")
+        self.clear_button.setEnabled(False)
+        self.transfer_up_button.setEnabled(False)
 
     def _transfer_up_button_clicked(self) -> None:
         """Handle the case when the transfer up button is clicked.
@@ -446,16 +405,18 @@ class PhotoAgersEditor(WorkerPhotoBase):
             transfer up button is clicked.
         """
         try:
-            with PhotoAgersEngine() as photo_agers_engine:
-                filename_to_use = self.text_input.text()
-                if filename_to_use == "" or filename_to_use is None:
-                    self._clear_button_clicked()
-                    return
-                append_gif = self.checkbox.isChecked()
-                photo_agers_engine.update_ager_photo_filename(
-                    self.left_name_label.text(), filename_to_use, append_gif
+            filename_to_use = self.text_input.text()
+            if filename_to_use == "" or filename_to_use is None:
+                self._clear_button_clicked()
+                return
+            append_gif = self.checkbox.isChecked()
+            ager_name = self.left_name_label.text()
+            self._ager_filename_map[ager_name] = (
+                self._agers_engine.update_ager_photo_filename(
+                    ager_name, filename_to_use, append_gif
                 )
-                self._left_list_item_toggled()
+            )
+            self._left_list_item_toggled()
         except Exception as e:
             sk_log.error(
                 f"PhotoAgersEditor _transfer_up_button_clicked error: {e}"
@@ -463,42 +424,18 @@ class PhotoAgersEditor(WorkerPhotoBase):
             raise e
 
     def _unselect_left_button_clicked(self) -> None:
-        """Handle the case when the unselect left button is clicked.
-
-        Raises:
-            Exception: If there is an error handling the case when the
-            unselect left button is clicked.
-        """
-        try:
-            self.left_list.clearSelection()
-            self._left_side_reset()
-            if self.checkbox.isChecked():
-                self.checkbox.setChecked(False)
-            self.left_photo.clear()
-            self.left_photo.setText("")
-        except Exception as e:
-            sk_log.error(
-                f"PhotoAgersEditor _unselect_left_button_clicked error: {e}"
-            )
-            raise e
+        """Handle the case when the unselect left button is clicked."""
+        self.left_list.clearSelection()
+        self._left_side_reset()
+        if self.checkbox.isChecked():
+            self.checkbox.setChecked(False)
+        self.left_photo.clear()
+        self.left_photo.setText("")
 
     def _unselect_right_button_clicked(self) -> None:
-        """Handle the case when the unselect right button is clicked.
-
-        Raises:
-            Exception: If there is an error handling the case when the
-            unselect right button is clicked.
-        """
-        try:
-            self.right_list.clearSelection()
-            self._right_side_reset()
-            self.right_photo.clear()
-            self.right_photo.setText("")
-        except Exception as e:
-            sk_log.error(
-                f"PhotoAgersEditor _unselect_right_button_clicked error: {e}"
-            )
-            raise e
+        """Handle the case when the unselect right button is clicked."""
+        self.right_list.clearSelection()
+        self._right_side_reset()
 
     def _text_length_check(self, text: str) -> str:
         """Format the text length.
@@ -508,30 +445,39 @@ class PhotoAgersEditor(WorkerPhotoBase):
         Returns:
             str: The formatted text.
         """
-        try:
-            truncate_length = self.MAX_LABEL_TEXT_LENGTH // 2
-            if len(text) > self.MAX_LABEL_TEXT_LENGTH:
-                return f"{text[:truncate_length]}...{text[-truncate_length:]}"
-            return f"{text}"
-        except Exception as e:
-            sk_log.error(f"PhotoAgersEditor _text_length_check error: {e}")
-            raise e
+        if len(text) <= self.MAX_LABEL_TEXT_LENGTH:
+            return text
+        half = self._TRUNC_HALF
+        return f"{text[:half]}...{text[-half:]}"
 
     def _format_right_list_items_selected(self) -> str:
         """Format the right list items selected.
 
+        Only as many filenames as the truncated label can show are read,
+        from each end of the selection, so large selections stay cheap.
+
         Returns:
             str: The formatted right list items selected.
         """
-        try:
-            items_selected = self.right_list.selectedItems()
-            all_items_text = "".join(item.text() for item in items_selected)
-            return self._text_length_check(f"[{all_items_text}]")
-        except Exception as e:
-            sk_log.error(
-                f"PhotoAgersEditor _format_right_list_items_selected error: {e}"
-            )
-            raise e
+        items_selected = self.right_list.selectionModel().selectedRows()
+        limit = self.MAX_LABEL_TEXT_LENGTH
+        head, head_length = [], 1
+        for index in items_selected:
+            head.append(index.data())
+            head_length += len(head[-1])
+            if head_length > limit:
+                break
+        else:
+            return self._text_length_check(f"[{''.join(head)}]")
+        # The label will be truncated, so only its two ends matter.
+        tail, tail_length = [], 1
+        for index in reversed(items_selected):
+            tail.append(index.data())
+            tail_length += len(tail[-1])
+            if tail_length >= self._TRUNC_HALF:
+                break
+        tail.reverse()
+        return self._text_length_check(f"[{''.join(head)}{''.join(tail)}]")
 
     def _delete_button_clicked(self) -> None:
         """Handle the case when the delete button is clicked.
@@ -541,7 +487,7 @@ class PhotoAgersEditor(WorkerPhotoBase):
             Exception: If there is an error handling the delete operation.
         """
         try:
-            selected_items = self.right_list.selectedItems()
+            selected_items = self.right_list.selectionModel().selectedRows()
             if not selected_items:
                 return
             item_count = len(selected_items)
@@ -557,51 +503,57 @@ class PhotoAgersEditor(WorkerPhotoBase):
             )
             if confirm != QMessageBox.StandardButton.Yes:
                 return
-            with PhotoWorkerEngine() as photo_worker_engine:
-                root_path = photo_worker_engine.worker_photo_path
-                deleted_files = []
-                failed_files = []
-                for item in selected_items:
-                    filename = item.text()
-                    full_path = os.path.join(root_path, filename)
-                    try:
-                        if os.path.exists(full_path):
-                            os.remove(full_path)
-                            deleted_files.append(filename)
-                        else:
-                            failed_files.append(f"{filename} (file not found)")
-                    except PermissionError:
-                        failed_files.append(f"{filename} (permission denied)")
-                    except Exception as e:
-                        failed_files.append(f"{filename} ({str(e)})")
-                if failed_files:
-                    error_message = (
-                        "Failed to delete the following files:\n"
-                        + "\n".join(failed_files)
-                    )
-                    QMessageBox.warning(self, "Deletion Error", error_message)
-                    sk_log.error(
-                        f"PhotoAgersEditor delete error: {error_message}"
-                    )
-                if deleted_files:
-                    for filename in deleted_files:
-                        items = self.right_list.findItems(
-                            filename, Qt.MatchFlag.MatchExactly
-                        )
-                        for item in items:
-                            row = self.right_list.row(item)
-                            self.right_list.takeItem(row)
+            filenames = [index.data() for index in selected_items]
+            full_paths = [
+                os.path.join(self._root_path, filename)
+                for filename in filenames
+            ]
+            if len(full_paths) > 1:
+                with ThreadPoolExecutor(
+                    max_workers=min(DELETE_WORKERS, len(full_paths))
+                ) as executor:
+                    errors = list(executor.map(_delete_photo, full_paths))
+            else:
+                errors = [_delete_photo(path) for path in full_paths]
+            deleted_files = []
+            deleted_rows = []
+            failed_files = []
+            for index, filename, error in zip(
+                selected_items, filenames, errors
+            ):
+                if error is None:
+                    deleted_files.append(filename)
+                    deleted_rows.append(index.row())
+                else:
+                    failed_files.append(f"{filename} ({error})")
+            if failed_files:
+                error_message = (
+                    "Failed to delete the following files:\n"
+                    + "\n".join(failed_files)
+                )
+                QMessageBox.warning(self, "Deletion Error", error_message)
+                sk_log.error(
+                    f"PhotoAgersEditor delete error: {error_message}"
+                )
+            if deleted_files:
+                # Apply the list and label changes as a single repaint.
+                self.setUpdatesEnabled(False)
+                try:
+                    self.right_model.remove_rows(deleted_rows)
                     self._right_side_reset()
-                    self.right_metadata.setText("")
-                    self.right_photo.clear()
-                    self.right_photo.setText("")
-                    success_message = (
-                        f"Successfully deleted {len(deleted_files)} file"
-                        f"{'s' if len(deleted_files) > 1 else ''}."
-                    )
-                    QMessageBox.information(
+                finally:
+                    self.setUpdatesEnabled(True)
+                success_message = (
+                    f"Successfully deleted {len(deleted_files)} file"
+                    f"{'s' if len(deleted_files) > 1 else ''}."
+                )
+                # Let the updated list paint before the dialog opens.
+                QTimer.singleShot(
+                    0,
+                    lambda: QMessageBox.information(
                         self, "Deletion Successful", success_message
-                    )
+                    ),
+                )
         except Exception as e:
             sk_log.error(f"PhotoAgersEditor _delete_button_clicked error: {e}")
             QMessageBox.critical(
@@ -619,17 +571,17 @@ class PhotoAgersEditor(WorkerPhotoBase):
         """
         try:
             self._unselect_left_button_clicked()
+            clear_preview_cache()
             self.left_list.clear()
-            with PhotoAgersEngine() as photo_agers_engine:
-                try:
-                    photo_agers_engine.refresh_ager_photo_record_cache()
-                    game_agers, _ = (
-                        photo_agers_engine.fetch_ager_photo_record_lists()
-                    )
-                    self._populate_left_list(game_agers)
-                except Exception as e:
-                    sk_log.warning(f"Could not refresh game agers: {e}")
-                    self._populate_left_list([])
+            try:
+                self._agers_engine.refresh_ager_photo_record_cache()
+                game_agers, _ = (
+                    self._agers_engine.fetch_ager_photo_record_lists()
+                )
+                self._populate_left_list(game_agers)
+            except Exception as e:
+                sk_log.warning(f"Could not refresh game agers: {e}")
+                self._populate_left_list([])
             QMessageBox.information(
                 self,
                 "Refresh Complete",
@@ -652,25 +604,13 @@ class PhotoAgersEditor(WorkerPhotoBase):
         """
         try:
             self._unselect_right_button_clicked()
-            self.right_list.clear()
-            with PhotoAgersEngine() as photo_agers_engine:
-                try:
-                    photo_agers_engine.refresh_ager_photo_record_cache()
-                    _, local_workers = (
-                        photo_agers_engine.fetch_ager_photo_record_lists()
-                    )
-                    self._populate_right_list(local_workers)
-                except Exception as e:
-                    sk_log.warning(f"Could not refresh full cache: {e}")
-                    with PhotoWorkerEngine() as photo_worker_engine:
-                        local_files = (
-                            photo_worker_engine.fetch_worker_photos_from_dir()
-                        )
-                        local_workers = [
-                            {"local_contract_photo_file": f}
-                            for f in local_files
-                        ]
-                        self._populate_right_list(local_workers)
+            clear_preview_cache()
+            local_files = self._worker_engine.fetch_worker_photos_from_dir()
+            self._populate_right_list(local_files)
+            # Bring the cache in line once the new list has been painted.
+            QTimer.singleShot(
+                0, lambda: self._revalidate_local_photo_cache(local_files)
+            )
             QMessageBox.information(
                 self,
                 "Refresh Complete",
@@ -685,6 +625,19 @@ class PhotoAgersEditor(WorkerPhotoBase):
             )
             raise e
 
+    def _revalidate_local_photo_cache(self, local_files: List[str]) -> None:
+        """Rebuild the worker photo cache if it no longer matches the folder.
+
+        Args:
+            local_files (List[str]): The filenames found in the folder.
+        """
+        try:
+            cached_files = self._worker_engine.fetch_local_worker_photo_files()
+            if cached_files != set(local_files):
+                self._worker_engine.refresh_worker_photo_cache()
+        except Exception as e:
+            sk_log.warning(f"Could not refresh local photo cache: {e}")
+
     def _use_this_button_clicked(self) -> None:
         """Handle the case when the use this button is clicked.
 
@@ -696,13 +649,14 @@ class PhotoAgersEditor(WorkerPhotoBase):
             selected_item = self.left_list.currentItem()
             if selected_item:
                 ager_name = selected_item.text()
-            selected_item = self.right_list.currentItem()
-            if selected_item:
-                filepath = selected_item.text()
-            with PhotoAgersEngine() as photo_agers_engine:
-                photo_agers_engine.update_ager_photo_filename(
+            current_index = self.right_list.currentIndex()
+            if current_index.isValid():
+                filepath = current_index.data()
+            self._ager_filename_map[ager_name] = (
+                self._agers_engine.update_ager_photo_filename(
                     ager_name, filepath
                 )
+            )
             self._left_list_item_toggled()
         except Exception as e:
             sk_log.error(
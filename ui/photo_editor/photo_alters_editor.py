@@ -139,9 +139,10 @@ class PhotoAltersEditor(WorkerPhotoBase):
             if not alter_list:
                 self.left_list.addItem("No game alters available")
                 return
-            for alter in alter_list:
-                self.left_list.addItem(alter["game_alter_name"])
-            self.left_list.sortItems()
+            self._add_list_items(
+                self.left_list,
+                sorted(alter["game_alter_name"] for alter in alter_list),
+            )
         except Exception as e:
             sk_log.error(f"PhotoAltersEditor populate_left_list error: {e}")
             raise e
@@ -159,9 +160,13 @@ class PhotoAltersEditor(WorkerPhotoBase):
             if not alter_list:
                 self.right_list.addItem("No local photos available")
                 return
-            for filename in alter_list:
-                self.right_list.addItem(filename["local_alter_photo_file"])
-            self.right_list.sortItems()
+            self._add_list_items(
+                self.right_list,
+                sorted(
+                    filename["local_alter_photo_file"]
+                    for filename in alter_list
+                ),
+            )
         except Exception as e:
             sk_log.error(f"PhotoAltersEditor populate_right_list error: {e}")
             raise e
@@ -7,11 +7,7 @@ from PyQt6.QtWidgets import (
     QScrollArea,
 )
 from PyQt6.QtCore import Qt, QSize
-from ui.photo_editor.photo_agers_editor import PhotoAgersEditor
-from ui.photo_editor.photo_contract_editor import PhotoContractEditor
 from utils.sk_logger import sk_log
-from ui.photo_editor.photo_worker_editor import PhotoWorkerEditor
-from ui.photo_editor.photo_alters_editor import PhotoAltersEditor
 
 
 class PhotoEditorMenu(QMainWindow):
@@ -89,6 +85,8 @@ class PhotoEditorMenu(QMainWindow):
 
     def open_worker_editor(self) -> None:
         try:
+            from ui.photo_editor.photo_worker_editor import PhotoWorkerEditor
+
             self.worker_editor = PhotoWorkerEditor(self)
             self.worker_editor.setWindowModality(
                 Qt.WindowModality.ApplicationModal
@@ -100,6 +98,8 @@ class PhotoEditorMenu(QMainWindow):
 
     def open_alters_editor(self) -> None:
         try:
+            from ui.photo_editor.photo_alters_editor import PhotoAltersEditor
+
             self.alters_editor = PhotoAltersEditor(self)
             self.alters_editor.setWindowModality(
                 Qt.WindowModality.ApplicationModal
@@ -111,6 +111,8 @@ class PhotoEditorMenu(QMainWindow):
 
     def open_contract_editor(self) -> None:
         try:
+            from ui.photo_editor.photo_contract_editor import PhotoContractEditor
+
             self.contract_editor = PhotoContractEditor(self)
             self.contract_editor.setWindowModality(
                 Qt.WindowModality.ApplicationModal
@@ -122,6 +124,8 @@ class PhotoEditorMenu(QMainWindow):
 
     def open_agers_editor(self) -> None:
         try:
+            from ui.photo_editor.photo_agers_editor import PhotoAgersEditor
+
             self.agers_editor = PhotoAgersEditor(self)
             self.agers_editor.setWindowModality(
                 Qt.WindowModality.ApplicationModal
@@ -47,7 +47,9 @@ class PhotoContractEditor(WorkerPhotoBase):
                     sk_log.warning(
                         f"Cache fetch error, attempting rebuild: {e}"
                     )
-                    photo_contract_engine.refresh_contract_photo_record_cache()
+                    photo_contract_engine.refresh_contract_photo_record_cache(
+                        force=True
+                    )
 
                     try:
                         game_contracts, local_workers = (
@@ -141,9 +143,12 @@ class PhotoContractEditor(WorkerPhotoBase):
             if not contract_list:
                 self.left_list.addItem("No game contracts available")
                 return
-            for contract in contract_list:
-                self.left_list.addItem(contract["game_contract_name"])
-            self.left_list.sortItems()
+            self._add_list_items(
+                self.left_list,
+                sorted(
+                    contract["game_contract_name"] for contract in contract_list
+                ),
+            )
         except Exception as e:
             sk_log.error(f"PhotoContractEditor _populate_left_list error: {e}")
             raise e
@@ -161,7 +166,7 @@ class PhotoContractEditor(WorkerPhotoBase):
             if not worker_list:
                 self.right_list.addItem("No local photos available")
                 return
-
+            file_paths = []
             for worker in worker_list:
                 if "local_contract_photo_file" in worker:
                     file_path = worker["local_contract_photo_file"]
@@ -172,9 +177,9 @@ class PhotoContractEditor(WorkerPhotoBase):
                 else:
                     sk_log.warning(f"Unexpected worker format: {worker}")
                     file_path = str(worker)
-
-                self.right_list.addItem(file_path)
-            self.right_list.sortItems()
+                file_paths.append(file_path)
+            file_paths.sort()
+            self._add_list_items(self.right_list, file_paths)
         except Exception as e:
             sk_log.error(f"PhotoContractEditor _populate_right_list error: {e}")
             raise e
@@ -635,7 +640,9 @@ class PhotoContractEditor(WorkerPhotoBase):
             self.left_list.clear()
             with PhotoContractEngine() as photo_contract_engine:
                 try:
-                    photo_contract_engine.refresh_contract_photo_record_cache()
+                    photo_contract_engine.refresh_contract_photo_record_cache(
+                        force=True
+                    )
                     game_contracts, _ = (
                         photo_contract_engine.fetch_contract_photo_record_lists()
                     )
@@ -668,7 +675,9 @@ class PhotoContractEditor(WorkerPhotoBase):
             self.right_list.clear()
             with PhotoContractEngine() as photo_contract_engine:
                 try:
-                    photo_contract_engine.refresh_contract_photo_record_cache()
+                    photo_contract_engine.refresh_contract_photo_record_cache(
+                        force=True
+                    )
                     _, local_workers = (
                         photo_contract_engine.fetch_contract_photo_record_lists()
                     )
@@ -137,9 +137,10 @@ class PhotoWorkerEditor(WorkerPhotoBase):
             if not worker_list:
                 self.left_list.addItem("No game workers available")
                 return
-            for worker in worker_list:
-                self.left_list.addItem(worker["game_worker_name"])
-            self.left_list.sortItems()
+            self._add_list_items(
+                self.left_list,
+                sorted(worker["game_worker_name"] for worker in worker_list),
+            )
         except Exception as e:
             sk_log.error(f"PhotoWorkerEditor populate_left_list error: {e}")
             raise e
@@ -157,9 +158,13 @@ class PhotoWorkerEditor(WorkerPhotoBase):
             if not worker_list:
                 self.right_list.addItem("No local photos available")
                 return
-            for filename in worker_list:
-                self.right_list.addItem(filename["local_worker_photo_file"])
-            self.right_list.sortItems()
+            self._add_list_items(
+                self.right_list,
+                sorted(
+                    filename["local_worker_photo_file"]
+                    for filename in worker_list
+                ),
+            )
         except Exception as e:
             sk_log.error(f"PhotoWorkerEditor populate_right_list error: {e}")
             raise e
@@ -13,7 +13,7 @@ from PyQt6.QtWidgets import (
     QScrollArea,
 )
 from PyQt6.QtCore import Qt, QSize
-from settings.settings_file import SettingsManager
+from settings.settings_file import get_settings
 from settings.settings_list import SettingWidgetType, DefaultSettings
 from utils.sk_logger import sk_log
 
@@ -31,7 +31,7 @@ class SettingsWindow(QDialog):
                 | Qt.WindowType.WindowStaysOnTopHint
                 | Qt.WindowType.WindowTitleHint
             )
-            self.settings_manager = SettingsManager()
+            self.settings_manager = get_settings()
             self.default_settings = DefaultSettings(
                 self.settings_manager.hostname
             )
@@ -136,6 +136,7 @@ class SettingsWindow(QDialog):
 
     def save_settings(self) -> None:
         try:
+            values = []
             for key, widget in self.widgets.items():
                 setting = self.default_settings.get_setting(key)
                 if setting.widget_type == SettingWidgetType.CHECKBOX:
@@ -152,7 +153,11 @@ class SettingsWindow(QDialog):
                     value = widget.text()
                 else:
                     value = widget.text()
-                self.settings_manager.set_value(key, value)
+                values.append((key, value))
+            self.settings_manager.set_many(values)
+            from database import tewdb_pool
+
+            tewdb_pool.close_all()
         except Exception as e:
             sk_log.error(f"SettingsWindow save_settings error: {e}")
             raise e
@@ -1,4 +1,4 @@
-from settings.settings_file import SettingsManager
+from settings.settings_file import SettingsManager, get_settings
 
 
 class Debugger:
@@ -18,9 +18,7 @@ class Debugger:
         os.environ["DEBUG"] = str(self.debug_mode)
 
     def fetch_settings(self) -> SettingsManager:
-        settings = SettingsManager()
-        settings.initialize_settings()
-        return settings
+        return get_settings()
 
     def debug_mode_check(self) -> None:
         if self.debug_mode:
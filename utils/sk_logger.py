@@ -26,7 +26,7 @@ class SKLogger:
         self.logger = logging.getLogger(name)
         self.logger.handlers.clear()
         self.logger.propagate = False
-        self.logger.setLevel(logging.DEBUG)
+        self.logger.setLevel(logging.DEBUG if DEBUG_ENABLED else logging.INFO)
         self.hostname = hostname
         self.log_dir = log_dir
         if log_cli:
@@ -59,8 +59,8 @@ class SKLogger:
     ) -> logging.Formatter:
         return CustomFormatter(use_colors, is_cli)
 
-    def debug(self, message: str) -> None:
-        self.logger.debug(message)
+    def debug(self, message: str, *args: object) -> None:
+        self.logger.debug(message, *args)
 
     def info(self, message: str) -> None:
         self.logger.info(message)